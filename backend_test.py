@@ -1,16 +1,279 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import os
 import sys
 import json
 import uuid
+import functools
+import contextlib
+import itertools
+import re
+import csv
+from collections import Counter
+from types import MappingProxyType
+from xml.etree import ElementTree
+import io
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 try:
     from PIL import Image
 except ImportError:
     Image = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that always writes to the current sys.stdout, so redirects capture it"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+# Longer alternatives come first so '/tools/' is not consumed as '/tools'
+_SITEMAP_PATHS = re.compile(r'/tools/|/blogs/|/tools|/blogs|/compare')
+_ROBOTS_DIRECTIVE_LINE = re.compile(r'^(?:User-agent|Allow|Disallow|Sitemap|Crawl-delay):.*$', re.M)
+
+# SEO file expectations, in the order they are reported
+_SITEMAP_URL_CHILDREN = ('loc', 'lastmod', 'changefreq', 'priority')
+_SITEMAP_MAIN_PAGES = ('/tools', '/blogs', '/compare')
+_ROBOTS_REQUIRED_DIRECTIVES = (
+    'User-agent: *',
+    'Allow: /',
+    'Disallow: /admin/',
+    'Disallow: /dashboard/',
+    'Disallow: /superadmin/',
+    'Disallow: /api/',
+    'Allow: /api/blogs/',
+    'Allow: /api/tools/',
+    'Sitemap:',
+    'Crawl-delay:',
+)
+_ROBOTS_PROTECTED_AREAS = ('/admin/', '/dashboard/', '/superadmin/')
+# Directives the production build must serve, plus the sitemap reference in any case
+_ROBOTS_PRODUCTION_DIRECTIVES = ('User-agent: *', 'Disallow: /admin/', 'Disallow: /superadmin/', 'Sitemap:')
+_ROBOTS_PRODUCTION_TOKENS = re.compile(
+    '|'.join(map(re.escape, _ROBOTS_PRODUCTION_DIRECTIVES)) + r'|(?i:sitemap\.xml)'
+)
+# Report glyph indexed by a check's boolean outcome
+_CHECK_GLYPH = ('❌', '✅')
+# Tool JSON-LD keys that matter for SEO, in report order
+_TOOL_JSON_LD_SEO_FIELDS = ('@context', '@type', 'name', 'description', 'url', 'applicationCategory')
+# Page-level SEO fields on tool and blog responses, in report order
+_SEO_META_FIELDS = ('seo_title', 'seo_description', 'seo_keywords')
+_SEO_FIELDS_WITH_JSON_LD = _SEO_META_FIELDS + ('json_ld',)
+# Tools the production-build check expects to carry complete SEO data
+_POPULAR_TOOL_SLUGS = ('notion', 'figma', 'slack')
+# Per-URL metadata the production-build check expects in the sitemap
+_SITEMAP_URL_METADATA = ('changefreq', 'priority', 'lastmod')
+# Minimum JSON-LD keys a stored tool or blog document must carry
+_TOOL_JSON_LD_REQUIRED = frozenset(('@context', '@type', 'name'))
+_BLOG_JSON_LD_REQUIRED = frozenset(('@context', '@type', 'headline'))
+# Keys every internal-link suggestion and SEO score breakdown must carry
+_LINK_SUGGESTION_KEYS = frozenset(('target_url', 'target_title', 'target_type', 'anchor_text', 'relevance_score'))
+_SEO_SCORE_KEYS = frozenset((
+    'overall_score', 'title_score', 'description_score', 'keywords_score', 'content_score',
+    'internal_links_score', 'recommendations',
+))
+# Lowercase phrases the email-verification checks look for in messages and error details
+_VERIFY_MARKERS = ('verify', 'verification')
+_INVALID_TOKEN_MARKERS = ('invalid', 'expired')
+
+# Shared payload skeletons; tests spread them into a new dict and add what they exercise
+_REVIEW_BASE = MappingProxyType({
+    "rating": 4,
+    "pros": ("Easy to use", "Good features", "Reliable"),
+    "cons": ("Could be faster",),
+})
+_BLOG_JSON_LD_BASE = MappingProxyType({
+    "@context": "https://schema.org",
+    "@type": "BlogPosting",
+    "author": {"@type": "Person", "name": "Test User"},
+})
+
+logger = logging.getLogger(__name__)
+# BTOOLS_QUIET=1 silences logged per-test detail; suite summaries are printed directly and still appear
+logger.setLevel(logging.WARNING if os.getenv('BTOOLS_QUIET') == '1' else logging.INFO)
+logger.propagate = False
+_log_handler = _StdoutHandler()
+_log_handler.setFormatter(logging.Formatter('%(message)s'))
+logger.addHandler(_log_handler)
+
+
+class _ThreadBufferedStdout:
+    """sys.stdout stand-in that diverts writes from threads currently buffering their output"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (self._stream if buffer is None else buffer).write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+_stdout_install_lock = threading.Lock()
+
+
+class FailFastStop(Exception):
+    """Raised in fail-fast mode by the first failed sub-test to stop the run"""
+
+
+def buffered_output(method):
+    """Buffer everything a test method writes and flush it to stdout once when it returns.
+
+    Buffers are per thread, so methods run concurrently each come out as one block.
+    """
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with _stdout_install_lock:
+            if not isinstance(sys.stdout, _ThreadBufferedStdout):
+                sys.stdout = _ThreadBufferedStdout(sys.stdout)
+        stdout = sys.stdout
+        previous = getattr(stdout._local, 'buffer', None)
+        buffer = stdout._local.buffer = io.StringIO()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stdout._local.buffer = previous
+            stdout.write(buffer.getvalue())
+            stdout.flush()
+    return wrapper
+
+
+def thread_map(fn, items, max_workers):
+    """Map fn over items on a thread pool and return the results in order.
+
+    Workers write into the calling thread's output buffer, if it has one, so a
+    buffered test method still prints its concurrent requests in its own block.
+    """
+    stdout = sys.stdout
+    parent_buffer = getattr(stdout._local, 'buffer', None) if isinstance(stdout, _ThreadBufferedStdout) else None
+
+    def run(item):
+        if parent_buffer is None:
+            return fn(item)
+        stdout._local.buffer = parent_buffer
+        try:
+            return fn(item)
+        finally:
+            stdout._local.buffer = None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items) or 1)) as executor:
+        return list(executor.map(run, items))
+
+
+def walk_sitemap(xml_text):
+    """Stream-parse a sitemap, clearing each <url> once seen.
+
+    Returns the root tag name, the number of <url> entries, the child tag names of the first <url>
+    and a Counter of _SITEMAP_PATHS matches found in <loc> text only (not comments or attributes).
+    Raises ElementTree.ParseError if the body is not well-formed XML.
+    """
+    root_tag = None
+    url_count = 0
+    first_url_children = None
+    path_counts = Counter()
+    for _, element in ElementTree.iterparse(io.BytesIO(xml_text.encode('utf-8')), events=('end',)):
+        root_tag = element.tag.rsplit('}', 1)[-1]
+        if root_tag == 'loc' and element.text:
+            path_counts.update(match.group() for match in _SITEMAP_PATHS.finditer(element.text))
+        elif root_tag == 'url':
+            url_count += 1
+            if first_url_children is None:
+                first_url_children = {child.tag.rsplit('}', 1)[-1] for child in element}
+            element.clear()
+    return root_tag, url_count, first_url_children or set(), path_counts
+
+
+def dumps_json(payload):
+    """Serialize a request payload to JSON bytes once so it can be reused across requests"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def csv_bytes(header, rows):
+    """Render a header and rows as UTF-8 CSV, letting csv.writer handle the quoting.
+
+    Fields are quoted only when they need it and every row, the last included, ends in '\\n'.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue().encode('utf-8')
+
+
+def loads_json(raw):
+    """Parse a JSON response body straight from bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def requires_role(*roles):
+    """Skip a test method before any setup unless the current user has one of the given roles"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.current_user_role not in roles:
+                print(f"❌ Skipping {method.__name__} - requires {' or '.join(roles)} role")
+                return False
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 class MarketMindAPITester:
-    def __init__(self, base_url="https://seo-audit-crawl.preview.emergentagent.com/api"):
+    # Names created during a run get the run's start time plus a counter, which keeps them
+    # unique across runs without formatting the clock for every payload
+    _run_stamp = datetime.now().strftime('%H%M%S')
+    _suffix_counter = itertools.count()
+
+    @classmethod
+    def _unique_suffix(cls):
+        """Return a suffix that is unique within this run and across runs"""
+        return f"{cls._run_stamp}{next(cls._suffix_counter)}"
+
+    @classmethod
+    def _seo_payload(cls):
+        """Build an admin SEO page payload with a fresh unique page path"""
+        suffix = cls._unique_suffix()
+        return {
+            "page_path": f"/test-page-{suffix}",
+            "title": f"Test SEO Page {suffix}",
+            "description": "Test SEO page created by automated testing",
+            "keywords": "test, seo, automation",
+            "meta_tags": {"robots": "index,follow"}
+        }
+
+    def __init__(self, base_url="https://seo-audit-crawl.preview.emergentagent.com/api", fail_fast=False,
+                 load_profile=False):
         self.base_url = base_url
+        self._url_prefix = f"{base_url}/"
+        # Only main() catches FailFastStop, so only it turns this on (--fail-fast or BTOOLS_FAIL_FAST=1)
+        self.fail_fast = fail_fast
+        # Off by default: the throughput ramp puts sustained concurrent load on the server
+        self.load_profile = load_profile
         self.token = None
         self.user_id = None
         self.current_user_role = None
@@ -24,72 +287,294 @@ class MarketMindAPITester:
             'blogs': [],
             'reviews': []
         }
+        self._lock = threading.Lock()
+        # sitemap.xml / robots.txt responses keyed by path: (success, body, fetch seconds, fetched at)
+        self._seo_cache = {}
+        # First page of tools shared by tests that only need some existing tool IDs
+        self._sample_tools = None
+        # Successful logins keyed by (email, password): (token, user id, role); tokens last 30 days
+        self._logins = {}
+        
+        # One keep-alive session for every request so connections (and TLS) are reused
+        self.session = requests.Session()
+        # Retry reads briefly when the preview proxy answers with a transient gateway error;
+        # the last response is still returned so the test reports its real status
+        retries = Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset({'GET', 'HEAD'}), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'User-Agent': 'MarketMindAPITester',
+        })
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, description=None):
-        """Run a single API test"""
-        url = f"{self.base_url}/{endpoint}" if not endpoint.startswith('http') else endpoint
-        test_headers = {'Content-Type': 'application/json'}
-        
-        if headers:
-            test_headers.update(headers)
-        
-        if self.token:
-            test_headers['Authorization'] = f'Bearer {self.token}'
+    @property
+    def token(self):
+        return self._token
+
+    @token.setter
+    def token(self, value):
+        # Build the auth header once per token change instead of on every request
+        self._token = value
+        self._auth_headers = MappingProxyType({'Authorization': f'Bearer {value}'} if value else {})
+
+    @contextlib.contextmanager
+    def without_auth(self):
+        """Send requests unauthenticated inside the block and restore the token afterwards"""
+        token = self.token
+        self.token = None
+        try:
+            yield
+        finally:
+            self.token = token
+
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self.session.close()
+
+    def warm_up(self):
+        """Resolve DNS and open a pooled connection up front so timed tests don't pay for the handshake"""
+        try:
+            self.session.head(f"{self.base_url}/health", timeout=5)
+        except requests.RequestException as e:
+            logger.info(f"⚠️ Connection warm-up failed: {e}")
+
+    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, description=None,
+                 first_item=False):
+        """Run a single API test
 
-        self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
+        With first_item=True a passing JSON list response is stream-parsed only up to its
+        first element (when ijson is available) and returned as a one-item list; the rest of
+        the body is read and discarded so the connection can be reused.
+        """
+        url = self._url_prefix + endpoint if not endpoint.startswith('http') else endpoint
+        # The prebuilt auth header is shared read-only; copy only when this call adds its own
+        test_headers = {**headers, **self._auth_headers} if headers else self._auth_headers
+
+        with self._lock:
+            self.tests_run += 1
+        # Collect the report and print it in one go so parallel runs don't interleave
+        output = [f"\n🔍 Testing {name}..."]
         if description:
-            print(f"   Description: {description}")
-        print(f"   URL: {url}")
+            output.append(f"   Description: {description}")
+        output.append(f"   URL: {url}")
+        
+        # Published content feeds the sitemap, so drop cached SEO files when it changes
+        if method != 'GET' and ('blogs' in endpoint or 'tools' in endpoint):
+            self._seo_cache.clear()
+        # Tool writes and JSON-LD generation can change the shared tools page
+        if method != 'GET' and ('tools' in endpoint or 'json-ld' in endpoint):
+            self._sample_tools = None
+        
+        # The session sends JSON content type by default; payloads serialized up front pass through
+        body = data if data is None or isinstance(data, bytes) else dumps_json(data)
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=30)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers, timeout=30)
-
+            stream = first_item and ijson is not None
+            response = self.session.request(method, url, data=body, headers=test_headers, timeout=30, stream=stream)
+            
+            is_json = response.headers.get('content-type', '').startswith('application/json')
             success = response.status_code == expected_status
+            if stream and is_json and success:
+                response.raw.decode_content = True
+                first = next(ijson.items(response.raw, 'item', use_float=True), None)
+                # Drain the unparsed rest so the keep-alive connection goes back to the pool
+                for _ in response.iter_content(chunk_size=65536):
+                    pass
+                response_body = [first] if first is not None else []
+            else:
+                response_body = response.text
+                if is_json:
+                    try:
+                        response_body = loads_json(response.content)
+                    except ValueError:
+                        # Labelled JSON but not parseable; keep the raw text for diagnosis
+                        output.append(f"   ⚠️ Invalid JSON body: {response.text[:300]}")
+                        is_json = False
+                if first_item and success and isinstance(response_body, list):
+                    response_body = response_body[:1]
+
             if success:
-                self.tests_passed += 1
-                print(f"✅ Passed - Status: {response.status_code}")
-                try:
-                    response_data = response.json()
+                with self._lock:
+                    self.tests_passed += 1
+                output.append(f"✅ Passed - Status: {response.status_code}")
+                if is_json:
+                    response_data = response_body
                     if isinstance(response_data, dict):
                         if len(str(response_data)) <= 300:
-                            print(f"   Response: {response_data}")
+                            output.append(f"   Response: {response_data}")
                         else:
-                            print(f"   Response: Large object with {len(response_data)} keys")
+                            output.append(f"   Response: Large object with {len(response_data)} keys")
                     elif isinstance(response_data, list):
-                        print(f"   Response: {len(response_data)} items")
+                        output.append(f"   Response: {len(response_data)} items" + (" (first only)" if first_item else ""))
                         if len(response_data) <= 3 and response_data:
-                            print(f"   Sample: {response_data[0] if response_data else 'Empty'}")
-                except:
-                    print(f"   Response: {response.text[:100]}...")
+                            output.append(f"   Sample: {response_data[0] if response_data else 'Empty'}")
+                else:
+                    output.append(f"   Response: {response.text[:100]}...")
             else:
-                print(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
-                print(f"   Response: {response.text[:300]}...")
+                output.append(f"❌ Failed - Expected {expected_status}, got {response.status_code}")
+                output.append(f"   Response: {response.text[:300]}...")
+                with self._lock:
+                    self.failed_tests.append({
+                        'name': name,
+                        'expected': expected_status,
+                        'actual': response.status_code,
+                        'response': response.text[:300],
+                        'endpoint': endpoint
+                    })
+
+            logger.info("\n".join(output))
+            return success, response_body
+
+        except Exception as e:
+            output.append(f"❌ Failed - Error: {str(e)}")
+            logger.info("\n".join(output))
+            with self._lock:
                 self.failed_tests.append({
                     'name': name,
-                    'expected': expected_status,
-                    'actual': response.status_code,
-                    'response': response.text[:300],
+                    'error': str(e),
                     'endpoint': endpoint
                 })
+            return False, {}
 
-            return success, response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text
+    def time_to_first_byte(self, name, endpoint, description=None):
+        """GET an endpoint and time it up to the first body byte, without downloading the rest.
 
-        except Exception as e:
-            print(f"❌ Failed - Error: {str(e)}")
-            self.failed_tests.append({
-                'name': name,
-                'error': str(e),
-                'endpoint': endpoint
-            })
-            return False, {}
+        Returns (success, seconds). The body is discarded, so use run_test when it is needed.
+        """
+        url = self._url_prefix + endpoint
+        headers = self._auth_headers
+        output = [f"\n🔍 Testing {name}..."]
+        if description:
+            output.append(f"   Description: {description}")
+        output.append(f"   URL: {url}")
+        
+        start_time = time.perf_counter()
+        try:
+            with self.session.get(url, headers=headers, timeout=30, stream=True) as response:
+                response.raw.read(1)
+                elapsed = time.perf_counter() - start_time
+                status = response.status_code
+        except requests.RequestException as e:
+            output.append(f"❌ Failed - Error: {str(e)}")
+            logger.info("\n".join(output))
+            return self.record_check(name, False, endpoint, error=str(e)), time.perf_counter() - start_time
+        
+        success = status == 200
+        if success:
+            output.append(f"✅ Passed - Status: {status} (first byte after {elapsed:.3f}s)")
+        else:
+            output.append(f"❌ Failed - Expected 200, got {status}")
+        logger.info("\n".join(output))
+        self.record_check(name, success, endpoint, error=None if success else f"Expected 200, got {status}")
+        return success, elapsed
+
+    def measure_load(self, name, endpoint, concurrency_levels=(1, 4, 16), requests_per_level=16):
+        """GET an endpoint repeatedly at each concurrency level and report throughput and latency.
+
+        Returns a list of (concurrency, requests per second, p50 seconds, p95 seconds, errors).
+        Individual requests are not counted as tests; look for where throughput stops rising.
+        """
+        url = self._url_prefix + endpoint
+        headers = self._auth_headers
+        
+        def timed_get(_):
+            start_time = time.perf_counter()
+            try:
+                ok = self.session.get(url, headers=headers, timeout=30).status_code == 200
+            except requests.RequestException:
+                ok = False
+            return ok, time.perf_counter() - start_time
+        
+        output = [f"\n📈 Load profile: {name}", f"   URL: {url}"]
+        profile = []
+        for concurrency in concurrency_levels:
+            start_time = time.perf_counter()
+            samples = thread_map(timed_get, range(requests_per_level), concurrency)
+            wall_time = time.perf_counter() - start_time
+            latencies = sorted(elapsed for _, elapsed in samples)
+            errors = sum(not ok for ok, _ in samples)
+            p50 = latencies[len(latencies) // 2]
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            profile.append((concurrency, requests_per_level / wall_time, p50, p95, errors))
+            output.append(f"   c={concurrency:<3} {requests_per_level / wall_time:7.1f} req/s  "
+                          f"p50 {p50:.3f}s  p95 {p95:.3f}s  errors {errors}/{requests_per_level}")
+        logger.info("\n".join(output))
+        return profile
+
+    def add_result(self, results, passed):
+        """Append a sub-test result; in fail-fast mode stop at the first failure instead"""
+        results.append(passed)
+        if self.fail_fast and not passed:
+            raise FailFastStop(f"sub-test {len(results)} failed")
+        return passed
+
+    def cached_get(self, name, endpoint, ttl=60, description=None):
+        """GET an SEO file once per run and reuse the body until it expires or content changes.
+
+        Returns (success, response, fetch_time); fetch_time is the duration of the original request.
+        """
+        cached = self._seo_cache.get(endpoint)
+        if cached and time.perf_counter() - cached[3] < ttl:
+            logger.info(f"\n♻️ Reusing cached {endpoint} for {name}")
+            return cached[:3]
+        
+        start_time = time.perf_counter()
+        success, response = self.run_test(name, "GET", endpoint, 200, description=description)
+        fetched_at = time.perf_counter()
+        fetch_time = fetched_at - start_time
+        if success:
+            self._seo_cache[endpoint] = (success, response, fetch_time, fetched_at)
+        return success, response, fetch_time
+
+    def sample_tools(self, count):
+        """Return (success, tools) with up to `count` existing tools, fetching the list once per run"""
+        if self._sample_tools is None:
+            success, response = self.run_test(
+                "Get Sample Tools",
+                "GET",
+                "tools?limit=5",
+                200,
+                description="Get tools shared by the interaction and comparison tests"
+            )
+            if not (success and isinstance(response, list)):
+                return False, []
+            self._sample_tools = response
+        return True, self._sample_tools[:count]
+
+    def record_check(self, name, passed, endpoint, error=None):
+        """Record an assertion on an already-fetched response as its own test result"""
+        with self._lock:
+            self.tests_run += 1
+            if passed:
+                self.tests_passed += 1
+            else:
+                self.failed_tests.append({
+                    'name': name,
+                    'error': error or 'Check failed',
+                    'endpoint': endpoint
+                })
+        return passed
+
+    def run_tests_parallel(self, specs, max_workers=8):
+        """Run independent API tests concurrently.
+
+        Each spec is a tuple of positional run_test arguments, optionally followed
+        by a dict of keyword arguments. Results come back in submission order.
+        """
+        def run(spec):
+            args, kwargs = (spec[:-1], spec[-1]) if isinstance(spec[-1], dict) else (spec, {})
+            return self.run_test(*args, **kwargs)
+
+        return thread_map(run, specs, max_workers)
+
+    def run_methods_parallel(self, *methods, max_workers=4):
+        """Run independent, read-only test methods concurrently and return their results in order.
+
+        Each method's output is buffered and printed as one block when it finishes.
+        """
+        return thread_map(lambda method: buffered_output(method)(), methods, max_workers)
 
     # BASIC API TESTS
     def test_health_check(self):
@@ -158,8 +643,11 @@ class MarketMindAPITester:
 
     # AUTHENTICATION TESTS
     def test_register(self):
-        """Test user registration with proper username field"""
-        timestamp = datetime.now().strftime('%H%M%S')
+        """Test user registration with proper username field
+
+        Returns (success, email) so callers can log in as the account just created.
+        """
+        timestamp = self._unique_suffix()
         test_email = f"test_user_{timestamp}@test.com"
         test_username = f"testuser_{timestamp}"
         
@@ -184,10 +672,19 @@ class MarketMindAPITester:
                 'username': test_username
             })
         
-        return success
+        return success, test_email
 
     def test_login(self, email, password):
-        """Test login with different user roles"""
+        """Test login with different user roles
+
+        Credentials that already logged in this run switch back to the stored token without a new request.
+        """
+        cached = self._logins.get((email, password))
+        if cached:
+            self.token, self.user_id, self.current_user_role = cached
+            print(f"\n♻️ Reusing login for {email} (role: {self.current_user_role})")
+            return True, self.current_user_role
+        
         success, response = self.run_test(
             f"Login - {email}",
             "POST",
@@ -199,9 +696,10 @@ class MarketMindAPITester:
         if success and isinstance(response, dict):
             if 'access_token' in response:
                 self.token = response['access_token']
-                self.user_id = response.get('user', {}).get('id')
-                self.current_user_role = response.get('user', {}).get('role', 'unknown')
-                user_role = response.get('user', {}).get('role', 'unknown')
+                user = response.get('user') or {}
+                self.user_id = user.get('id')
+                self.current_user_role = user_role = user.get('role', 'unknown')
+                self._logins[(email, password)] = (self.token, self.user_id, self.current_user_role)
                 print(f"   Logged in as: {user_role}")
                 return True, user_role
         return False, None
@@ -256,7 +754,7 @@ class MarketMindAPITester:
         results.append(success)
         
         # Test create user
-        timestamp = datetime.now().strftime('%H%M%S')
+        timestamp = self._unique_suffix()
         new_user_data = {
             "email": f"admin_created_{timestamp}@test.com",
             "username": f"admin_created_{timestamp}",
@@ -315,7 +813,7 @@ class MarketMindAPITester:
         results.append(success)
         
         # Test create category
-        timestamp = datetime.now().strftime('%H%M%S')
+        timestamp = self._unique_suffix()
         new_category_data = {
             "name": f"Test Category {timestamp}",
             "description": "Test category created by automated test",
@@ -372,7 +870,7 @@ class MarketMindAPITester:
         results.append(success)
         
         # Test create tool
-        timestamp = datetime.now().strftime('%H%M%S')
+        timestamp = self._unique_suffix()
         new_tool_data = {
             "name": f"Test Tool {timestamp}",
             "description": "This is a test tool created by automated testing",
@@ -443,7 +941,7 @@ class MarketMindAPITester:
         results = []
         
         # Test creating tool with new company-related fields
-        timestamp = datetime.now().strftime('%H%M%S')
+        timestamp = self._unique_suffix()
         new_tool_data = {
             "name": f"Company Enhanced Tool {timestamp}",
             "description": "This is a test tool with enhanced company data fields for automated testing",
@@ -568,28 +1066,17 @@ class MarketMindAPITester:
             
             print(f"   Testing tool: {first_tool.get('name', 'Unknown')}")
             
-            fields_in_response = []
-            for field in company_fields:
-                if field in first_tool:
-                    fields_in_response.append(field)
-                    value = first_tool[field]
-                    if value is not None:
-                        if isinstance(value, dict):
-                            print(f"   ✅ {field}: Present (JSON object with {len(value)} keys)")
-                        elif isinstance(value, list):
-                            print(f"   ✅ {field}: Present (Array with {len(value)} items)")
-                        else:
-                            print(f"   ✅ {field}: Present ({type(value).__name__})")
-                    else:
-                        print(f"   ⚠️ {field}: Present but null")
-                else:
-                    print(f"   ❌ {field}: Not in response")
+            missing_fields = set(company_fields) - first_tool.keys()
+            null_fields = [field for field in company_fields if field not in missing_fields and first_tool[field] is None]
             
-            if len(fields_in_response) == len(company_fields):
+            if null_fields:
+                print(f"   ⚠️ Present but null: {null_fields}")
+            
+            if not missing_fields:
                 print(f"   ✅ All {len(company_fields)} company fields included in API response")
                 results.append(True)
             else:
-                print(f"   ❌ Only {len(fields_in_response)}/{len(company_fields)} company fields in response")
+                print(f"   ❌ Only {len(company_fields) - len(missing_fields)}/{len(company_fields)} company fields in response, missing: {sorted(missing_fields)}")
                 results.append(False)
         
         return all(results)
@@ -627,19 +1114,10 @@ class MarketMindAPITester:
                     'started_on', 'logo_thumbnail_url'
                 ]
                 
-                missing_headers = []
-                present_headers = []
-                
-                for field in expected_company_fields:
-                    if field in headers:
-                        present_headers.append(field)
-                        print(f"   ✅ {field}: In template headers")
-                    else:
-                        missing_headers.append(field)
-                        print(f"   ❌ {field}: Missing from template headers")
+                missing_headers = set(expected_company_fields).difference(headers)
                 
                 if missing_headers:
-                    print(f"   ❌ Missing company field headers: {missing_headers}")
+                    print(f"   ❌ Missing company field headers: {sorted(missing_headers)}")
                     results.append(False)
                 else:
                     print(f"   ✅ All {len(expected_company_fields)} company fields in template headers")
@@ -760,72 +1238,71 @@ class MarketMindAPITester:
         
         return all(results)
 
+    @buffered_output
     def test_company_fields_comprehensive_review(self):
         """Comprehensive test of all company-related fields functionality - REVIEW REQUEST"""
-        print("\n🔍 COMPREHENSIVE COMPANY FIELDS REVIEW - REVIEW REQUEST")
-        print("=" * 70)
-        print("Testing all 4 requested areas:")
-        print("1. Super Admin Tool Creation with company fields")
-        print("2. Tool API Response verification")
-        print("3. CSV Template Download verification")
-        print("4. Tool by Slug endpoint verification")
-        print("-" * 70)
+        logger.info("\n🔍 COMPREHENSIVE COMPANY FIELDS REVIEW - REVIEW REQUEST")
+        logger.info("=" * 70)
+        logger.info("Testing all 4 requested areas:")
+        logger.info("1. Super Admin Tool Creation with company fields")
+        logger.info("2. Tool API Response verification")
+        logger.info("3. CSV Template Download verification")
+        logger.info("4. Tool by Slug endpoint verification")
+        logger.info("-" * 70)
         
         results = []
         
         # Test 1: Super Admin Tool Creation
-        print("\n📝 TEST 1: SUPER ADMIN TOOL CREATION")
+        logger.info("\n📝 TEST 1: SUPER ADMIN TOOL CREATION")
         result1 = self.test_company_fields_tool_creation()
         results.append(result1)
-        print(f"   Result: {'✅ PASSED' if result1 else '❌ FAILED'}")
+        logger.info(f"   Result: {'✅ PASSED' if result1 else '❌ FAILED'}")
         
         # Test 2: Tool API Response
-        print("\n📝 TEST 2: TOOL API RESPONSE VERIFICATION")
+        logger.info("\n📝 TEST 2: TOOL API RESPONSE VERIFICATION")
         result2 = self.test_tools_api_company_fields_response()
         results.append(result2)
-        print(f"   Result: {'✅ PASSED' if result2 else '❌ FAILED'}")
+        logger.info(f"   Result: {'✅ PASSED' if result2 else '❌ FAILED'}")
         
         # Test 3: CSV Template Download
-        print("\n📝 TEST 3: CSV TEMPLATE DOWNLOAD VERIFICATION")
+        logger.info("\n📝 TEST 3: CSV TEMPLATE DOWNLOAD VERIFICATION")
         result3 = self.test_csv_template_company_fields()
         results.append(result3)
-        print(f"   Result: {'✅ PASSED' if result3 else '❌ FAILED'}")
+        logger.info(f"   Result: {'✅ PASSED' if result3 else '❌ FAILED'}")
         
         # Test 4: Tool by Slug
-        print("\n📝 TEST 4: TOOL BY SLUG ENDPOINT VERIFICATION")
+        logger.info("\n📝 TEST 4: TOOL BY SLUG ENDPOINT VERIFICATION")
         result4 = self.test_tool_by_slug_company_fields()
         results.append(result4)
-        print(f"   Result: {'✅ PASSED' if result4 else '❌ FAILED'}")
+        logger.info(f"   Result: {'✅ PASSED' if result4 else '❌ FAILED'}")
         
         # Overall summary
         passed_tests = sum(results)
         total_tests = len(results)
         
-        print(f"\n📊 COMPREHENSIVE COMPANY FIELDS REVIEW SUMMARY:")
-        print(f"   Tests Passed: {passed_tests}/{total_tests}")
-        print(f"   Success Rate: {(passed_tests/total_tests*100):.1f}%")
+        logger.info(f"\n📊 COMPREHENSIVE COMPANY FIELDS REVIEW SUMMARY:")
+        logger.info(f"   Tests Passed: {passed_tests}/{total_tests}")
+        logger.info(f"   Success Rate: {(passed_tests/total_tests*100):.1f}%")
         
         if passed_tests == total_tests:
-            print(f"   🎉 ALL COMPANY FIELDS TESTS PASSED!")
+            logger.info(f"   🎉 ALL COMPANY FIELDS TESTS PASSED!")
         else:
-            print(f"   ⚠️ Some company fields tests failed")
+            logger.info(f"   ⚠️ Some company fields tests failed")
         
         return all(results)
 
     # SUPERADMIN DASHBOARD ANALYTICS TESTING - REVIEW REQUEST
+    @requires_role('superadmin')
+    @buffered_output
     def test_superadmin_dashboard_analytics(self):
         """Test SuperAdmin Dashboard Analytics endpoint - REVIEW REQUEST"""
-        print("\n🔍 SUPERADMIN DASHBOARD ANALYTICS TESTING - REVIEW REQUEST")
-        print("=" * 70)
-        
-        if self.current_user_role != 'superadmin':
-            print("❌ Skipping superadmin analytics test - insufficient permissions")
-            return False
+        logger.info("\n🔍 SUPERADMIN DASHBOARD ANALYTICS TESTING - REVIEW REQUEST")
+        logger.info("=" * 70)
         
         results = []
         
         # Test 1: Basic Analytics Endpoint
-        print("\n📊 TEST 1: BASIC ANALYTICS ENDPOINT")
+        logger.info("\n📊 TEST 1: BASIC ANALYTICS ENDPOINT")
         success, response = self.run_test(
             "SuperAdmin Dashboard Analytics",
             "GET",
@@ -836,7 +1313,7 @@ class MarketMindAPITester:
         results.append(success)
         
         if success and isinstance(response, dict):
-            print(f"   ✅ Analytics endpoint accessible")
+            logger.info(f"   ✅ Analytics endpoint accessible")
             
             # Verify all required sections are present
             required_sections = [
@@ -844,23 +1321,19 @@ class MarketMindAPITester:
                 'content_status', 'user_insights', 'top_content', 'system_health'
             ]
             
-            missing_sections = []
-            for section in required_sections:
-                if section in response:
-                    print(f"   ✅ {section}: Present")
-                else:
-                    missing_sections.append(section)
-                    print(f"   ❌ {section}: Missing")
+            missing_sections = set(required_sections) - response.keys()
+            present_sections = [section for section in required_sections if section not in missing_sections]
+            logger.info(f"   Sections present: {', '.join(present_sections) or 'none'}")
             
             if missing_sections:
-                print(f"   ❌ Missing sections: {missing_sections}")
+                logger.info(f"   ❌ Missing sections: {sorted(missing_sections)}")
                 results.append(False)
             else:
-                print(f"   ✅ All {len(required_sections)} required sections present")
+                logger.info(f"   ✅ All {len(required_sections)} required sections present")
                 results.append(True)
             
             # Test 2: Verify Real Data vs Mock Data
-            print("\n📊 TEST 2: REAL DATA VERIFICATION")
+            logger.info("\n📊 TEST 2: REAL DATA VERIFICATION")
             overview = response.get('overview', {})
             
             # Check if data looks real (non-zero counts)
@@ -869,62 +1342,61 @@ class MarketMindAPITester:
             total_blogs = overview.get('total_blogs', 0)
             total_reviews = overview.get('total_reviews', 0)
             
-            print(f"   Database Counts:")
-            print(f"   - Users: {total_users}")
-            print(f"   - Tools: {total_tools}")
-            print(f"   - Blogs: {total_blogs}")
-            print(f"   - Reviews: {total_reviews}")
+            logger.info(f"   Database Counts:")
+            logger.info(f"   - Users: {total_users}")
+            logger.info(f"   - Tools: {total_tools}")
+            logger.info(f"   - Blogs: {total_blogs}")
+            logger.info(f"   - Reviews: {total_reviews}")
             
             if total_users > 0 and total_tools > 0:
-                print(f"   ✅ Real data detected (non-zero counts)")
+                logger.info(f"   ✅ Real data detected (non-zero counts)")
                 results.append(True)
             else:
-                print(f"   ⚠️ Data appears to be empty or mock")
+                logger.info(f"   ⚠️ Data appears to be empty or mock")
                 results.append(False)
             
             # Test 3: Growth Calculations
-            print("\n📊 TEST 3: GROWTH CALCULATIONS")
+            logger.info("\n📊 TEST 3: GROWTH CALCULATIONS")
             monthly_growth = overview.get('monthly_growth', {})
             
             growth_metrics = ['users', 'tools', 'blogs', 'reviews']
-            valid_growth = True
+            numeric_growth = {metric for metric, value in monthly_growth.items() if isinstance(value, (int, float))}
+            invalid_growth = set(growth_metrics) - numeric_growth
             
-            for metric in growth_metrics:
-                growth_value = monthly_growth.get(metric, 'N/A')
-                if isinstance(growth_value, (int, float)):
-                    print(f"   ✅ {metric} growth: {growth_value}%")
-                else:
-                    print(f"   ❌ {metric} growth: Invalid ({growth_value})")
-                    valid_growth = False
+            logger.info("   Growth: " + ", ".join(f"{metric} {monthly_growth.get(metric, 'N/A')}%" for metric in growth_metrics))
+            if invalid_growth:
+                logger.info(f"   ❌ Invalid growth metrics: {sorted(invalid_growth)}")
+            else:
+                logger.info(f"   ✅ All {len(growth_metrics)} growth metrics valid")
             
-            results.append(valid_growth)
+            results.append(not invalid_growth)
             
             # Test 4: Recent Activity
-            print("\n📊 TEST 4: RECENT ACTIVITY VERIFICATION")
+            logger.info("\n📊 TEST 4: RECENT ACTIVITY VERIFICATION")
             recent_activity = response.get('recent_activity', {})
             
             activity_metrics = ['new_users_today', 'new_tools_today', 'new_blogs_today', 'new_reviews_today']
-            for metric in activity_metrics:
-                value = recent_activity.get(metric, 'N/A')
-                if isinstance(value, int) and value >= 0:
-                    print(f"   ✅ {metric}: {value}")
-                else:
-                    print(f"   ❌ {metric}: Invalid ({value})")
+            valid_activity = {metric for metric, value in recent_activity.items() if isinstance(value, int) and value >= 0}
+            invalid_activity = set(activity_metrics) - valid_activity
+            
+            logger.info("   Activity: " + ", ".join(f"{metric}={recent_activity.get(metric, 'N/A')}" for metric in activity_metrics))
+            if invalid_activity:
+                logger.info(f"   ❌ Invalid activity metrics: {sorted(invalid_activity)}")
             
             # Check top categories
             top_categories = recent_activity.get('top_categories', [])
             if isinstance(top_categories, list) and len(top_categories) > 0:
-                print(f"   ✅ Top categories: {len(top_categories)} found")
+                logger.info(f"   ✅ Top categories: {len(top_categories)} found")
                 for cat in top_categories[:3]:
                     if isinstance(cat, dict) and 'name' in cat and 'tools' in cat:
-                        print(f"      - {cat['name']}: {cat['tools']} tools")
+                        logger.info(f"      - {cat['name']}: {cat['tools']} tools")
                 results.append(True)
             else:
-                print(f"   ❌ Top categories: Empty or invalid")
+                logger.info(f"   ❌ Top categories: Empty or invalid")
                 results.append(False)
             
             # Test 5: System Health Metrics
-            print("\n📊 TEST 5: SYSTEM HEALTH METRICS")
+            logger.info("\n📊 TEST 5: SYSTEM HEALTH METRICS")
             system_health = response.get('system_health', {})
             
             health_metrics = [
@@ -932,89 +1404,87 @@ class MarketMindAPITester:
                 'user_engagement_score', 'content_quality_score'
             ]
             
-            valid_health = True
-            for metric in health_metrics:
-                value = system_health.get(metric, 'N/A')
-                if isinstance(value, (int, float)) and value >= 0:
-                    print(f"   ✅ {metric}: {value}")
-                else:
-                    print(f"   ❌ {metric}: Invalid ({value})")
-                    valid_health = False
+            valid_health = {metric for metric, value in system_health.items() if isinstance(value, (int, float)) and value >= 0}
+            invalid_health = set(health_metrics) - valid_health
             
-            results.append(valid_health)
+            logger.info("   Health: " + ", ".join(f"{metric}={system_health.get(metric, 'N/A')}" for metric in health_metrics))
+            if invalid_health:
+                logger.info(f"   ❌ Invalid health metrics: {sorted(invalid_health)}")
+            else:
+                logger.info(f"   ✅ All {len(health_metrics)} health metrics valid")
+            
+            results.append(not invalid_health)
         
         # Test 6: Different Timeframes
-        print("\n📊 TEST 6: DIFFERENT TIMEFRAMES")
+        logger.info("\n📊 TEST 6: DIFFERENT TIMEFRAMES")
         timeframes = [7, 30, 90]
         
-        for timeframe in timeframes:
-            success, response = self.run_test(
-                f"Analytics - {timeframe} days",
-                "GET",
-                f"superadmin/dashboard/analytics?timeframe={timeframe}",
-                200,
-                description=f"Test analytics with {timeframe} day timeframe"
-            )
+        # The timeframe requests are independent, so issue them concurrently
+        timeframe_results = self.run_tests_parallel([
+            (f"Analytics - {timeframe} days", "GET", f"superadmin/dashboard/analytics?timeframe={timeframe}", 200,
+             {'description': f"Test analytics with {timeframe} day timeframe"})
+            for timeframe in timeframes
+        ])
+        
+        for timeframe, (success, response) in zip(timeframes, timeframe_results):
             results.append(success)
             
             if success:
-                print(f"   ✅ {timeframe}-day timeframe working")
+                logger.info(f"   ✅ {timeframe}-day timeframe working")
             else:
-                print(f"   ❌ {timeframe}-day timeframe failed")
+                logger.info(f"   ❌ {timeframe}-day timeframe failed")
         
         # Test 7: Authentication Requirement
-        print("\n📊 TEST 7: AUTHENTICATION REQUIREMENT")
+        logger.info("\n📊 TEST 7: AUTHENTICATION REQUIREMENT")
         # Temporarily remove token to test authentication
-        original_token = self.token
-        self.token = None
-        
-        success, response = self.run_test(
-            "Analytics - No Auth",
-            "GET",
-            "superadmin/dashboard/analytics",
-            403,  # Should be forbidden without auth
-            description="Test analytics endpoint requires authentication"
-        )
+        with self.without_auth():
+            success, response = self.run_test(
+                "Analytics - No Auth",
+                "GET",
+                "superadmin/dashboard/analytics",
+                403,  # Should be forbidden without auth
+                description="Test analytics endpoint requires authentication"
+            )
         results.append(success)
         
-        # Restore token
-        self.token = original_token
-        
         if success:
-            print(f"   ✅ Authentication requirement working")
+            logger.info(f"   ✅ Authentication requirement working")
         else:
-            print(f"   ❌ Authentication requirement failed")
+            logger.info(f"   ❌ Authentication requirement failed")
         
         # Overall summary
         passed_tests = sum(results)
         total_tests = len(results)
         
-        print(f"\n📊 SUPERADMIN DASHBOARD ANALYTICS SUMMARY:")
-        print(f"   Tests Passed: {passed_tests}/{total_tests}")
-        print(f"   Success Rate: {(passed_tests/total_tests*100):.1f}%")
+        logger.info(f"\n📊 SUPERADMIN DASHBOARD ANALYTICS SUMMARY:")
+        logger.info(f"   Tests Passed: {passed_tests}/{total_tests}")
+        logger.info(f"   Success Rate: {(passed_tests/total_tests*100):.1f}%")
         
         if passed_tests == total_tests:
-            print(f"   🎉 ALL ANALYTICS TESTS PASSED!")
+            logger.info(f"   🎉 ALL ANALYTICS TESTS PASSED!")
         else:
-            print(f"   ⚠️ Some analytics tests failed")
+            logger.info(f"   ⚠️ Some analytics tests failed")
         
         return all(results)
 
     # BLOG PUBLISHING FLOW TESTING - REVIEW REQUEST
+    @buffered_output
     def test_blog_publishing_flow(self):
         """Test complete blog creation and publishing workflow - REVIEW REQUEST"""
-        print("\n🔍 BLOG PUBLISHING FLOW TESTING - REVIEW REQUEST")
-        print("=" * 70)
+        logger.info("\n🔍 BLOG PUBLISHING FLOW TESTING - REVIEW REQUEST")
+        logger.info("=" * 70)
         
         if not self.token:
-            print("❌ Skipping blog publishing test - no authentication token")
+            logger.info("❌ Skipping blog publishing test - no authentication token")
             return False
         
         results = []
-        timestamp = datetime.now().strftime('%H%M%S')
+        now = datetime.now()
+        timestamp = self._unique_suffix()
+        now_iso = now.isoformat()
         
         # Test 1: Create Blog (Should be Draft by Default)
-        print("\n📝 TEST 1: CREATE BLOG (DRAFT BY DEFAULT)")
+        logger.info("\n📝 TEST 1: CREATE BLOG (DRAFT BY DEFAULT)")
         blog_data = {
             "title": f"Test Blog Publishing Flow {timestamp}",
             "content": f"<h1>Test Blog Content</h1><p>This is a test blog post created at {timestamp} to test the complete publishing workflow.</p><p>This content tests the blog creation and publishing functionality with proper SEO data and JSON-LD structured data.</p>",
@@ -1024,14 +1494,9 @@ class MarketMindAPITester:
             "seo_description": "SEO description for test blog post publishing workflow",
             "seo_keywords": "test, blog, publishing, workflow, automation",
             "json_ld": {
-                "@context": "https://schema.org",
-                "@type": "BlogPosting",
+                **_BLOG_JSON_LD_BASE,
                 "headline": f"Test Blog Publishing Flow {timestamp}",
-                "author": {
-                    "@type": "Person",
-                    "name": "Test User"
-                },
-                "datePublished": datetime.now().isoformat(),
+                "datePublished": now_iso,
                 "description": "Test blog post for publishing workflow"
             }
         }
@@ -1041,27 +1506,27 @@ class MarketMindAPITester:
             "POST",
             "user/blogs",
             200,
-            data=blog_data,
+            data=dumps_json(blog_data),
             description="Create new blog via POST /api/user/blogs (should be draft by default)"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         created_blog_id = None
         if success and isinstance(response, dict) and 'id' in response:
             created_blog_id = response['id']
             blog_status = response.get('status', 'unknown')
             
-            print(f"   ✅ Blog created successfully")
-            print(f"   Blog ID: {created_blog_id}")
-            print(f"   Status: {blog_status}")
+            logger.info(f"   ✅ Blog created successfully")
+            logger.info(f"   Blog ID: {created_blog_id}")
+            logger.info(f"   Status: {blog_status}")
             
             # Verify it's draft by default
             if blog_status == "draft":
-                print(f"   ✅ Blog created as draft (correct default)")
-                results.append(True)
+                logger.info(f"   ✅ Blog created as draft (correct default)")
+                self.add_result(results, True)
             else:
-                print(f"   ❌ Blog status is '{blog_status}', expected 'draft'")
-                results.append(False)
+                logger.info(f"   ❌ Blog status is '{blog_status}', expected 'draft'")
+                self.add_result(results, False)
             
             # Store for cleanup
             self.created_resources['blogs'].append({
@@ -1069,15 +1534,15 @@ class MarketMindAPITester:
                 'title': blog_data['title']
             })
         else:
-            print(f"   ❌ Failed to create blog")
-            results.append(False)
+            logger.info(f"   ❌ Failed to create blog")
+            self.add_result(results, False)
         
         if not created_blog_id:
-            print("❌ Cannot continue testing - blog creation failed")
+            logger.info("❌ Cannot continue testing - blog creation failed")
             return False
         
         # Test 2: Verify Blog is Not in Public Blogs (Draft Status)
-        print("\n📝 TEST 2: VERIFY DRAFT NOT IN PUBLIC BLOGS")
+        logger.info("\n📝 TEST 2: VERIFY DRAFT NOT IN PUBLIC BLOGS")
         success, public_blogs = self.run_test(
             "Get Public Blogs",
             "GET",
@@ -1085,7 +1550,7 @@ class MarketMindAPITester:
             200,
             description="Test GET /api/blogs (should only show published blogs)"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success and isinstance(public_blogs, list):
             # Check if our draft blog appears in public blogs
@@ -1094,21 +1559,21 @@ class MarketMindAPITester:
             )
             
             if not draft_found_in_public:
-                print(f"   ✅ Draft blog correctly NOT in public blogs list")
-                results.append(True)
+                logger.info(f"   ✅ Draft blog correctly NOT in public blogs list")
+                self.add_result(results, True)
             else:
-                print(f"   ❌ Draft blog incorrectly appears in public blogs")
-                results.append(False)
+                logger.info(f"   ❌ Draft blog incorrectly appears in public blogs")
+                self.add_result(results, False)
             
             # Show published blogs count
             published_count = len(public_blogs)
-            print(f"   Public blogs count: {published_count}")
+            logger.info(f"   Public blogs count: {published_count}")
         else:
-            print(f"   ❌ Failed to get public blogs")
-            results.append(False)
+            logger.info(f"   ❌ Failed to get public blogs")
+            self.add_result(results, False)
         
         # Test 3: Publish the Blog
-        print("\n📝 TEST 3: PUBLISH THE BLOG")
+        logger.info("\n📝 TEST 3: PUBLISH THE BLOG")
         success, response = self.run_test(
             "Publish Blog",
             "POST",
@@ -1116,15 +1581,15 @@ class MarketMindAPITester:
             200,
             description=f"Publish blog via POST /api/user/blogs/{created_blog_id}/publish"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success:
-            print(f"   ✅ Blog published successfully")
+            logger.info(f"   ✅ Blog published successfully")
         else:
-            print(f"   ❌ Failed to publish blog")
+            logger.info(f"   ❌ Failed to publish blog")
         
         # Test 4: Verify Blog Status Changed to Published
-        print("\n📝 TEST 4: VERIFY PUBLISHED STATUS")
+        logger.info("\n📝 TEST 4: VERIFY PUBLISHED STATUS")
         success, blog_details = self.run_test(
             "Get Published Blog Details",
             "GET",
@@ -1132,34 +1597,34 @@ class MarketMindAPITester:
             200,
             description="Verify blog status changed to published"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success and isinstance(blog_details, dict):
             blog_status = blog_details.get('status', 'unknown')
             published_at = blog_details.get('published_at')
             
-            print(f"   Blog status: {blog_status}")
-            print(f"   Published at: {published_at}")
+            logger.info(f"   Blog status: {blog_status}")
+            logger.info(f"   Published at: {published_at}")
             
             if blog_status == "published":
-                print(f"   ✅ Blog status correctly changed to 'published'")
-                results.append(True)
+                logger.info(f"   ✅ Blog status correctly changed to 'published'")
+                self.add_result(results, True)
             else:
-                print(f"   ❌ Blog status is '{blog_status}', expected 'published'")
-                results.append(False)
+                logger.info(f"   ❌ Blog status is '{blog_status}', expected 'published'")
+                self.add_result(results, False)
             
             if published_at:
-                print(f"   ✅ Published timestamp set")
-                results.append(True)
+                logger.info(f"   ✅ Published timestamp set")
+                self.add_result(results, True)
             else:
-                print(f"   ❌ Published timestamp missing")
-                results.append(False)
+                logger.info(f"   ❌ Published timestamp missing")
+                self.add_result(results, False)
         else:
-            print(f"   ❌ Failed to get blog details")
-            results.append(False)
+            logger.info(f"   ❌ Failed to get blog details")
+            self.add_result(results, False)
         
         # Test 5: Verify Blog Now Appears in Public Blogs
-        print("\n📝 TEST 5: VERIFY PUBLISHED BLOG IN PUBLIC BLOGS")
+        logger.info("\n📝 TEST 5: VERIFY PUBLISHED BLOG IN PUBLIC BLOGS")
         success, public_blogs_after = self.run_test(
             "Get Public Blogs After Publishing",
             "GET",
@@ -1167,7 +1632,7 @@ class MarketMindAPITester:
             200,
             description="Verify published blog now appears in GET /api/blogs"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success and isinstance(public_blogs_after, list):
             # Check if our published blog appears in public blogs
@@ -1176,8 +1641,8 @@ class MarketMindAPITester:
             )
             
             if published_found:
-                print(f"   ✅ Published blog correctly appears in public blogs")
-                results.append(True)
+                logger.info(f"   ✅ Published blog correctly appears in public blogs")
+                self.add_result(results, True)
                 
                 # Find and verify the blog details
                 published_blog = next(
@@ -1186,64 +1651,66 @@ class MarketMindAPITester:
                 )
                 
                 if published_blog:
-                    print(f"   Blog title: {published_blog.get('title', 'N/A')}")
-                    print(f"   Blog status: {published_blog.get('status', 'N/A')}")
-                    print(f"   Published at: {published_blog.get('published_at', 'N/A')}")
+                    logger.info(f"   Blog title: {published_blog.get('title', 'N/A')}")
+                    logger.info(f"   Blog status: {published_blog.get('status', 'N/A')}")
+                    logger.info(f"   Published at: {published_blog.get('published_at', 'N/A')}")
                     
                     if published_blog.get('status') == 'published':
-                        print(f"   ✅ Blog has correct published status in public API")
-                        results.append(True)
+                        logger.info(f"   ✅ Blog has correct published status in public API")
+                        self.add_result(results, True)
                     else:
-                        print(f"   ❌ Blog status incorrect in public API")
-                        results.append(False)
+                        logger.info(f"   ❌ Blog status incorrect in public API")
+                        self.add_result(results, False)
             else:
-                print(f"   ❌ Published blog does not appear in public blogs")
-                results.append(False)
+                logger.info(f"   ❌ Published blog does not appear in public blogs")
+                self.add_result(results, False)
         else:
-            print(f"   ❌ Failed to get public blogs after publishing")
-            results.append(False)
+            logger.info(f"   ❌ Failed to get public blogs after publishing")
+            self.add_result(results, False)
         
         # Test 6: Test Published Blogs Filter
-        print("\n📝 TEST 6: TEST PUBLISHED BLOGS FILTER")
-        success, published_only = self.run_test(
+        # GET /blogs already defaults to published blogs, so the list from Test 5 covers the
+        # filter contents; a single-item request is enough to check the explicit status filter
+        logger.info("\n📝 TEST 6: TEST PUBLISHED BLOGS FILTER")
+        success, published_canary = self.run_test(
             "Get Published Blogs Only",
             "GET",
-            "blogs?status=published",
+            "blogs?status=published&limit=1",
             200,
             description="Test GET /api/blogs?status=published filter"
         )
-        results.append(success)
+        self.add_result(results, success)
         
-        if success and isinstance(published_only, list):
-            # Verify all returned blogs are published
+        if success and isinstance(published_canary, list):
+            # Verify the filter itself returns only published blogs
             all_published = all(
-                blog.get('status') == 'published' for blog in published_only
+                blog.get('status') == 'published' for blog in published_canary
             )
             
             if all_published:
-                print(f"   ✅ All {len(published_only)} blogs have published status")
-                results.append(True)
+                logger.info(f"   ✅ All {len(published_canary)} blogs from the status filter have published status")
+                self.add_result(results, True)
             else:
-                print(f"   ❌ Some blogs in published filter are not published")
-                results.append(False)
+                logger.info(f"   ❌ Some blogs in published filter are not published")
+                self.add_result(results, False)
             
-            # Verify our blog is in the list
-            our_blog_in_published = any(
-                blog.get('id') == created_blog_id for blog in published_only
+            # Membership comes from the Test 5 list, which GET /blogs already limits to published blogs
+            our_blog_in_published = isinstance(public_blogs_after, list) and any(
+                blog.get('id') == created_blog_id for blog in public_blogs_after
             )
             
             if our_blog_in_published:
-                print(f"   ✅ Our published blog appears in published filter")
-                results.append(True)
+                logger.info(f"   ✅ Our published blog appears in the default published-only list (Test 5)")
+                self.add_result(results, True)
             else:
-                print(f"   ❌ Our published blog missing from published filter")
-                results.append(False)
+                logger.info(f"   ❌ Our published blog missing from the default published-only list (Test 5)")
+                self.add_result(results, False)
         else:
-            print(f"   ❌ Failed to get published blogs filter")
-            results.append(False)
+            logger.info(f"   ❌ Failed to get published blogs filter")
+            self.add_result(results, False)
         
         # Test 7: Edge Case - Try to Publish Already Published Blog
-        print("\n📝 TEST 7: EDGE CASE - REPUBLISH ALREADY PUBLISHED BLOG")
+        logger.info("\n📝 TEST 7: EDGE CASE - REPUBLISH ALREADY PUBLISHED BLOG")
         success, response = self.run_test(
             "Republish Already Published Blog",
             "POST",
@@ -1251,35 +1718,32 @@ class MarketMindAPITester:
             200,  # Should still work (idempotent)
             description="Test publishing already published blog (should be idempotent)"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success:
-            print(f"   ✅ Republishing works (idempotent operation)")
+            logger.info(f"   ✅ Republishing works (idempotent operation)")
         else:
-            print(f"   ❌ Republishing failed")
+            logger.info(f"   ❌ Republishing failed")
         
         # Overall summary
         passed_tests = sum(results)
         total_tests = len(results)
         
-        print(f"\n📊 BLOG PUBLISHING FLOW SUMMARY:")
-        print(f"   Tests Passed: {passed_tests}/{total_tests}")
-        print(f"   Success Rate: {(passed_tests/total_tests*100):.1f}%")
+        logger.info(f"\n📊 BLOG PUBLISHING FLOW SUMMARY:")
+        logger.info(f"   Tests Passed: {passed_tests}/{total_tests}")
+        logger.info(f"   Success Rate: {(passed_tests/total_tests*100):.1f}%")
         
         if passed_tests == total_tests:
-            print(f"   🎉 ALL BLOG PUBLISHING TESTS PASSED!")
+            logger.info(f"   🎉 ALL BLOG PUBLISHING TESTS PASSED!")
         else:
-            print(f"   ⚠️ Some blog publishing tests failed")
+            logger.info(f"   ⚠️ Some blog publishing tests failed")
         
         return all(results)
 
     # ADMIN TESTS
+    @requires_role('admin', 'superadmin')
     def test_admin_dashboard(self):
         """Test admin dashboard"""
-        if self.current_user_role not in ['admin', 'superadmin']:
-            print("❌ Skipping admin dashboard test - insufficient permissions")
-            return False
-        
         success, response = self.run_test(
             "Admin Dashboard",
             "GET",
@@ -1289,12 +1753,9 @@ class MarketMindAPITester:
         )
         return success
 
+    @requires_role('admin', 'superadmin')
     def test_admin_blog_management(self):
         """Test admin blog management operations"""
-        if self.current_user_role not in ['admin', 'superadmin']:
-            print("❌ Skipping admin blog tests - insufficient permissions")
-            return False
-        
         results = []
         
         # Test get all blogs as admin
@@ -1309,12 +1770,9 @@ class MarketMindAPITester:
         
         return all(results)
 
+    @requires_role('admin', 'superadmin')
     def test_admin_review_management(self):
         """Test admin review management"""
-        if self.current_user_role not in ['admin', 'superadmin']:
-            print("❌ Skipping admin review tests - insufficient permissions")
-            return False
-        
         results = []
         
         # Test get all reviews
@@ -1329,12 +1787,9 @@ class MarketMindAPITester:
         
         return all(results)
 
+    @requires_role('admin', 'superadmin')
     def test_admin_seo_management(self):
         """Test admin SEO page management"""
-        if self.current_user_role not in ['admin', 'superadmin']:
-            print("❌ Skipping admin SEO tests - insufficient permissions")
-            return False
-        
         results = []
         
         # Test get SEO pages
@@ -1348,33 +1803,21 @@ class MarketMindAPITester:
         results.append(success)
         
         # Test create SEO page
-        timestamp = datetime.now().strftime('%H%M%S')
-        seo_page_data = {
-            "page_path": f"/test-page-{timestamp}",
-            "title": f"Test SEO Page {timestamp}",
-            "description": "Test SEO page created by automated testing",
-            "keywords": "test, seo, automation",
-            "meta_tags": {"robots": "index,follow"}
-        }
-        
         success, response = self.run_test(
             "Create SEO Page (Admin)",
             "POST",
             "admin/seo-pages",
             200,
-            data=seo_page_data,
+            data=self._seo_payload(),
             description="Create new SEO page configuration"
         )
         results.append(success)
         
         return all(results)
 
+    @requires_role('admin', 'superadmin')
     def test_admin_analytics(self):
         """Test admin analytics endpoint"""
-        if self.current_user_role not in ['admin', 'superadmin']:
-            print("❌ Skipping admin analytics test - insufficient permissions")
-            return False
-        
         success, response = self.run_test(
             "Admin Analytics",
             "GET",
@@ -1390,26 +1833,27 @@ class MarketMindAPITester:
             print("❌ Skipping image upload test - no authentication token")
             return False
         
+        if Image is None:
+            print("❌ PIL/Pillow not available - skipping image upload test")
+            return True  # Don't fail the test if PIL is not available
+        
         try:
-            # Create a simple test image file
-            import io
-            from PIL import Image as PILImage
-            
             # Create a simple 100x100 red image
-            img = PILImage.new('RGB', (100, 100), color='red')
+            img = Image.new('RGB', (100, 100), color='red')
             img_bytes = io.BytesIO()
             img.save(img_bytes, format='PNG')
             img_bytes.seek(0)
             
             # Test image upload
             files = {'file': ('test_image.png', img_bytes, 'image/png')}
-            headers = {'Authorization': f'Bearer {self.token}'}
+            # Drop the session's JSON content type so requests sets the multipart boundary
+            headers = {**self._auth_headers, 'Content-Type': None}
             
             url = f"{self.base_url}/blogs/upload-image"
             print(f"\n🔍 Testing Blog Image Upload...")
             print(f"   URL: {url}")
             
-            response = requests.post(url, files=files, headers=headers, timeout=30)
+            response = self.session.post(url, files=files, headers=headers, timeout=30)
             
             success = response.status_code == 200
             if success:
@@ -1439,9 +1883,6 @@ class MarketMindAPITester:
             self.tests_run += 1
             return success
             
-        except ImportError:
-            print("❌ PIL/Pillow not available - skipping image upload test")
-            return True  # Don't fail the test if PIL is not available
         except Exception as e:
             print(f"❌ Failed - Error: {str(e)}")
             self.failed_tests.append({
@@ -1467,10 +1908,18 @@ class MarketMindAPITester:
             200,
             description="Get all blogs by current user"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         # Test create blog using user endpoint
-        timestamp = datetime.now().strftime('%H%M%S')
+        now = datetime.now()
+        timestamp = self._unique_suffix()
+        now_iso = now.isoformat()
+        create_ld = {
+            **_BLOG_JSON_LD_BASE,
+            "headline": f"User Blog Post {timestamp}",
+            "datePublished": now_iso,
+            "description": "Test blog post with JSON-LD structured data"
+        }
         blog_data = {
             "title": f"User Blog Post {timestamp}",
             "content": f"<h1>User Blog Content</h1><p>This is a user blog post created at {timestamp} for testing the new user-specific blog endpoints. It includes JSON-LD and SEO data.</p><p>This content is longer to test reading time calculation and excerpt generation functionality.</p>",
@@ -1479,17 +1928,7 @@ class MarketMindAPITester:
             "seo_title": f"User Blog Post {timestamp} - SEO Optimized Title",
             "seo_description": "SEO description for user blog post testing new endpoints",
             "seo_keywords": "user, blog, automation, json-ld, seo",
-            "json_ld": {
-                "@context": "https://schema.org",
-                "@type": "BlogPosting",
-                "headline": f"User Blog Post {timestamp}",
-                "author": {
-                    "@type": "Person",
-                    "name": "Test User"
-                },
-                "datePublished": datetime.now().isoformat(),
-                "description": "Test blog post with JSON-LD structured data"
-            }
+            "json_ld": create_ld
         }
         
         success, response = self.run_test(
@@ -1497,10 +1936,10 @@ class MarketMindAPITester:
             "POST",
             "user/blogs",
             200,
-            data=blog_data,
+            data=dumps_json(blog_data),
             description="Create new blog post using user-specific endpoint"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success and isinstance(response, dict) and 'id' in response:
             created_blog_id = response['id']
@@ -1529,21 +1968,17 @@ class MarketMindAPITester:
                 200,
                 description="Get specific blog by current user"
             )
-            results.append(success)
+            self.add_result(results, success)
             
             # Test update user blog
             update_data = {
                 "title": f"Updated User Blog Post {timestamp}",
                 "content": f"<h1>Updated Content</h1><p>This content has been updated to test the user blog update functionality.</p>",
+                # The update only changes these keys of the JSON-LD sent on create
                 "json_ld": {
-                    "@context": "https://schema.org",
-                    "@type": "BlogPosting",
+                    **create_ld,
                     "headline": f"Updated User Blog Post {timestamp}",
-                    "author": {
-                        "@type": "Person",
-                        "name": "Test User"
-                    },
-                    "dateModified": datetime.now().isoformat(),
+                    "dateModified": now_iso,
                     "description": "Updated test blog post with JSON-LD structured data"
                 }
             }
@@ -1553,10 +1988,10 @@ class MarketMindAPITester:
                 "PUT",
                 f"user/blogs/{created_blog_id}",
                 200,
-                data=update_data,
+                data=dumps_json(update_data),
                 description="Update blog post using user-specific endpoint"
             )
-            results.append(success)
+            self.add_result(results, success)
             
             # Test publish user blog
             success, response = self.run_test(
@@ -1566,7 +2001,7 @@ class MarketMindAPITester:
                 200,
                 description="Publish blog post using user-specific endpoint"
             )
-            results.append(success)
+            self.add_result(results, success)
             
             # Test delete user blog
             success, response = self.run_test(
@@ -1576,7 +2011,7 @@ class MarketMindAPITester:
                 200,
                 description="Delete blog post using user-specific endpoint"
             )
-            results.append(success)
+            self.add_result(results, success)
         
         return all(results)
 
@@ -1606,13 +2041,14 @@ class MarketMindAPITester:
         
         return all(results)
 
+    @buffered_output
     def test_tool_review_submission_bug(self):
         """Test tool review submission functionality - SPECIFIC BUG TESTING"""
-        print("\n🐛 TOOL REVIEW SUBMISSION BUG TESTING")
-        print("-" * 50)
+        logger.info("\n🐛 TOOL REVIEW SUBMISSION BUG TESTING")
+        logger.info("-" * 50)
         
         if not self.token:
-            print("❌ Skipping tool review tests - no authentication token")
+            logger.info("❌ Skipping tool review tests - no authentication token")
             return False
         
         results = []
@@ -1625,128 +2061,110 @@ class MarketMindAPITester:
             200,
             description="Get tools to test review submission"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success and isinstance(tools_response, list) and len(tools_response) > 0:
             # Find a tool without existing reviews from this user
-            test_tool = None
-            for tool in tools_response:
-                if tool.get('review_count', 0) == 0:
-                    test_tool = tool
-                    break
+            test_tool = next((t for t in tools_response if t.get('review_count', 0) == 0), None)
             
             # If all tools have reviews, use the last one and expect "already reviewed" error
             if not test_tool:
                 test_tool = tools_response[-1]
-                print("   ⚠️ All tools have reviews, testing with last tool (may get 'already reviewed' error)")
+                logger.info("   ⚠️ All tools have reviews, testing with last tool (may get 'already reviewed' error)")
             
             tool_id = test_tool['id']
             tool_slug = test_tool.get('slug', 'unknown-slug')
             
-            print(f"   Testing with tool: {test_tool['name']}")
-            print(f"   Tool ID: {tool_id}")
-            print(f"   Tool Slug: {tool_slug}")
-            print(f"   Existing review count: {test_tool.get('review_count', 0)}")
+            logger.info(f"   Testing with tool: {test_tool['name']}")
+            logger.info(f"   Tool ID: {tool_id}")
+            logger.info(f"   Tool Slug: {tool_slug}")
+            logger.info(f"   Existing review count: {test_tool.get('review_count', 0)}")
             
             # CRITICAL TEST: Test the exact issue from the review request
-            print("\n   🎯 TESTING EXACT ISSUE FROM REVIEW REQUEST:")
-            print("   Frontend sends to `/tools/${tool?.id || toolSlug}/reviews`")
-            print("   Backend expects `/api/tools/{tool_id}/reviews` with tool_id in payload")
+            logger.info("\n   🎯 TESTING EXACT ISSUE FROM REVIEW REQUEST:")
+            logger.info("   Frontend sends to `/tools/${tool?.id || toolSlug}/reviews`")
+            logger.info("   Backend expects `/api/tools/{tool_id}/reviews` with tool_id in payload")
             
+            # Tests 1 and 4 send no tool_id, so they fail validation without touching the
+            # database and are issued together. Tests 2 and 3 both carry tool_id and can
+            # create a review, so they run one after the other.
             # Test 1: What frontend is likely sending (missing /api prefix)
             frontend_url_style = f"tools/{tool_id}/reviews"  # Missing /api prefix
             review_data_frontend = {
-                "rating": 4,
+                **_REVIEW_BASE,
                 "title": "Frontend Review Test",
-                "content": "Testing the exact scenario described in the bug report.",
-                "pros": ["Good functionality", "User-friendly"],
-                "cons": ["Some issues reported"]
+                "content": "Testing the exact scenario described in the bug report."
             }
             
-            success, response = self.run_test(
-                "CRITICAL: Frontend URL Style (Missing tool_id in body)",
-                "POST",
-                frontend_url_style,
-                422,  # Expected validation error - missing tool_id
-                data=review_data_frontend,
-                description="Test frontend URL style without tool_id in body (main issue)"
-            )
-            results.append(success)
-            
-            if not success:
-                print("   🚨 CRITICAL ISSUE IDENTIFIED: Frontend missing tool_id in request body!")
-            
             # Test 2: Correct format with tool_id in body
             review_data_correct = {
+                **_REVIEW_BASE,
                 "tool_id": tool_id,  # Backend requires this
-                "rating": 4,
                 "title": "Correct Format Review Test",
-                "content": "Testing with correct format including tool_id in request body.",
-                "pros": ["Easy to use", "Good features", "Reliable"],
-                "cons": ["Could be faster"]
+                "content": "Testing with correct format including tool_id in request body."
             }
-            
             expected_status = 200 if test_tool.get('review_count', 0) == 0 else 400
-            success, response = self.run_test(
-                "Tool Review - Correct Format (tool_id in body)",
-                "POST",
-                f"tools/{tool_id}/reviews",
-                expected_status,
-                data=review_data_correct,
-                description=f"Test POST /api/tools/{tool_id}/reviews with tool_id in body"
-            )
-            results.append(success)
-            
-            if success and expected_status == 200 and isinstance(response, dict):
-                print(f"   ✅ Review created successfully")
-                print(f"   Review ID: {response.get('id', 'Unknown')}")
-                print(f"   Rating: {response.get('rating', 'Unknown')}")
-                print(f"   Title: {response.get('title', 'Unknown')}")
-                self.created_resources['reviews'].append({
-                    'id': response.get('id'),
-                    'tool_id': tool_id,
-                    'title': response.get('title')
-                })
             
             # Test 3: Test with slug in URL (what frontend might be doing)
             review_data_slug = {
+                **_REVIEW_BASE,
                 "tool_id": tool_id,  # Still need tool_id in body
                 "rating": 5,
                 "title": "Slug URL Test",
-                "content": "Testing with slug in URL path.",
-                "pros": ["Excellent"],
-                "cons": ["None"]
+                "content": "Testing with slug in URL path."
             }
             
-            success, response = self.run_test(
-                "Tool Review - Slug in URL",
-                "POST",
-                f"tools/{tool_slug}/reviews",
-                404,  # Expected to fail - endpoint doesn't support slug
-                data=review_data_slug,
-                description=f"Test POST /api/tools/{tool_slug}/reviews (should fail)"
-            )
-            results.append(success)
-            
             # Test 4: Test what happens when frontend sends slug but no tool_id in body
             review_data_slug_no_id = {
+                **_REVIEW_BASE,
                 # No tool_id in body
                 "rating": 3,
                 "title": "Slug No ID Test",
-                "content": "Testing slug URL without tool_id in body.",
-                "pros": ["Testing"],
-                "cons": ["Missing data"]
+                "content": "Testing slug URL without tool_id in body."
             }
             
+            (frontend_ok, _), (slug_no_id_ok, _) = self.run_tests_parallel([
+                ("CRITICAL: Frontend URL Style (Missing tool_id in body)", "POST", frontend_url_style,
+                 422,  # Expected validation error - missing tool_id
+                 {"data": review_data_frontend,
+                  "description": "Test frontend URL style without tool_id in body (main issue)"}),
+                ("CRITICAL: Slug URL + No tool_id (Frontend Issue)", "POST", f"tools/{tool_slug}/reviews",
+                 404,  # Expected to fail - endpoint doesn't exist
+                 {"data": review_data_slug_no_id,
+                  "description": "Test frontend sending slug URL without tool_id in body"}),
+            ])
             success, response = self.run_test(
-                "CRITICAL: Slug URL + No tool_id (Frontend Issue)",
+                "Tool Review - Correct Format (tool_id in body)",
+                "POST",
+                f"tools/{tool_id}/reviews",
+                expected_status,
+                data=review_data_correct,
+                description=f"Test POST /api/tools/{tool_id}/reviews with tool_id in body"
+            )
+            slug_ok, _ = self.run_test(
+                "Tool Review - Slug in URL",
                 "POST",
                 f"tools/{tool_slug}/reviews",
-                404,  # Expected to fail - endpoint doesn't exist
-                data=review_data_slug_no_id,
-                description="Test frontend sending slug URL without tool_id in body"
+                404,  # Expected to fail - endpoint doesn't support slug
+                data=review_data_slug,
+                description=f"Test POST /api/tools/{tool_slug}/reviews (should fail)"
             )
-            results.append(success)
+            for passed in (frontend_ok, success, slug_ok, slug_no_id_ok):
+                self.add_result(results, passed)
+            
+            if not frontend_ok:
+                logger.info("   🚨 CRITICAL ISSUE IDENTIFIED: Frontend missing tool_id in request body!")
+            
+            if success and expected_status == 200 and isinstance(response, dict):
+                logger.info(f"   ✅ Review created successfully")
+                logger.info(f"   Review ID: {response.get('id', 'Unknown')}")
+                logger.info(f"   Rating: {response.get('rating', 'Unknown')}")
+                logger.info(f"   Title: {response.get('title', 'Unknown')}")
+                self.created_resources['reviews'].append({
+                    'id': response.get('id'),
+                    'tool_id': tool_id,
+                    'title': response.get('title')
+                })
             
             # Test 5: Get existing reviews
             success, response = self.run_test(
@@ -1756,22 +2174,20 @@ class MarketMindAPITester:
                 200,
                 description=f"Get reviews for tool {tool_id}"
             )
-            results.append(success)
+            self.add_result(results, success)
             
             if success and isinstance(response, list):
-                print(f"   Found {len(response)} reviews for this tool")
+                logger.info(f"   Found {len(response)} reviews for this tool")
                 for review in response[:3]:
-                    print(f"   - Review: {review.get('title', 'No title')} (Rating: {review.get('rating', 'N/A')})")
+                    logger.info(f"   - Review: {review.get('title', 'No title')} (Rating: {review.get('rating', 'N/A')})")
             
             # Test 6: Test the FIXED frontend behavior
-            print("\n   🔧 TESTING FIXED FRONTEND BEHAVIOR:")
+            logger.info("\n   🔧 TESTING FIXED FRONTEND BEHAVIOR:")
             review_data_fixed = {
+                **_REVIEW_BASE,
                 "tool_id": tool_id,  # FIXED: Now includes tool_id in body
-                "rating": 4,
                 "title": "Fixed Frontend Review Test",
-                "content": "Testing the fixed frontend behavior with tool_id included in request body.",
-                "pros": ["Now works correctly", "Proper data format"],
-                "cons": ["Should have been included from start"]
+                "content": "Testing the fixed frontend behavior with tool_id included in request body."
             }
             
             # Try with a different tool that might not have reviews from this user
@@ -1789,20 +2205,20 @@ class MarketMindAPITester:
                     data=review_data_fixed,
                     description="Test fixed frontend behavior with tool_id in body"
                 )
-                results.append(success)
+                self.add_result(results, success)
                 
                 if success and expected_status == 200:
-                    print(f"   ✅ FIXED: Review submission now works!")
-                    print(f"   Review ID: {response.get('id', 'Unknown')}")
+                    logger.info(f"   ✅ FIXED: Review submission now works!")
+                    logger.info(f"   Review ID: {response.get('id', 'Unknown')}")
             
             # SUMMARY OF FINDINGS
-            print("\n   📋 BUG ANALYSIS SUMMARY:")
-            print("   1. Backend endpoint: POST /api/tools/{tool_id}/reviews")
-            print("   2. Backend requires 'tool_id' in request body (ReviewCreate model)")
-            print("   3. Frontend sends to `/tools/${tool?.id}/reviews`")
-            print("   4. ❌ ISSUE: Frontend was missing 'tool_id' in request body")
-            print("   5. ✅ FIXED: Added 'tool_id: selectedTool' to request body")
-            print("   6. This fix resolves the 'failed to submit review' error")
+            logger.info("\n   📋 BUG ANALYSIS SUMMARY:")
+            logger.info("   1. Backend endpoint: POST /api/tools/{tool_id}/reviews")
+            logger.info("   2. Backend requires 'tool_id' in request body (ReviewCreate model)")
+            logger.info("   3. Frontend sends to `/tools/${tool?.id}/reviews`")
+            logger.info("   4. ❌ ISSUE: Frontend was missing 'tool_id' in request body")
+            logger.info("   5. ✅ FIXED: Added 'tool_id: selectedTool' to request body")
+            logger.info("   6. This fix resolves the 'failed to submit review' error")
             
         return all(results)
 
@@ -1815,25 +2231,17 @@ class MarketMindAPITester:
         results = []
         
         # First get available tools
-        success, tools_response = self.run_test(
-            "Get Tools for Interaction",
-            "GET",
-            "tools?limit=1",
-            200,
-            description="Get tools to test interactions"
-        )
+        success, tools_response = self.sample_tools(1)
         
         if success and isinstance(tools_response, list) and len(tools_response) > 0:
             tool_id = tools_response[0]['id']
             
             # Test create review
             review_data = {
+                **_REVIEW_BASE,
                 "tool_id": tool_id,
-                "rating": 4,
                 "title": "Great tool for testing",
-                "content": "This tool works well for our automated testing purposes. Highly recommended!",
-                "pros": ["Easy to use", "Good features", "Reliable"],
-                "cons": ["Could be faster"]
+                "content": "This tool works well for our automated testing purposes. Highly recommended!"
             }
             
             success, response = self.run_test(
@@ -1863,57 +2271,28 @@ class MarketMindAPITester:
         """Test advanced tools API functionality"""
         results = []
         
-        # Test tools with filtering
-        success, response = self.run_test(
-            "Get Tools with Filters",
-            "GET",
-            "tools?pricing=free&sort=rating&limit=5",
-            200,
-            description="Get tools with pricing filter and rating sort"
-        )
-        results.append(success)
-        
-        # Test tool search
-        success, response = self.run_test(
-            "Search Tools",
-            "GET",
-            "tools?search=productivity&limit=3",
-            200,
-            description="Search tools by keyword"
-        )
-        results.append(success)
-        
-        # Test featured tools
-        success, response = self.run_test(
-            "Get Featured Tools",
-            "GET",
-            "tools?featured=true",
-            200,
-            description="Get only featured tools"
-        )
-        results.append(success)
+        # The list queries are independent read-only requests, so run them concurrently
+        list_results = self.run_tests_parallel([
+            ("Get Tools with Filters", "GET", "tools?pricing=free&sort=rating&limit=5", 200,
+             {'description': "Get tools with pricing filter and rating sort"}),
+            ("Search Tools", "GET", "tools?search=productivity&limit=3", 200,
+             {'description': "Search tools by keyword"}),
+            ("Get Featured Tools", "GET", "tools?featured=true", 200,
+             {'description': "Get only featured tools", 'first_item': True}),
+        ])
+        results.extend(success for success, _ in list_results)
+        success, response = list_results[-1]
         
         # Test tool details
         if success and isinstance(response, list) and len(response) > 0:
             tool_id = response[0]['id']
-            success, response = self.run_test(
-                "Get Tool Details",
-                "GET",
-                f"tools/{tool_id}",
-                200,
-                description="Get detailed information for a specific tool"
-            )
-            results.append(success)
-            
-            # Test tool reviews
-            success, response = self.run_test(
-                "Get Tool Reviews",
-                "GET",
-                f"tools/{tool_id}/reviews",
-                200,
-                description="Get reviews for a specific tool"
-            )
-            results.append(success)
+            detail_results = self.run_tests_parallel([
+                ("Get Tool Details", "GET", f"tools/{tool_id}", 200,
+                 {'description': "Get detailed information for a specific tool"}),
+                ("Get Tool Reviews", "GET", f"tools/{tool_id}/reviews", 200,
+                 {'description': "Get reviews for a specific tool"}),
+            ])
+            results.extend(success for success, _ in detail_results)
         
         return all(results)
 
@@ -1921,25 +2300,15 @@ class MarketMindAPITester:
         """Test advanced blogs API functionality"""
         results = []
         
-        # Test blogs with filtering
-        success, response = self.run_test(
-            "Get Published Blogs",
-            "GET",
-            "blogs?status=published&limit=5",
-            200,
-            description="Get only published blogs"
-        )
-        results.append(success)
-        
-        # Test blog search
-        success, response = self.run_test(
-            "Search Blogs",
-            "GET",
-            "blogs?search=productivity&limit=3",
-            200,
-            description="Search blogs by keyword"
-        )
-        results.append(success)
+        # The list queries are independent read-only requests, so run them concurrently
+        list_results = self.run_tests_parallel([
+            ("Get Published Blogs", "GET", "blogs?status=published&limit=5", 200,
+             {'description': "Get only published blogs"}),
+            ("Search Blogs", "GET", "blogs?search=productivity&limit=3", 200,
+             {'description': "Search blogs by keyword", 'first_item': True}),
+        ])
+        results.extend(success for success, _ in list_results)
+        success, response = list_results[-1]
         
         # Test blog details
         if success and isinstance(response, list) and len(response) > 0:
@@ -1958,13 +2327,7 @@ class MarketMindAPITester:
     def test_tool_comparison(self):
         """Test tool comparison functionality"""
         # First get some tools
-        success, tools_response = self.run_test(
-            "Get Tools for Comparison",
-            "GET",
-            "tools?limit=3",
-            200,
-            description="Get tools to test comparison feature"
-        )
+        success, tools_response = self.sample_tools(3)
         
         if success and isinstance(tools_response, list) and len(tools_response) >= 2:
             tool_ids = [tool['id'] for tool in tools_response[:2]]
@@ -2019,13 +2382,7 @@ class MarketMindAPITester:
             return False
         
         # First get some tools
-        success, tools_response = self.run_test(
-            "Get Tools for AI Comparison",
-            "GET",
-            "tools?limit=3",
-            200,
-            description="Get tools for AI comparison test"
-        )
+        success, tools_response = self.sample_tools(3)
         
         if success and isinstance(tools_response, list) and len(tools_response) >= 2:
             tool_ids = [tool['id'] for tool in tools_response[:2]]
@@ -2059,162 +2416,67 @@ class MarketMindAPITester:
         return success
 
     # SEO IMPLEMENTATION TESTING
-    def test_seo_sitemap_generation(self):
-        """Test SEO sitemap.xml generation endpoint"""
-        print("\n🔍 SEO SITEMAP GENERATION TESTING")
-        print("-" * 50)
+    @buffered_output
+    def test_seo_robots_txt_generation(self):
+        """Test SEO robots.txt generation endpoint"""
+        logger.info("\n🔍 SEO ROBOTS.TXT GENERATION TESTING")
+        logger.info("-" * 50)
         
         results = []
         
-        # Test sitemap.xml endpoint
-        import time
-        start_time = time.time()
+        # Test robots.txt endpoint
+        success, response, response_time = self.cached_get(
+            "SEO Robots.txt Generation",
+            "robots.txt",
+            description="Test GET /api/robots.txt endpoint for SEO robots.txt generation"
+        )
         
-        success, response = self.run_test(
-            "SEO Sitemap Generation",
-            "GET",
-            "sitemap.xml",
-            200,
-            description="Test GET /api/sitemap.xml endpoint for SEO sitemap generation"
-        )
-        
-        end_time = time.time()
-        response_time = end_time - start_time
-        
-        results.append(success)
-        
-        if success:
-            print(f"   ✅ Sitemap generation time: {response_time:.3f} seconds")
-            
-            # Validate XML structure
-            if isinstance(response, str) and response.startswith('<?xml'):
-                print(f"   ✅ Valid XML format detected")
-                print(f"   Content length: {len(response)} characters")
-                
-                # Check for required XML elements
-                required_elements = ['<urlset', '<url>', '<loc>', '<lastmod>', '<changefreq>', '<priority>']
-                missing_elements = []
-                
-                for element in required_elements:
-                    if element not in response:
-                        missing_elements.append(element)
-                
-                if missing_elements:
-                    print(f"   ❌ Missing XML elements: {missing_elements}")
-                    results.append(False)
-                else:
-                    print(f"   ✅ All required XML elements present")
-                
-                # Count URLs in sitemap
-                url_count = response.count('<url>')
-                print(f"   Total URLs in sitemap: {url_count}")
-                
-                # Check for main pages
-                main_pages = ['/tools', '/blogs', '/compare']
-                found_pages = []
-                for page in main_pages:
-                    if page in response:
-                        found_pages.append(page)
-                
-                print(f"   Main pages found: {found_pages}")
-                
-                # Check for blog and tool URLs
-                blog_urls = response.count('/blogs/')
-                tool_urls = response.count('/tools/')
-                print(f"   Blog URLs: {blog_urls}")
-                print(f"   Tool URLs: {tool_urls}")
-                
-            else:
-                print(f"   ❌ Invalid XML format or empty response")
-                results.append(False)
-        
-        # Performance check
-        if response_time > 1.0:
-            print(f"   ⚠️ Sitemap generation took {response_time:.3f}s (> 1 second)")
-        else:
-            print(f"   ✅ Performance acceptable: {response_time:.3f}s (< 1 second)")
-        
-        return all(results)
-
-    def test_seo_robots_txt_generation(self):
-        """Test SEO robots.txt generation endpoint"""
-        print("\n🔍 SEO ROBOTS.TXT GENERATION TESTING")
-        print("-" * 50)
-        
-        results = []
-        
-        # Test robots.txt endpoint
-        import time
-        start_time = time.time()
-        
-        success, response = self.run_test(
-            "SEO Robots.txt Generation",
-            "GET",
-            "robots.txt",
-            200,
-            description="Test GET /api/robots.txt endpoint for SEO robots.txt generation"
-        )
-        
-        end_time = time.time()
-        response_time = end_time - start_time
-        
-        results.append(success)
+        self.add_result(results, success)
         
         if success:
-            print(f"   ✅ Robots.txt generation time: {response_time:.3f} seconds")
+            logger.info(f"   ✅ Robots.txt generation time: {response_time:.3f} seconds")
             
             if isinstance(response, str):
-                print(f"   Content length: {len(response)} characters")
-                print(f"   Content preview: {response[:200]}...")
+                logger.info(f"   Content length: {len(response)} characters")
+                logger.info(f"   Content preview: {response[:200]}...")
                 
                 # Check for required directives
-                required_directives = [
-                    'User-agent: *',
-                    'Allow: /',
-                    'Disallow: /admin/',
-                    'Disallow: /dashboard/',
-                    'Disallow: /superadmin/',
-                    'Disallow: /api/',
-                    'Allow: /api/blogs/',
-                    'Allow: /api/tools/',
-                    'Sitemap:',
-                    'Crawl-delay:'
+                directive_lines = _ROBOTS_DIRECTIVE_LINE.findall(response)
+                missing_directives = [
+                    directive for directive in _ROBOTS_REQUIRED_DIRECTIVES
+                    if not any(line.startswith(directive) for line in directive_lines)
                 ]
                 
-                missing_directives = []
-                for directive in required_directives:
-                    if directive not in response:
-                        missing_directives.append(directive)
-                
                 if missing_directives:
-                    print(f"   ❌ Missing directives: {missing_directives}")
-                    results.append(False)
+                    logger.info(f"   ❌ Missing directives: {missing_directives}")
+                    self.add_result(results, False)
                 else:
-                    print(f"   ✅ All required directives present")
+                    logger.info(f"   ✅ All required directives present")
                 
                 # Check sitemap reference
                 if 'sitemap.xml' in response.lower():
-                    print(f"   ✅ Sitemap reference found")
+                    logger.info(f"   ✅ Sitemap reference found")
                 else:
-                    print(f"   ❌ Sitemap reference missing")
-                    results.append(False)
+                    logger.info(f"   ❌ Sitemap reference missing")
+                    self.add_result(results, False)
                 
             else:
-                print(f"   ❌ Invalid response format")
-                results.append(False)
+                logger.info(f"   ❌ Invalid response format")
+                self.add_result(results, False)
         
         # Performance check
         if response_time > 1.0:
-            print(f"   ⚠️ Robots.txt generation took {response_time:.3f}s (> 1 second)")
+            logger.info(f"   ⚠️ Robots.txt generation took {response_time:.3f}s (> 1 second)")
         else:
-            print(f"   ✅ Performance acceptable: {response_time:.3f}s (< 1 second)")
+            logger.info(f"   ✅ Performance acceptable: {response_time:.3f}s (< 1 second)")
         
         return all(results)
 
+    @buffered_output
     def test_seo_blog_by_slug_endpoint(self):
         """Test blog by slug endpoint for SEO fields"""
-        print("\n🔍 SEO BLOG BY SLUG TESTING")
-        print("-" * 50)
+        logger.info("\n🔍 SEO BLOG BY SLUG TESTING")
+        logger.info("-" * 50)
         
         results = []
         
@@ -2230,59 +2492,58 @@ class MarketMindAPITester:
         )
         
         if success and isinstance(response, dict):
-            print(f"   Blog found: {response.get('title', 'Unknown')}")
-            print(f"   Status: {response.get('status', 'Unknown')}")
+            logger.info(f"   Blog found: {response.get('title', 'Unknown')}")
+            logger.info(f"   Status: {response.get('status', 'Unknown')}")
             
             # Check SEO fields
-            seo_fields = ['seo_title', 'seo_description', 'seo_keywords', 'json_ld']
             seo_results = {}
             
-            for field in seo_fields:
+            for field in _SEO_FIELDS_WITH_JSON_LD:
                 value = response.get(field)
                 if value:
                     seo_results[field] = "✅ Present"
                     if field == 'json_ld' and isinstance(value, dict):
-                        print(f"   {field}: ✅ Present (JSON object with {len(value)} keys)")
+                        logger.info(f"   {field}: ✅ Present (JSON object with {len(value)} keys)")
                     elif field != 'json_ld':
-                        print(f"   {field}: ✅ Present - '{value[:50]}{'...' if len(str(value)) > 50 else ''}'")
+                        logger.info(f"   {field}: ✅ Present - '{value[:50]}{'...' if len(str(value)) > 50 else ''}'")
                 else:
                     seo_results[field] = "❌ Missing/Empty"
-                    print(f"   {field}: ❌ Missing or empty")
+                    logger.info(f"   {field}: ❌ Missing or empty")
             
             # Validate SEO data quality
             if response.get('seo_title'):
                 if len(response['seo_title']) < 30:
-                    print(f"   ⚠️ SEO title might be too short: {len(response['seo_title'])} chars")
+                    logger.info(f"   ⚠️ SEO title might be too short: {len(response['seo_title'])} chars")
                 elif len(response['seo_title']) > 60:
-                    print(f"   ⚠️ SEO title might be too long: {len(response['seo_title'])} chars")
+                    logger.info(f"   ⚠️ SEO title might be too long: {len(response['seo_title'])} chars")
                 else:
-                    print(f"   ✅ SEO title length optimal: {len(response['seo_title'])} chars")
+                    logger.info(f"   ✅ SEO title length optimal: {len(response['seo_title'])} chars")
             
             if response.get('seo_description'):
                 if len(response['seo_description']) < 120:
-                    print(f"   ⚠️ SEO description might be too short: {len(response['seo_description'])} chars")
+                    logger.info(f"   ⚠️ SEO description might be too short: {len(response['seo_description'])} chars")
                 elif len(response['seo_description']) > 160:
-                    print(f"   ⚠️ SEO description might be too long: {len(response['seo_description'])} chars")
+                    logger.info(f"   ⚠️ SEO description might be too long: {len(response['seo_description'])} chars")
                 else:
-                    print(f"   ✅ SEO description length optimal: {len(response['seo_description'])} chars")
+                    logger.info(f"   ✅ SEO description length optimal: {len(response['seo_description'])} chars")
             
             # Check if all critical SEO fields are present
             critical_fields = ['seo_title', 'seo_description']
             missing_critical = [field for field in critical_fields if not response.get(field)]
             
             if missing_critical:
-                print(f"   ❌ Missing critical SEO fields: {missing_critical}")
+                logger.info(f"   ❌ Missing critical SEO fields: {missing_critical}")
                 results.append(False)
             else:
-                print(f"   ✅ All critical SEO fields present")
+                logger.info(f"   ✅ All critical SEO fields present")
                 results.append(True)
         
         else:
-            print(f"   ❌ Failed to retrieve blog or invalid response format")
+            logger.info(f"   ❌ Failed to retrieve blog or invalid response format")
             results.append(False)
             
             # Try to find any published blog for testing
-            print(f"   Attempting to find any published blog for SEO testing...")
+            logger.info(f"   Attempting to find any published blog for SEO testing...")
             success_alt, blogs_response = self.run_test(
                 "Get Published Blogs for SEO Test",
                 "GET",
@@ -2296,7 +2557,7 @@ class MarketMindAPITester:
                 alt_slug = test_blog.get('slug')
                 
                 if alt_slug:
-                    print(f"   Testing with alternative blog slug: {alt_slug}")
+                    logger.info(f"   Testing with alternative blog slug: {alt_slug}")
                     success_alt2, alt_response = self.run_test(
                         "Alternative Blog by Slug - SEO Fields",
                         "GET",
@@ -2306,24 +2567,25 @@ class MarketMindAPITester:
                     )
                     
                     if success_alt2 and isinstance(alt_response, dict):
-                        print(f"   Alternative blog found: {alt_response.get('title', 'Unknown')}")
+                        logger.info(f"   Alternative blog found: {alt_response.get('title', 'Unknown')}")
                         
                         # Check SEO fields for alternative blog
                         for field in ['seo_title', 'seo_description', 'seo_keywords', 'json_ld']:
                             value = alt_response.get(field)
                             if value:
-                                print(f"   {field}: ✅ Present")
+                                logger.info(f"   {field}: ✅ Present")
                             else:
-                                print(f"   {field}: ❌ Missing/Empty")
+                                logger.info(f"   {field}: ❌ Missing/Empty")
                         
                         results.append(True)
         
         return all(results)
 
+    @buffered_output
     def test_seo_tool_by_slug_endpoint(self):
         """Test tool by slug endpoint for SEO fields"""
-        print("\n🔍 SEO TOOL BY SLUG TESTING")
-        print("-" * 50)
+        logger.info("\n🔍 SEO TOOL BY SLUG TESTING")
+        logger.info("-" * 50)
         
         results = []
         
@@ -2339,45 +2601,44 @@ class MarketMindAPITester:
         )
         
         if success and isinstance(response, dict):
-            print(f"   Tool found: {response.get('name', 'Unknown')}")
-            print(f"   Active: {response.get('is_active', 'Unknown')}")
+            logger.info(f"   Tool found: {response.get('name', 'Unknown')}")
+            logger.info(f"   Active: {response.get('is_active', 'Unknown')}")
             
             # Check SEO fields
-            seo_fields = ['seo_title', 'seo_description', 'seo_keywords']
             seo_results = {}
             
-            for field in seo_fields:
+            for field in _SEO_META_FIELDS:
                 value = response.get(field)
                 if value:
                     seo_results[field] = "✅ Present"
-                    print(f"   {field}: ✅ Present - '{value[:50]}{'...' if len(str(value)) > 50 else ''}'")
+                    logger.info(f"   {field}: ✅ Present - '{value[:50]}{'...' if len(str(value)) > 50 else ''}'")
                 else:
                     seo_results[field] = "❌ Missing/Empty"
-                    print(f"   {field}: ❌ Missing or empty")
+                    logger.info(f"   {field}: ❌ Missing or empty")
             
             # Validate SEO data quality for tools
             if response.get('seo_title'):
                 if len(response['seo_title']) < 30:
-                    print(f"   ⚠️ SEO title might be too short: {len(response['seo_title'])} chars")
+                    logger.info(f"   ⚠️ SEO title might be too short: {len(response['seo_title'])} chars")
                 elif len(response['seo_title']) > 60:
-                    print(f"   ⚠️ SEO title might be too long: {len(response['seo_title'])} chars")
+                    logger.info(f"   ⚠️ SEO title might be too long: {len(response['seo_title'])} chars")
                 else:
-                    print(f"   ✅ SEO title length optimal: {len(response['seo_title'])} chars")
+                    logger.info(f"   ✅ SEO title length optimal: {len(response['seo_title'])} chars")
             
             # Check if at least seo_title is present (tools might not have all fields populated)
             if response.get('seo_title'):
-                print(f"   ✅ Primary SEO field (seo_title) present")
+                logger.info(f"   ✅ Primary SEO field (seo_title) present")
                 results.append(True)
             else:
-                print(f"   ❌ Primary SEO field (seo_title) missing")
+                logger.info(f"   ❌ Primary SEO field (seo_title) missing")
                 results.append(False)
         
         else:
-            print(f"   ❌ Failed to retrieve tool or invalid response format")
+            logger.info(f"   ❌ Failed to retrieve tool or invalid response format")
             results.append(False)
             
             # Try to find any active tool for testing
-            print(f"   Attempting to find any active tool for SEO testing...")
+            logger.info(f"   Attempting to find any active tool for SEO testing...")
             success_alt, tools_response = self.run_test(
                 "Get Active Tools for SEO Test",
                 "GET",
@@ -2391,7 +2652,7 @@ class MarketMindAPITester:
                 alt_slug = test_tool.get('slug')
                 
                 if alt_slug:
-                    print(f"   Testing with alternative tool slug: {alt_slug}")
+                    logger.info(f"   Testing with alternative tool slug: {alt_slug}")
                     success_alt2, alt_response = self.run_test(
                         "Alternative Tool by Slug - SEO Fields",
                         "GET",
@@ -2401,112 +2662,28 @@ class MarketMindAPITester:
                     )
                     
                     if success_alt2 and isinstance(alt_response, dict):
-                        print(f"   Alternative tool found: {alt_response.get('name', 'Unknown')}")
+                        logger.info(f"   Alternative tool found: {alt_response.get('name', 'Unknown')}")
                         
                         # Check SEO fields for alternative tool
                         for field in ['seo_title', 'seo_description', 'seo_keywords']:
                             value = alt_response.get(field)
                             if value:
-                                print(f"   {field}: ✅ Present")
+                                logger.info(f"   {field}: ✅ Present")
                             else:
-                                print(f"   {field}: ❌ Missing/Empty")
+                                logger.info(f"   {field}: ❌ Missing/Empty")
                         
                         results.append(True)
         
         return all(results)
 
-    def test_seo_performance_impact(self):
-        """Test SEO endpoints performance impact"""
-        print("\n🔍 SEO PERFORMANCE IMPACT TESTING")
-        print("-" * 50)
-        
-        results = []
-        import time
-        
-        # Test baseline API performance
-        start_time = time.time()
-        success_baseline, _ = self.run_test(
-            "Baseline API Performance",
-            "GET",
-            "health",
-            200,
-            description="Baseline API performance measurement"
-        )
-        baseline_time = time.time() - start_time
-        results.append(success_baseline)
-        
-        # Test sitemap performance
-        start_time = time.time()
-        success_sitemap, _ = self.run_test(
-            "Sitemap Performance Test",
-            "GET",
-            "sitemap.xml",
-            200,
-            description="Measure sitemap generation performance"
-        )
-        sitemap_time = time.time() - start_time
-        results.append(success_sitemap)
-        
-        # Test robots.txt performance
-        start_time = time.time()
-        success_robots, _ = self.run_test(
-            "Robots.txt Performance Test",
-            "GET",
-            "robots.txt",
-            200,
-            description="Measure robots.txt generation performance"
-        )
-        robots_time = time.time() - start_time
-        results.append(success_robots)
-        
-        # Performance analysis
-        print(f"\n   📊 PERFORMANCE ANALYSIS:")
-        print(f"   Baseline API: {baseline_time:.3f} seconds")
-        print(f"   Sitemap generation: {sitemap_time:.3f} seconds")
-        print(f"   Robots.txt generation: {robots_time:.3f} seconds")
-        
-        # Performance targets
-        sitemap_target = 2.0  # < 2 seconds
-        robots_target = 1.0   # < 1 second
-        
-        if sitemap_time <= sitemap_target:
-            print(f"   ✅ Sitemap performance: {sitemap_time:.3f}s (target: < {sitemap_target}s)")
-        else:
-            print(f"   ❌ Sitemap performance: {sitemap_time:.3f}s (target: < {sitemap_target}s)")
-            results.append(False)
-        
-        if robots_time <= robots_target:
-            print(f"   ✅ Robots.txt performance: {robots_time:.3f}s (target: < {robots_target}s)")
-        else:
-            print(f"   ❌ Robots.txt performance: {robots_time:.3f}s (target: < {robots_target}s)")
-            results.append(False)
-        
-        # Compare with baseline
-        sitemap_overhead = sitemap_time - baseline_time
-        robots_overhead = robots_time - baseline_time
-        
-        print(f"   Sitemap overhead: {sitemap_overhead:.3f}s")
-        print(f"   Robots.txt overhead: {robots_overhead:.3f}s")
-        
-        if sitemap_overhead < 1.0:
-            print(f"   ✅ Sitemap overhead acceptable")
-        else:
-            print(f"   ⚠️ Sitemap overhead high: {sitemap_overhead:.3f}s")
-        
-        if robots_overhead < 0.5:
-            print(f"   ✅ Robots.txt overhead acceptable")
-        else:
-            print(f"   ⚠️ Robots.txt overhead high: {robots_overhead:.3f}s")
-        
-        return all(results)
-
+    @buffered_output
     def test_json_ld_tools_api_endpoints(self):
         """Test JSON-LD functionality in production build for tools API endpoints - CRITICAL REVIEW REQUEST"""
-        print("\n🔍 JSON-LD TOOLS API ENDPOINTS TESTING - CRITICAL REVIEW")
-        print("=" * 70)
-        print("Testing that all tools API endpoints now return json_ld field in response")
-        print("This resolves: 'ToolResponse model is missing the json_ld field, preventing frontend access to JSON-LD data'")
-        print("-" * 70)
+        logger.info("\n🔍 JSON-LD TOOLS API ENDPOINTS TESTING - CRITICAL REVIEW")
+        logger.info("=" * 70)
+        logger.info("Testing that all tools API endpoints now return json_ld field in response")
+        logger.info("This resolves: 'ToolResponse model is missing the json_ld field, preventing frontend access to JSON-LD data'")
+        logger.info("-" * 70)
         
         results = []
         json_ld_findings = {
@@ -2518,7 +2695,7 @@ class MarketMindAPITester:
         }
         
         # Test 1: GET /api/tools (list tools) - check that json_ld field is present in response
-        print("\n1️⃣ TESTING: GET /api/tools (list tools)")
+        logger.info("\n1️⃣ TESTING: GET /api/tools (list tools)")
         success, response = self.run_test(
             "Tools List - JSON-LD Field Check",
             "GET",
@@ -2530,65 +2707,74 @@ class MarketMindAPITester:
         json_ld_findings['endpoints_tested'] += 1
         
         if success and isinstance(response, list):
-            print(f"   Found {len(response)} tools in list")
+            # Same query as sample_tools(), so later tests can reuse this page
+            self._sample_tools = response
+            logger.info(f"   Found {len(response)} tools in list")
             json_ld_field_present = False
             tools_with_data = 0
             
             for i, tool in enumerate(response):
+                name = tool.get('name', 'Unknown')
                 if 'json_ld' in tool:
                     json_ld_field_present = True
                     json_ld_findings['total_tools_tested'] += 1
                     
-                    if tool['json_ld'] and isinstance(tool['json_ld'], dict):
+                    json_ld_data = tool['json_ld']
+                    if json_ld_data and isinstance(json_ld_data, dict):
                         tools_with_data += 1
                         json_ld_findings['tools_with_json_ld_data'] += 1
                         
                         # Analyze JSON-LD structure
-                        json_ld_data = tool['json_ld']
                         structure_info = {
-                            'tool_name': tool.get('name', 'Unknown'),
-                            'has_context': '@context' in json_ld_data,
-                            'has_type': '@type' in json_ld_data,
-                            'has_name': 'name' in json_ld_data,
-                            'has_description': 'description' in json_ld_data,
-                            'has_url': 'url' in json_ld_data,
-                            'has_application_category': 'applicationCategory' in json_ld_data,
-                            'keys_count': len(json_ld_data.keys())
+                            'tool_name': name,
+                            'present_fields': json_ld_data.keys() & _TOOL_JSON_LD_SEO_FIELDS,
+                            'keys_count': len(json_ld_data)
                         }
                         json_ld_findings['json_ld_structures_found'].append(structure_info)
                         
-                        print(f"   Tool {i+1} ({tool.get('name', 'Unknown')}): ✅ json_ld field present with {len(json_ld_data)} keys")
-                        if structure_info['has_context'] and structure_info['has_type']:
-                            print(f"      ✅ Valid JSON-LD structure (@context: {json_ld_data.get('@context')}, @type: {json_ld_data.get('@type')})")
+                        logger.info(f"   Tool {i+1} ({name}): ✅ json_ld field present with {len(json_ld_data)} keys")
+                        if {'@context', '@type'} <= structure_info['present_fields']:
+                            logger.info(f"      ✅ Valid JSON-LD structure (@context: {json_ld_data.get('@context')}, @type: {json_ld_data.get('@type')})")
                     else:
-                        print(f"   Tool {i+1} ({tool.get('name', 'Unknown')}): ⚠️ json_ld field present but empty/null")
+                        logger.info(f"   Tool {i+1} ({name}): ⚠️ json_ld field present but empty/null")
                 else:
-                    print(f"   Tool {i+1} ({tool.get('name', 'Unknown')}): ❌ json_ld field MISSING")
+                    logger.info(f"   Tool {i+1} ({name}): ❌ json_ld field MISSING")
             
             if json_ld_field_present:
                 json_ld_findings['endpoints_with_json_ld'] += 1
-                print(f"   ✅ CRITICAL FIX VERIFIED: json_ld field is present in GET /api/tools response")
-                print(f"   📊 {tools_with_data}/{len(response)} tools have JSON-LD data")
+                logger.info(f"   ✅ CRITICAL FIX VERIFIED: json_ld field is present in GET /api/tools response")
+                logger.info(f"   📊 {tools_with_data}/{len(response)} tools have JSON-LD data")
             else:
-                print(f"   ❌ CRITICAL ISSUE: json_ld field is MISSING from GET /api/tools response")
+                logger.info(f"   ❌ CRITICAL ISSUE: json_ld field is MISSING from GET /api/tools response")
                 results.append(False)
         
-        # Test 2: GET /api/tools/{tool_id} (get tool by ID) - check json_ld field
-        print("\n2️⃣ TESTING: GET /api/tools/{tool_id} (get tool by ID)")
-        
-        # First get a tool ID from the list
-        if success and isinstance(response, list) and len(response) > 0:
-            test_tool = response[0]
+        # Tests 2-5 only need IDs from the list above and are independent of each
+        # other, so they are fetched in one concurrent batch and analysed in order below
+        tools = response if success and isinstance(response, list) else []
+        specs = {}
+        if tools:
+            test_tool = tools[0]
             tool_id = test_tool['id']
+            tool_slug = test_tool.get('slug', 'unknown-slug')
             tool_name = test_tool.get('name', 'Unknown')
-            
-            success2, tool_response = self.run_test(
-                "Tool by ID - JSON-LD Field Check",
-                "GET",
-                f"tools/{tool_id}",
-                200,
-                description=f"CRITICAL: Test that GET /api/tools/{tool_id} returns json_ld field"
-            )
+            specs['by_id'] = ("Tool by ID - JSON-LD Field Check", "GET", f"tools/{tool_id}", 200,
+                              {'description': f"CRITICAL: Test that GET /api/tools/{tool_id} returns json_ld field"})
+            specs['by_slug'] = ("Tool by Slug - JSON-LD Field Check", "GET", f"tools/by-slug/{tool_slug}", 200,
+                                {'description': f"CRITICAL: Test that GET /api/tools/by-slug/{tool_slug} returns json_ld field"})
+        if len(tools) >= 2:
+            # Get first two tools for comparison
+            tool_ids_str = ",".join([tools[0]['id'], tools[1]['id']])
+            specs['compare'] = ("Tools Compare - JSON-LD Field Check", "GET", f"tools/compare?tool_ids={tool_ids_str}", 200,
+                                {'description': f"CRITICAL: Test that GET /api/tools/compare returns json_ld field for each tool"})
+        specs['blog'] = ("Blog JSON-LD Comparison", "GET", "blogs?limit=1", 200,
+                         {'description': "Get blog to compare JSON-LD field availability with tools"})
+        batch = dict(zip(specs, self.run_tests_parallel(list(specs.values()))))
+        
+        # Test 2: GET /api/tools/{tool_id} (get tool by ID) - check json_ld field
+        logger.info("\n2️⃣ TESTING: GET /api/tools/{tool_id} (get tool by ID)")
+        
+        if 'by_id' in batch:
+            success2, tool_response = batch['by_id']
             results.append(success2)
             json_ld_findings['endpoints_tested'] += 1
             
@@ -2597,43 +2783,32 @@ class MarketMindAPITester:
                     json_ld_findings['endpoints_with_json_ld'] += 1
                     json_ld_findings['total_tools_tested'] += 1
                     
-                    print(f"   ✅ CRITICAL FIX VERIFIED: json_ld field present in tool by ID response")
+                    logger.info(f"   ✅ CRITICAL FIX VERIFIED: json_ld field present in tool by ID response")
                     
-                    if tool_response['json_ld'] and isinstance(tool_response['json_ld'], dict):
+                    json_ld_data = tool_response['json_ld']
+                    if json_ld_data and isinstance(json_ld_data, dict):
                         json_ld_findings['tools_with_json_ld_data'] += 1
-                        json_ld_data = tool_response['json_ld']
-                        print(f"   📊 Tool '{tool_name}' has JSON-LD data with {len(json_ld_data)} keys")
+                        logger.info(f"   📊 Tool '{tool_name}' has JSON-LD data with {len(json_ld_data)} keys")
                         
                         # Check for SEO-appropriate structured data
-                        seo_fields = ['@context', '@type', 'name', 'description', 'url', 'applicationCategory']
-                        present_fields = [field for field in seo_fields if field in json_ld_data]
-                        print(f"   🔍 SEO fields present: {present_fields}")
+                        present_fields = json_ld_data.keys() & _TOOL_JSON_LD_SEO_FIELDS
+                        logger.info(f"   🔍 SEO fields present: {sorted(present_fields)}")
                         
                         if len(present_fields) >= 4:
-                            print(f"   ✅ Good JSON-LD structure for SEO ({len(present_fields)}/6 key fields)")
+                            logger.info(f"   ✅ Good JSON-LD structure for SEO ({len(present_fields)}/6 key fields)")
                         else:
-                            print(f"   ⚠️ Limited JSON-LD structure ({len(present_fields)}/6 key fields)")
+                            logger.info(f"   ⚠️ Limited JSON-LD structure ({len(present_fields)}/6 key fields)")
                     else:
-                        print(f"   ⚠️ json_ld field present but empty for tool '{tool_name}'")
+                        logger.info(f"   ⚠️ json_ld field present but empty for tool '{tool_name}'")
                 else:
-                    print(f"   ❌ CRITICAL ISSUE: json_ld field MISSING from tool by ID response")
+                    logger.info(f"   ❌ CRITICAL ISSUE: json_ld field MISSING from tool by ID response")
                     results.append(False)
         
         # Test 3: GET /api/tools/by-slug/{tool_slug} (get tool by slug) - check json_ld field
-        print("\n3️⃣ TESTING: GET /api/tools/by-slug/{tool_slug} (get tool by slug)")
+        logger.info("\n3️⃣ TESTING: GET /api/tools/by-slug/{tool_slug} (get tool by slug)")
         
-        if success and isinstance(response, list) and len(response) > 0:
-            test_tool = response[0]
-            tool_slug = test_tool.get('slug', 'unknown-slug')
-            tool_name = test_tool.get('name', 'Unknown')
-            
-            success3, slug_response = self.run_test(
-                "Tool by Slug - JSON-LD Field Check",
-                "GET",
-                f"tools/by-slug/{tool_slug}",
-                200,
-                description=f"CRITICAL: Test that GET /api/tools/by-slug/{tool_slug} returns json_ld field"
-            )
+        if 'by_slug' in batch:
+            success3, slug_response = batch['by_slug']
             results.append(success3)
             json_ld_findings['endpoints_tested'] += 1
             
@@ -2642,33 +2817,23 @@ class MarketMindAPITester:
                     json_ld_findings['endpoints_with_json_ld'] += 1
                     json_ld_findings['total_tools_tested'] += 1
                     
-                    print(f"   ✅ CRITICAL FIX VERIFIED: json_ld field present in tool by slug response")
+                    logger.info(f"   ✅ CRITICAL FIX VERIFIED: json_ld field present in tool by slug response")
                     
-                    if slug_response['json_ld'] and isinstance(slug_response['json_ld'], dict):
+                    json_ld_data = slug_response['json_ld']
+                    if json_ld_data and isinstance(json_ld_data, dict):
                         json_ld_findings['tools_with_json_ld_data'] += 1
-                        json_ld_data = slug_response['json_ld']
-                        print(f"   📊 Tool '{tool_name}' (slug: {tool_slug}) has JSON-LD data with {len(json_ld_data)} keys")
+                        logger.info(f"   📊 Tool '{tool_name}' (slug: {tool_slug}) has JSON-LD data with {len(json_ld_data)} keys")
                     else:
-                        print(f"   ⚠️ json_ld field present but empty for tool '{tool_name}'")
+                        logger.info(f"   ⚠️ json_ld field present but empty for tool '{tool_name}'")
                 else:
-                    print(f"   ❌ CRITICAL ISSUE: json_ld field MISSING from tool by slug response")
+                    logger.info(f"   ❌ CRITICAL ISSUE: json_ld field MISSING from tool by slug response")
                     results.append(False)
         
         # Test 4: GET /api/tools/compare - check json_ld field
-        print("\n4️⃣ TESTING: GET /api/tools/compare (compare tools)")
+        logger.info("\n4️⃣ TESTING: GET /api/tools/compare (compare tools)")
         
-        if success and isinstance(response, list) and len(response) >= 2:
-            # Get first two tools for comparison
-            tool_ids = [response[0]['id'], response[1]['id']]
-            tool_ids_str = ",".join(tool_ids)
-            
-            success4, compare_response = self.run_test(
-                "Tools Compare - JSON-LD Field Check",
-                "GET",
-                f"tools/compare?tool_ids={tool_ids_str}",
-                200,
-                description=f"CRITICAL: Test that GET /api/tools/compare returns json_ld field for each tool"
-            )
+        if 'compare' in batch:
+            success4, compare_response = batch['compare']
             results.append(success4)
             json_ld_findings['endpoints_tested'] += 1
             
@@ -2677,149 +2842,99 @@ class MarketMindAPITester:
                 tools_with_data = 0
                 
                 for i, tool in enumerate(compare_response):
+                    name = tool.get('name', 'Unknown')
                     if 'json_ld' in tool:
                         json_ld_field_present = True
                         json_ld_findings['total_tools_tested'] += 1
                         
-                        if tool['json_ld'] and isinstance(tool['json_ld'], dict):
+                        json_ld_data = tool['json_ld']
+                        if json_ld_data and isinstance(json_ld_data, dict):
                             tools_with_data += 1
                             json_ld_findings['tools_with_json_ld_data'] += 1
-                            print(f"   Tool {i+1} ({tool.get('name', 'Unknown')}): ✅ json_ld field with data ({len(tool['json_ld'])} keys)")
+                            logger.info(f"   Tool {i+1} ({name}): ✅ json_ld field with data ({len(json_ld_data)} keys)")
                         else:
-                            print(f"   Tool {i+1} ({tool.get('name', 'Unknown')}): ⚠️ json_ld field present but empty")
+                            logger.info(f"   Tool {i+1} ({name}): ⚠️ json_ld field present but empty")
                     else:
-                        print(f"   Tool {i+1} ({tool.get('name', 'Unknown')}): ❌ json_ld field MISSING")
+                        logger.info(f"   Tool {i+1} ({name}): ❌ json_ld field MISSING")
                 
                 if json_ld_field_present:
                     json_ld_findings['endpoints_with_json_ld'] += 1
-                    print(f"   ✅ CRITICAL FIX VERIFIED: json_ld field present in tools compare response")
-                    print(f"   📊 {tools_with_data}/{len(compare_response)} compared tools have JSON-LD data")
+                    logger.info(f"   ✅ CRITICAL FIX VERIFIED: json_ld field present in tools compare response")
+                    logger.info(f"   📊 {tools_with_data}/{len(compare_response)} compared tools have JSON-LD data")
                 else:
-                    print(f"   ❌ CRITICAL ISSUE: json_ld field MISSING from tools compare response")
+                    logger.info(f"   ❌ CRITICAL ISSUE: json_ld field MISSING from tools compare response")
                     results.append(False)
         
         # Test 5: Compare with Blog JSON-LD (verify consistency)
-        print("\n5️⃣ TESTING: Compare Tools JSON-LD with Blog JSON-LD (consistency check)")
+        logger.info("\n5️⃣ TESTING: Compare Tools JSON-LD with Blog JSON-LD (consistency check)")
         
-        blog_success, blog_response = self.run_test(
-            "Blog JSON-LD Comparison",
-            "GET",
-            "blogs?limit=1",
-            200,
-            description="Get blog to compare JSON-LD field availability with tools"
-        )
+        blog_success, blog_response = batch['blog']
         
         if blog_success and isinstance(blog_response, list) and len(blog_response) > 0:
             blog = blog_response[0]
             if 'json_ld' in blog:
-                print(f"   ✅ Blog has json_ld field - CONSISTENCY VERIFIED")
+                logger.info(f"   ✅ Blog has json_ld field - CONSISTENCY VERIFIED")
                 if blog['json_ld']:
-                    print(f"   📊 Blog JSON-LD has {len(blog['json_ld'])} keys")
-                    print(f"   🔍 Blog JSON-LD structure: {list(blog['json_ld'].keys()) if isinstance(blog['json_ld'], dict) else 'Not a dict'}")
+                    logger.info(f"   📊 Blog JSON-LD has {len(blog['json_ld'])} keys")
+                    logger.info(f"   🔍 Blog JSON-LD structure: {list(blog['json_ld'].keys()) if isinstance(blog['json_ld'], dict) else 'Not a dict'}")
                 else:
-                    print(f"   ⚠️ Blog json_ld field present but empty")
+                    logger.info(f"   ⚠️ Blog json_ld field present but empty")
             else:
-                print(f"   ❌ Blog missing json_ld field - INCONSISTENCY DETECTED")
+                logger.info(f"   ❌ Blog missing json_ld field - INCONSISTENCY DETECTED")
         
         # COMPREHENSIVE SUMMARY
-        print("\n" + "=" * 70)
-        print("📋 JSON-LD TOOLS API ENDPOINTS - COMPREHENSIVE SUMMARY")
-        print("=" * 70)
+        logger.info("\n" + "=" * 70)
+        logger.info("📋 JSON-LD TOOLS API ENDPOINTS - COMPREHENSIVE SUMMARY")
+        logger.info("=" * 70)
         
-        print(f"🔍 ENDPOINTS TESTED: {json_ld_findings['endpoints_tested']}/4")
-        print(f"✅ ENDPOINTS WITH JSON-LD FIELD: {json_ld_findings['endpoints_with_json_ld']}/{json_ld_findings['endpoints_tested']}")
-        print(f"📊 TOTAL TOOLS TESTED: {json_ld_findings['total_tools_tested']}")
-        print(f"💾 TOOLS WITH JSON-LD DATA: {json_ld_findings['tools_with_json_ld_data']}")
+        logger.info(f"🔍 ENDPOINTS TESTED: {json_ld_findings['endpoints_tested']}/4")
+        logger.info(f"✅ ENDPOINTS WITH JSON-LD FIELD: {json_ld_findings['endpoints_with_json_ld']}/{json_ld_findings['endpoints_tested']}")
+        logger.info(f"📊 TOTAL TOOLS TESTED: {json_ld_findings['total_tools_tested']}")
+        logger.info(f"💾 TOOLS WITH JSON-LD DATA: {json_ld_findings['tools_with_json_ld_data']}")
         
         if json_ld_findings['endpoints_with_json_ld'] == json_ld_findings['endpoints_tested']:
-            print(f"🎉 CRITICAL FIX VERIFIED: All tools API endpoints now return json_ld field!")
-            print(f"✅ ToolResponse model json_ld field is working in production build")
+            logger.info(f"🎉 CRITICAL FIX VERIFIED: All tools API endpoints now return json_ld field!")
+            logger.info(f"✅ ToolResponse model json_ld field is working in production build")
         else:
-            print(f"❌ CRITICAL ISSUE: Some endpoints missing json_ld field")
+            logger.info(f"❌ CRITICAL ISSUE: Some endpoints missing json_ld field")
         
         # JSON-LD Structure Analysis
         if json_ld_findings['json_ld_structures_found']:
-            print(f"\n🔍 JSON-LD STRUCTURE ANALYSIS:")
+            logger.info(f"\n🔍 JSON-LD STRUCTURE ANALYSIS:")
             for structure in json_ld_findings['json_ld_structures_found'][:3]:  # Show first 3
-                print(f"   Tool: {structure['tool_name']}")
-                print(f"   - @context: {'✅' if structure['has_context'] else '❌'}")
-                print(f"   - @type: {'✅' if structure['has_type'] else '❌'}")
-                print(f"   - name: {'✅' if structure['has_name'] else '❌'}")
-                print(f"   - description: {'✅' if structure['has_description'] else '❌'}")
-                print(f"   - url: {'✅' if structure['has_url'] else '❌'}")
-                print(f"   - applicationCategory: {'✅' if structure['has_application_category'] else '❌'}")
-                print(f"   - Total keys: {structure['keys_count']}")
-                print()
+                present = structure['present_fields']
+                field_lines = "".join(
+                    f"\n   - {field}: {_CHECK_GLYPH[field in present]}" for field in _TOOL_JSON_LD_SEO_FIELDS
+                )
+                logger.info(f"   Tool: {structure['tool_name']}{field_lines}\n   - Total keys: {structure['keys_count']}\n")
         
         # Production Build Readiness
-        print(f"🚀 PRODUCTION BUILD READINESS:")
+        logger.info(f"🚀 PRODUCTION BUILD READINESS:")
         if all(results):
-            print(f"   ✅ All tools API endpoints return json_ld field")
-            print(f"   ✅ Frontend can now access JSON-LD data in production")
-            print(f"   ✅ SEO structured data available for all tool pages")
-            print(f"   ✅ Critical issue 'ToolResponse model missing json_ld field' RESOLVED")
+            logger.info(f"   ✅ All tools API endpoints return json_ld field")
+            logger.info(f"   ✅ Frontend can now access JSON-LD data in production")
+            logger.info(f"   ✅ SEO structured data available for all tool pages")
+            logger.info(f"   ✅ Critical issue 'ToolResponse model missing json_ld field' RESOLVED")
         else:
-            print(f"   ❌ Some endpoints still missing json_ld field")
-            print(f"   ❌ Frontend may still have issues accessing JSON-LD data")
+            logger.info(f"   ❌ Some endpoints still missing json_ld field")
+            logger.info(f"   ❌ Frontend may still have issues accessing JSON-LD data")
         
         return all(results)
 
+    @buffered_output
     def test_json_ld_auto_generation(self):
         """Test the new JSON-LD auto-generation functionality as requested in review"""
-        print("\n🔍 JSON-LD AUTO-GENERATION TESTING")
-        print("=" * 60)
+        logger.info("\n🔍 JSON-LD AUTO-GENERATION TESTING")
+        logger.info("=" * 60)
         
         if self.current_user_role != 'superadmin':
-            print("❌ Skipping JSON-LD generation tests - insufficient permissions")
+            logger.info("❌ Skipping JSON-LD generation tests - insufficient permissions")
             return False
         
         results = []
         
-        # Test 1: Generate JSON-LD for tools only
-        success, response = self.run_test(
-            "JSON-LD Generation - Tools Only",
-            "POST",
-            "superadmin/seo/generate-json-ld?content_type=tools&limit=10",
-            200,
-            description="Test POST /api/superadmin/seo/generate-json-ld with content_type=tools"
-        )
-        results.append(success)
-        
-        if success and isinstance(response, dict):
-            tools_updated = response.get('results', {}).get('tools_updated', 0)
-            print(f"   ✅ Tools updated with JSON-LD: {tools_updated}")
-            if 'errors' in response.get('results', {}):
-                errors = response['results']['errors']
-                if errors:
-                    print(f"   ⚠️ Errors encountered: {len(errors)}")
-                    for error in errors[:3]:  # Show first 3 errors
-                        print(f"     - {error}")
-                else:
-                    print(f"   ✅ No errors during tools JSON-LD generation")
-        
-        # Test 2: Generate JSON-LD for blogs only
-        success, response = self.run_test(
-            "JSON-LD Generation - Blogs Only",
-            "POST",
-            "superadmin/seo/generate-json-ld?content_type=blogs&limit=10",
-            200,
-            description="Test POST /api/superadmin/seo/generate-json-ld with content_type=blogs"
-        )
-        results.append(success)
-        
-        if success and isinstance(response, dict):
-            blogs_updated = response.get('results', {}).get('blogs_updated', 0)
-            print(f"   ✅ Blogs updated with JSON-LD: {blogs_updated}")
-            if 'errors' in response.get('results', {}):
-                errors = response['results']['errors']
-                if errors:
-                    print(f"   ⚠️ Errors encountered: {len(errors)}")
-                    for error in errors[:3]:  # Show first 3 errors
-                        print(f"     - {error}")
-                else:
-                    print(f"   ✅ No errors during blogs JSON-LD generation")
-        
-        # Test 3: Generate JSON-LD for all content types
+        # One content_type=all call runs both the tools and the blogs branch server-side,
+        # so separate tools-only and blogs-only calls would only repeat that work
         success, response = self.run_test(
             "JSON-LD Generation - All Content",
             "POST",
@@ -2835,105 +2950,79 @@ class MarketMindAPITester:
             blogs_updated = results_data.get('blogs_updated', 0)
             total_updated = results_data.get('total_updated', 0)
             
-            print(f"   ✅ Total items updated with JSON-LD: {total_updated}")
-            print(f"     - Tools: {tools_updated}")
-            print(f"     - Blogs: {blogs_updated}")
+            logger.info(f"   ✅ Total items updated with JSON-LD: {total_updated}")
+            logger.info(f"     - Tools: {tools_updated}")
+            logger.info(f"     - Blogs: {blogs_updated}")
             
             if 'errors' in results_data:
                 errors = results_data['errors']
                 if errors:
-                    print(f"   ⚠️ Total errors encountered: {len(errors)}")
+                    logger.info(f"   ⚠️ Total errors encountered: {len(errors)}")
                     for error in errors[:3]:  # Show first 3 errors
-                        print(f"     - {error}")
+                        logger.info(f"     - {error}")
                 else:
-                    print(f"   ✅ No errors during JSON-LD generation")
+                    logger.info(f"   ✅ No errors during JSON-LD generation")
         
-        # Test 4: Verify JSON-LD data is properly stored in database
-        print("\n   🔍 VERIFYING JSON-LD DATA IN DATABASE:")
+        # Verify JSON-LD data is properly stored in database
+        logger.info("\n   🔍 VERIFYING JSON-LD DATA IN DATABASE:")
         
-        # Get a tool to verify JSON-LD was stored
-        success_tools, tools_response = self.run_test(
-            "Get Tools for JSON-LD Verification",
-            "GET",
-            "tools?limit=3",
-            200,
-            description="Get tools to verify JSON-LD data storage"
-        )
+        # Get a tool to verify JSON-LD was stored; the generation call above invalidated any earlier page
+        success_tools, tools_response = self.sample_tools(2)
         
         if success_tools and isinstance(tools_response, list) and len(tools_response) > 0:
-            for i, tool in enumerate(tools_response[:2]):
-                tool_id = tool['id']
+            # List rows carry the stored json_ld (same ToolResponse model as tools/{id}), so no detail GET
+            for tool in tools_response[:2]:
                 tool_name = tool.get('name', 'Unknown')
                 
-                success_detail, tool_detail = self.run_test(
-                    f"Verify Tool JSON-LD Data - {tool_name}",
-                    "GET",
-                    f"tools/{tool_id}",
-                    200,
-                    description=f"Verify JSON-LD data for tool: {tool_name}"
-                )
-                
-                if success_detail and isinstance(tool_detail, dict):
-                    json_ld = tool_detail.get('json_ld')
-                    if json_ld and isinstance(json_ld, dict) and len(json_ld) > 0:
-                        print(f"   ✅ Tool '{tool_name}' has JSON-LD data ({len(json_ld)} fields)")
-                        # Check for required JSON-LD fields
-                        required_fields = ['@context', '@type', 'name']
-                        missing_fields = [field for field in required_fields if field not in json_ld]
-                        if missing_fields:
-                            print(f"     ⚠️ Missing required JSON-LD fields: {missing_fields}")
-                        else:
-                            print(f"     ✅ All required JSON-LD fields present")
+                json_ld = tool.get('json_ld')
+                if json_ld and isinstance(json_ld, dict) and len(json_ld) > 0:
+                    logger.info(f"   ✅ Tool '{tool_name}' has JSON-LD data ({len(json_ld)} fields)")
+                    # Check for required JSON-LD fields
+                    missing_fields = _TOOL_JSON_LD_REQUIRED - json_ld.keys()
+                    if missing_fields:
+                        logger.info(f"     ⚠️ Missing required JSON-LD fields: {sorted(missing_fields)}")
                     else:
-                        print(f"   ❌ Tool '{tool_name}' missing or empty JSON-LD data")
-                        results.append(False)
+                        logger.info(f"     ✅ All required JSON-LD fields present")
+                else:
+                    logger.info(f"   ❌ Tool '{tool_name}' missing or empty JSON-LD data")
+                    results.append(False)
         
         # Get a blog to verify JSON-LD was stored
         success_blogs, blogs_response = self.run_test(
             "Get Blogs for JSON-LD Verification",
             "GET",
-            "blogs?limit=3",
+            "blogs?limit=2",
             200,
             description="Get blogs to verify JSON-LD data storage"
         )
         
         if success_blogs and isinstance(blogs_response, list) and len(blogs_response) > 0:
-            for i, blog in enumerate(blogs_response[:2]):
-                blog_id = blog['id']
+            for blog in blogs_response[:2]:
                 blog_title = blog.get('title', 'Unknown')
                 
-                success_detail, blog_detail = self.run_test(
-                    f"Verify Blog JSON-LD Data - {blog_title[:30]}",
-                    "GET",
-                    f"blogs/{blog_id}",
-                    200,
-                    description=f"Verify JSON-LD data for blog: {blog_title[:30]}..."
-                )
-                
-                if success_detail and isinstance(blog_detail, dict):
-                    json_ld = blog_detail.get('json_ld')
-                    if json_ld and isinstance(json_ld, dict) and len(json_ld) > 0:
-                        print(f"   ✅ Blog '{blog_title[:30]}...' has JSON-LD data ({len(json_ld)} fields)")
-                        # Check for required JSON-LD fields
-                        required_fields = ['@context', '@type', 'headline']
-                        missing_fields = [field for field in required_fields if field not in json_ld]
-                        if missing_fields:
-                            print(f"     ⚠️ Missing required JSON-LD fields: {missing_fields}")
-                        else:
-                            print(f"     ✅ All required JSON-LD fields present")
+                json_ld = blog.get('json_ld')
+                if json_ld and isinstance(json_ld, dict) and len(json_ld) > 0:
+                    logger.info(f"   ✅ Blog '{blog_title[:30]}...' has JSON-LD data ({len(json_ld)} fields)")
+                    # Check for required JSON-LD fields
+                    missing_fields = _BLOG_JSON_LD_REQUIRED - json_ld.keys()
+                    if missing_fields:
+                        logger.info(f"     ⚠️ Missing required JSON-LD fields: {sorted(missing_fields)}")
                     else:
-                        print(f"   ❌ Blog '{blog_title[:30]}...' missing or empty JSON-LD data")
-                        results.append(False)
+                        logger.info(f"     ✅ All required JSON-LD fields present")
+                else:
+                    logger.info(f"   ❌ Blog '{blog_title[:30]}...' missing or empty JSON-LD data")
+                    results.append(False)
         
         return all(results)
 
+    @buffered_output
     def test_tool_comments_functionality(self):
         """Test tool comments functionality as requested in review"""
-        print("\n🔍 TOOL COMMENTS FUNCTIONALITY TESTING")
-        print("=" * 60)
+        logger.info("\n🔍 TOOL COMMENTS FUNCTIONALITY TESTING")
+        logger.info("=" * 60)
         
         if not self.token:
-            print("❌ Skipping tool comments tests - no authentication token")
+            logger.info("❌ Skipping tool comments tests - no authentication token")
             return False
         
         results = []
@@ -2953,8 +3042,8 @@ class MarketMindAPITester:
             tool_slug = tool.get('slug', 'unknown-slug')
             tool_name = tool.get('name', 'Unknown Tool')
             
-            print(f"   Testing comments on tool: {tool_name}")
-            print(f"   Tool slug: {tool_slug}")
+            logger.info(f"   Testing comments on tool: {tool_name}")
+            logger.info(f"   Tool slug: {tool_slug}")
             
             # Test 1: Get existing comments (should work even if empty)
             success, comments_response = self.run_test(
@@ -2967,12 +3056,12 @@ class MarketMindAPITester:
             results.append(success)
             
             if success and isinstance(comments_response, list):
-                print(f"   ✅ Found {len(comments_response)} existing comments")
+                logger.info(f"   ✅ Found {len(comments_response)} existing comments")
                 for comment in comments_response[:3]:  # Show first 3 comments
-                    print(f"     - Comment: {comment.get('content', 'No content')[:50]}...")
+                    logger.info(f"     - Comment: {comment.get('content', 'No content')[:50]}...")
             
             # Test 2: Create a new comment
-            timestamp = datetime.now().strftime('%H%M%S')
+            timestamp = self._unique_suffix()
             comment_data = {
                 "content": f"This is a test comment created at {timestamp} for automated testing of tool comments functionality. The tool works great!",
                 "parent_id": None  # Root comment
@@ -2990,10 +3079,10 @@ class MarketMindAPITester:
             
             if success and isinstance(comment_response, dict):
                 comment_id = comment_response.get('id')
-                print(f"   ✅ Comment created successfully")
-                print(f"     - Comment ID: {comment_id}")
-                print(f"     - Content: {comment_response.get('content', 'No content')[:50]}...")
-                print(f"     - Author: {comment_response.get('user', {}).get('username', 'Unknown')}")
+                logger.info(f"   ✅ Comment created successfully")
+                logger.info(f"     - Comment ID: {comment_id}")
+                logger.info(f"     - Content: {comment_response.get('content', 'No content')[:50]}...")
+                logger.info(f"     - Author: {comment_response.get('user', {}).get('username', 'Unknown')}")
                 
                 # Test 3: Create a reply to the comment
                 reply_data = {
@@ -3012,10 +3101,10 @@ class MarketMindAPITester:
                 results.append(success)
                 
                 if success and isinstance(reply_response, dict):
-                    print(f"   ✅ Reply created successfully")
-                    print(f"     - Reply ID: {reply_response.get('id')}")
-                    print(f"     - Parent ID: {reply_response.get('parent_id')}")
-                    print(f"     - Content: {reply_response.get('content', 'No content')[:50]}...")
+                    logger.info(f"   ✅ Reply created successfully")
+                    logger.info(f"     - Reply ID: {reply_response.get('id')}")
+                    logger.info(f"     - Parent ID: {reply_response.get('parent_id')}")
+                    logger.info(f"     - Content: {reply_response.get('content', 'No content')[:50]}...")
             
             # Test 4: Get comments again to verify new comments appear
             success, updated_comments = self.run_test(
@@ -3028,20 +3117,21 @@ class MarketMindAPITester:
             results.append(success)
             
             if success and isinstance(updated_comments, list):
-                print(f"   ✅ Updated comments count: {len(updated_comments)}")
+                logger.info(f"   ✅ Updated comments count: {len(updated_comments)}")
                 # Check if our new comments are present
                 new_comments = [c for c in updated_comments if timestamp in c.get('content', '')]
-                print(f"   ✅ New comments found: {len(new_comments)}")
+                logger.info(f"   ✅ New comments found: {len(new_comments)}")
         
         return all(results)
 
+    @buffered_output
     def test_super_admin_bulk_upload(self):
         """Test super admin bulk upload functionality as requested in review"""
-        print("\n🔍 SUPER ADMIN BULK UPLOAD TESTING")
-        print("=" * 60)
+        logger.info("\n🔍 SUPER ADMIN BULK UPLOAD TESTING")
+        logger.info("=" * 60)
         
         if self.current_user_role != 'superadmin':
-            print("❌ Skipping bulk upload tests - insufficient permissions")
+            logger.info("❌ Skipping bulk upload tests - insufficient permissions")
             return False
         
         results = []
@@ -3057,24 +3147,33 @@ class MarketMindAPITester:
         results.append(success)
         
         if success:
-            print(f"   ✅ CSV template downloaded successfully")
+            logger.info(f"   ✅ CSV template downloaded successfully")
             if isinstance(template_response, str):
-                lines = template_response.split('\n')
-                print(f"   Template has {len(lines)} lines")
-                if lines:
-                    print(f"   Header: {lines[0][:100]}...")
+                # Count lines and take the header without splitting the whole body into a list
+                header_line = template_response.partition('\n')[0]
+                line_count = template_response.count('\n') + 1
+                logger.info(f"   Template has {line_count} lines")
+                logger.info(f"   Header: {header_line[:100]}...")
         
         # Test 2: Test bulk upload with sample data
         # Create sample CSV data
-        timestamp = datetime.now().strftime('%H%M%S')
-        csv_data = f"""name,description,short_description,url,pricing_type,features,pros,cons,is_featured,is_active
-Test Bulk Tool {timestamp},This is a test tool created via bulk upload for automated testing,Test tool for bulk upload,https://example.com/test-bulk-{timestamp},free,"Feature 1,Feature 2,Feature 3","Pro 1,Pro 2","Con 1",false,true
-Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another test tool,https://example.com/test-bulk-2-{timestamp},paid,"Feature A,Feature B","Pro A","Con A",true,true"""
+        timestamp = self._unique_suffix()
+        csv_data = csv_bytes(
+            ('name', 'description', 'short_description', 'url', 'pricing_type', 'features', 'pros', 'cons',
+             'is_featured', 'is_active'),
+            [
+                (f"Test Bulk Tool {timestamp}", "This is a test tool created via bulk upload for automated testing",
+                 "Test tool for bulk upload", f"https://example.com/test-bulk-{timestamp}", "free",
+                 "Feature 1,Feature 2,Feature 3", "Pro 1,Pro 2", "Con 1", "false", "true"),
+                (f"Test Bulk Tool 2 {timestamp}", "Another test tool created via bulk upload", "Another test tool",
+                 f"https://example.com/test-bulk-2-{timestamp}", "paid",
+                 "Feature A,Feature B", "Pro A", "Con A", "true", "true"),
+            ]
+        )
         
         # Test bulk upload (this might require file upload, so we'll test the endpoint)
         try:
-            import io
-            csv_file = io.StringIO(csv_data)
+            csv_file = io.BytesIO(csv_data)
             
             # For testing purposes, we'll test if the endpoint exists and handles requests
             # Note: Actual file upload testing might require different approach
@@ -3089,131 +3188,96 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             # If we get 422, it means endpoint exists but expects file
             if not success:
                 # Try to see what error we get
-                print(f"   ℹ️ Bulk upload endpoint response indicates file upload required")
+                logger.info(f"   ℹ️ Bulk upload endpoint response indicates file upload required")
                 results.append(True)  # Endpoint exists and responds appropriately
             else:
                 results.append(success)
                 if isinstance(upload_response, dict):
                     created_count = upload_response.get('created_count', 0)
-                    print(f"   ✅ Bulk upload completed: {created_count} tools created")
+                    logger.info(f"   ✅ Bulk upload completed: {created_count} tools created")
                     
         except Exception as e:
-            print(f"   ⚠️ Bulk upload test limited due to file upload requirements: {str(e)}")
+            logger.info(f"   ⚠️ Bulk upload test limited due to file upload requirements: {str(e)}")
             results.append(True)  # Don't fail the test for this limitation
         
         return all(results)
 
+    @buffered_output
     def test_production_readiness_check(self):
         """Test key production features as requested in review"""
-        print("\n🔍 PRODUCTION READINESS CHECK")
-        print("=" * 60)
+        logger.info("\n🔍 PRODUCTION READINESS CHECK")
+        logger.info("=" * 60)
         
         results = []
         
-        # Test 1: SEO functionality
-        print("\n   📊 SEO FUNCTIONALITY:")
-        seo_tests = [
-            ("Sitemap Generation", "GET", "sitemap.xml", 200),
-            ("Robots.txt Generation", "GET", "robots.txt", 200),
+        # Each group's probes are independent reads and go out as one concurrent batch, run
+        # after the group's heading so every request report sits under the heading it belongs to
+        readiness_groups = [
+            ("seo", "📊 SEO FUNCTIONALITY", [
+                ("Sitemap Generation", "sitemap.xml", "Test Sitemap Generation for production readiness"),
+                ("Robots.txt Generation", "robots.txt", "Test Robots.txt Generation for production readiness"),
+            ]),
+            ("auth", "🔐 AUTHENTICATION & AUTHORIZATION", [
+                ("Current User Authentication", "auth/me", "Verify authentication is working"),
+            ]),
+            ("crud", "🔧 CORE CRUD OPERATIONS", [
+                ("Get Tools", "tools?limit=5", "Test Get Tools CRUD operation"),
+                ("Get Blogs", "blogs?limit=5", "Test Get Blogs CRUD operation"),
+                ("Get Categories", "categories", "Test Get Categories CRUD operation"),
+            ]),
+            ("admin", "👑 SUPER ADMIN FUNCTIONALITY", [
+                ("SEO Overview", "superadmin/seo/overview", "Test SEO Overview super admin functionality"),
+                ("SEO Issues", "superadmin/seo/issues", "Test SEO Issues super admin functionality"),
+                ("Users Management", "superadmin/users", "Test Users Management super admin functionality"),
+                ("Tools Management", "superadmin/tools", "Test Tools Management super admin functionality"),
+            ]),
+            ("database", "🗄️ DATABASE CONNECTIVITY", [
+                ("Health Check with Database", "health", "Verify database connectivity"),
+            ]),
         ]
-        
-        for test_name, method, endpoint, expected_status in seo_tests:
-            success, response = self.run_test(
-                test_name,
-                method,
-                endpoint,
-                expected_status,
-                description=f"Test {test_name} for production readiness"
-            )
-            results.append(success)
-        
-        # Test 2: Authentication and authorization
-        print("\n   🔐 AUTHENTICATION & AUTHORIZATION:")
-        if self.token:
-            success, response = self.run_test(
-                "Current User Authentication",
-                "GET",
-                "auth/me",
-                200,
-                description="Verify authentication is working"
-            )
-            results.append(success)
-            
-            if success and isinstance(response, dict):
-                user_role = response.get('role', 'unknown')
-                print(f"   ✅ Authenticated as: {user_role}")
-        
-        # Test 3: Core CRUD operations
-        print("\n   🔧 CORE CRUD OPERATIONS:")
-        crud_tests = [
-            ("Get Tools", "GET", "tools?limit=5", 200),
-            ("Get Blogs", "GET", "blogs?limit=5", 200),
-            ("Get Categories", "GET", "categories", 200),
-        ]
-        
-        for test_name, method, endpoint, expected_status in crud_tests:
-            success, response = self.run_test(
-                test_name,
-                method,
-                endpoint,
-                expected_status,
-                description=f"Test {test_name} CRUD operation"
-            )
-            results.append(success)
-            
-            if success and isinstance(response, list):
-                print(f"   ✅ {test_name}: {len(response)} items retrieved")
-        
-        # Test 4: Super admin functionality (if applicable)
-        if self.current_user_role == 'superadmin':
-            print("\n   👑 SUPER ADMIN FUNCTIONALITY:")
-            admin_tests = [
-                ("SEO Overview", "GET", "superadmin/seo/overview", 200),
-                ("SEO Issues", "GET", "superadmin/seo/issues", 200),
-                ("Users Management", "GET", "superadmin/users", 200),
-                ("Tools Management", "GET", "superadmin/tools", 200),
-            ]
-            
-            for test_name, method, endpoint, expected_status in admin_tests:
-                success, response = self.run_test(
-                    test_name,
-                    method,
-                    endpoint,
-                    expected_status,
-                    description=f"Test {test_name} super admin functionality"
-                )
+        skipped_groups = set()
+        if not self.token:
+            skipped_groups.add("auth")
+        if self.current_user_role != 'superadmin':
+            skipped_groups.add("admin")
+        
+        for group, title, tests in readiness_groups:
+            if group in skipped_groups:
+                continue
+            logger.info(f"\n   {title}:")
+            group_results = self.run_tests_parallel([
+                (name, "GET", endpoint, 200, {'description': description})
+                for name, endpoint, description in tests
+            ])
+            
+            for (test_name, _, _), (success, response) in zip(tests, group_results):
                 results.append(success)
-        
-        # Test 5: Database connectivity
-        print("\n   🗄️ DATABASE CONNECTIVITY:")
-        success, response = self.run_test(
-            "Health Check with Database",
-            "GET",
-            "health",
-            200,
-            description="Verify database connectivity"
-        )
-        results.append(success)
-        
-        if success and isinstance(response, dict):
-            db_status = response.get('database', 'unknown')
-            print(f"   ✅ Database status: {db_status}")
+                if not success:
+                    continue
+                
+                if group == "auth" and isinstance(response, dict):
+                    logger.info(f"   ✅ Authenticated as: {response.get('role', 'unknown')}")
+                elif group == "crud" and isinstance(response, list):
+                    logger.info(f"   ✅ {test_name}: {len(response)} items retrieved")
+                elif group == "database" and isinstance(response, dict):
+                    logger.info(f"   ✅ Database status: {response.get('database', 'unknown')}")
         
         return all(results)
 
+    @buffered_output
     def test_new_seo_features_comprehensive(self):
         """Test NEW SEO features as requested in review - Internal Links, SEO Score, Page Analysis"""
-        print("\n🔍 NEW SEO FEATURES COMPREHENSIVE TESTING")
-        print("=" * 60)
+        logger.info("\n🔍 NEW SEO FEATURES COMPREHENSIVE TESTING")
+        logger.info("=" * 60)
         
         if not self.token:
-            print("❌ Skipping new SEO features tests - no authentication token")
+            logger.info("❌ Skipping new SEO features tests - no authentication token")
             return False
         
         results = []
         
         # Test 1: Internal Linking Suggestions API
-        print("\n1️⃣ Testing POST /api/seo/internal-links/suggestions")
+        logger.info("\n1️⃣ Testing POST /api/seo/internal-links/suggestions")
         sample_content = {
             "content": "Remote work has revolutionized how we approach productivity. Tools like Notion help teams organize their workflows, while Slack facilitates communication. Project management becomes easier with dedicated software, and design tools like Figma enable collaborative creativity. These productivity tools are essential for modern remote teams.",
             "title": "Best Productivity Tools for Remote Work in 2024",
@@ -3229,19 +3293,19 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             data=sample_content,
             description="Test internal link suggestions with sample productivity content"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success and isinstance(response, list):
-            print(f"   ✅ Found {len(response)} internal link suggestions")
+            logger.info(f"   ✅ Found {len(response)} internal link suggestions")
             for i, suggestion in enumerate(response[:3]):
-                print(f"   - Suggestion {i+1}: {suggestion.get('target_title', 'Unknown')} ({suggestion.get('target_type', 'Unknown')}) - Relevance: {suggestion.get('relevance_score', 0):.2f}")
+                logger.info(f"   - Suggestion {i+1}: {suggestion.get('target_title', 'Unknown')} ({suggestion.get('target_type', 'Unknown')}) - Relevance: {suggestion.get('relevance_score', 0):.2f}")
             
             # Verify suggestion structure
-            if response and all(key in response[0] for key in ['target_url', 'target_title', 'target_type', 'anchor_text', 'relevance_score']):
-                print(f"   ✅ Suggestion structure is correct")
+            if response and _LINK_SUGGESTION_KEYS <= response[0].keys():
+                logger.info(f"   ✅ Suggestion structure is correct")
             else:
-                print(f"   ❌ Suggestion structure missing required fields")
-                results.append(False)
+                logger.info(f"   ❌ Suggestion structure missing required fields")
+                self.add_result(results, False)
         
         # Test 2: Internal Link Suggestions with Parameters
         success, response = self.run_test(
@@ -3252,139 +3316,118 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             data=sample_content,
             description="Test internal link suggestions with custom parameters"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success and isinstance(response, list):
-            print(f"   ✅ Found {len(response)} suggestions with custom parameters (max 5, min relevance 0.5)")
+            logger.info(f"   ✅ Found {len(response)} suggestions with custom parameters (max 5, min relevance 0.5)")
             if len(response) <= 5:
-                print(f"   ✅ Respects max_suggestions parameter")
+                logger.info(f"   ✅ Respects max_suggestions parameter")
             else:
-                print(f"   ❌ Exceeds max_suggestions parameter")
-                results.append(False)
+                logger.info(f"   ❌ Exceeds max_suggestions parameter")
+                self.add_result(results, False)
         
-        # Test 3: SEO Score Calculator for Tool
-        print("\n2️⃣ Testing GET /api/seo/score/tool/{tool_id}")
+        # Tests 3-6 are independent reads of fixed content, so fetch them in one concurrent batch
         test_tool_id = "f1ceb535-8f03-463f-bda6-79bc4949bd0b"  # Updated Test Tool 074703
+        test_blog_id = "e0353e91-295c-4b05-a397-2a8c3e93d090"  # Updated Test Blog for Like Count 095851
+        tool_url = "/tools/updated-test-tool-074703"
+        blog_url = "/blogs/updated-test-blog-for-like-count-095851"
+        score_tool, score_blog, analyze_tool, analyze_blog = self.run_tests_parallel([
+            ("SEO Score Calculator - Tool", "GET", f"seo/score/tool/{test_tool_id}", 200,
+             {'description': f"Test SEO score calculation for tool {test_tool_id}"}),
+            ("SEO Score Calculator - Blog", "GET", f"seo/score/blog/{test_blog_id}", 200,
+             {'description': f"Test SEO score calculation for blog {test_blog_id}"}),
+            ("Page Analysis - Tool URL", "GET", f"seo/analyze-page?url={tool_url}", 200,
+             {'description': f"Test page analysis for tool URL: {tool_url}"}),
+            ("Page Analysis - Blog URL", "GET", f"seo/analyze-page?url={blog_url}", 200,
+             {'description': f"Test page analysis for blog URL: {blog_url}"}),
+        ])
         
-        success, response = self.run_test(
-            "SEO Score Calculator - Tool",
-            "GET",
-            f"seo/score/tool/{test_tool_id}",
-            200,
-            description=f"Test SEO score calculation for tool {test_tool_id}"
-        )
-        results.append(success)
+        # Test 3: SEO Score Calculator for Tool
+        logger.info("\n2️⃣ Testing GET /api/seo/score/tool/{tool_id}")
+        success, response = score_tool
+        self.add_result(results, success)
         
         if success and isinstance(response, dict):
-            required_fields = ['overall_score', 'title_score', 'description_score', 'keywords_score', 'content_score', 'internal_links_score', 'recommendations']
-            missing_fields = [field for field in required_fields if field not in response]
+            missing_fields = _SEO_SCORE_KEYS - response.keys()
             
             if not missing_fields:
-                print(f"   ✅ SEO score breakdown structure is complete")
-                print(f"   - Overall Score: {response.get('overall_score', 0)}/100")
-                print(f"   - Title Score: {response.get('title_score', 0)}/100")
-                print(f"   - Description Score: {response.get('description_score', 0)}/100")
-                print(f"   - Keywords Score: {response.get('keywords_score', 0)}/100")
-                print(f"   - Content Score: {response.get('content_score', 0)}/100")
-                print(f"   - Internal Links Score: {response.get('internal_links_score', 0)}/100")
-                print(f"   - Recommendations: {len(response.get('recommendations', []))} items")
+                logger.info(f"   ✅ SEO score breakdown structure is complete")
+                logger.info(f"   - Overall Score: {response.get('overall_score', 0)}/100")
+                logger.info(f"   - Title Score: {response.get('title_score', 0)}/100")
+                logger.info(f"   - Description Score: {response.get('description_score', 0)}/100")
+                logger.info(f"   - Keywords Score: {response.get('keywords_score', 0)}/100")
+                logger.info(f"   - Content Score: {response.get('content_score', 0)}/100")
+                logger.info(f"   - Internal Links Score: {response.get('internal_links_score', 0)}/100")
+                logger.info(f"   - Recommendations: {len(response.get('recommendations', []))} items")
                 
                 # Verify recommendations are provided
                 if response.get('recommendations') and len(response['recommendations']) > 0:
-                    print(f"   ✅ Recommendations provided:")
+                    logger.info(f"   ✅ Recommendations provided:")
                     for rec in response['recommendations'][:3]:
-                        print(f"     • {rec}")
+                        logger.info(f"     • {rec}")
                 else:
-                    print(f"   ⚠️ No recommendations provided")
+                    logger.info(f"   ⚠️ No recommendations provided")
             else:
-                print(f"   ❌ Missing required fields: {missing_fields}")
-                results.append(False)
+                logger.info(f"   ❌ Missing required fields: {sorted(missing_fields)}")
+                self.add_result(results, False)
         
         # Test 4: SEO Score Calculator for Blog
-        print("\n3️⃣ Testing GET /api/seo/score/blog/{blog_id}")
-        test_blog_id = "e0353e91-295c-4b05-a397-2a8c3e93d090"  # Updated Test Blog for Like Count 095851
-        
-        success, response = self.run_test(
-            "SEO Score Calculator - Blog",
-            "GET",
-            f"seo/score/blog/{test_blog_id}",
-            200,
-            description=f"Test SEO score calculation for blog {test_blog_id}"
-        )
-        results.append(success)
+        logger.info("\n3️⃣ Testing GET /api/seo/score/blog/{blog_id}")
+        success, response = score_blog
+        self.add_result(results, success)
         
         if success and isinstance(response, dict):
-            print(f"   ✅ Blog SEO score breakdown received")
-            print(f"   - Overall Score: {response.get('overall_score', 0)}/100")
-            print(f"   - Title Score: {response.get('title_score', 0)}/100")
-            print(f"   - Description Score: {response.get('description_score', 0)}/100")
-            print(f"   - Keywords Score: {response.get('keywords_score', 0)}/100")
-            print(f"   - Content Score: {response.get('content_score', 0)}/100")
-            print(f"   - Internal Links Score: {response.get('internal_links_score', 0)}/100")
+            logger.info(f"   ✅ Blog SEO score breakdown received")
+            logger.info(f"   - Overall Score: {response.get('overall_score', 0)}/100")
+            logger.info(f"   - Title Score: {response.get('title_score', 0)}/100")
+            logger.info(f"   - Description Score: {response.get('description_score', 0)}/100")
+            logger.info(f"   - Keywords Score: {response.get('keywords_score', 0)}/100")
+            logger.info(f"   - Content Score: {response.get('content_score', 0)}/100")
+            logger.info(f"   - Internal Links Score: {response.get('internal_links_score', 0)}/100")
             
             if response.get('recommendations'):
-                print(f"   ✅ Blog recommendations provided: {len(response['recommendations'])} items")
+                logger.info(f"   ✅ Blog recommendations provided: {len(response['recommendations'])} items")
         
         # Test 5: Page Analysis API - Tool URL
-        print("\n4️⃣ Testing GET /api/seo/analyze-page - Tool URL")
-        tool_url = "/tools/updated-test-tool-074703"
-        
-        success, response = self.run_test(
-            "Page Analysis - Tool URL",
-            "GET",
-            f"seo/analyze-page?url={tool_url}",
-            200,
-            description=f"Test page analysis for tool URL: {tool_url}"
-        )
-        results.append(success)
+        logger.info("\n4️⃣ Testing GET /api/seo/analyze-page - Tool URL")
+        success, response = analyze_tool
+        self.add_result(results, success)
         
         if success and isinstance(response, dict):
-            print(f"   ✅ Tool page analysis completed")
+            logger.info(f"   ✅ Tool page analysis completed")
             if 'overall_score' in response:
-                print(f"   - Analysis Score: {response.get('overall_score', 0)}/100")
+                logger.info(f"   - Analysis Score: {response.get('overall_score', 0)}/100")
             else:
-                print(f"   - Analysis returned: {list(response.keys())}")
+                logger.info(f"   - Analysis returned: {list(response.keys())}")
         
         # Test 6: Page Analysis API - Blog URL
-        print("\n5️⃣ Testing GET /api/seo/analyze-page - Blog URL")
-        blog_url = "/blogs/updated-test-blog-for-like-count-095851"
-        
-        success, response = self.run_test(
-            "Page Analysis - Blog URL",
-            "GET",
-            f"seo/analyze-page?url={blog_url}",
-            200,
-            description=f"Test page analysis for blog URL: {blog_url}"
-        )
-        results.append(success)
+        logger.info("\n5️⃣ Testing GET /api/seo/analyze-page - Blog URL")
+        success, response = analyze_blog
+        self.add_result(results, success)
         
         if success and isinstance(response, dict):
-            print(f"   ✅ Blog page analysis completed")
+            logger.info(f"   ✅ Blog page analysis completed")
             if 'overall_score' in response:
-                print(f"   - Analysis Score: {response.get('overall_score', 0)}/100")
+                logger.info(f"   - Analysis Score: {response.get('overall_score', 0)}/100")
         
         # Test 7: Authentication Testing - Unauthenticated Request
-        print("\n6️⃣ Testing Authentication Requirements")
-        temp_token = self.token
-        self.token = None  # Remove token temporarily
-        
-        success, response = self.run_test(
-            "SEO Features - No Authentication",
-            "POST",
-            "seo/internal-links/suggestions",
-            403,  # FastAPI returns 403 for "Not authenticated"
-            data=sample_content,
-            description="Test that SEO endpoints require authentication"
-        )
-        results.append(success)
-        
-        self.token = temp_token  # Restore token
+        logger.info("\n6️⃣ Testing Authentication Requirements")
+        with self.without_auth():  # Remove token temporarily
+            success, response = self.run_test(
+                "SEO Features - No Authentication",
+                "POST",
+                "seo/internal-links/suggestions",
+                403,  # FastAPI returns 403 for "Not authenticated"
+                data=sample_content,
+                description="Test that SEO endpoints require authentication"
+            )
+        self.add_result(results, success)
         
         if success:
-            print(f"   ✅ Authentication properly required for SEO endpoints")
+            logger.info(f"   ✅ Authentication properly required for SEO endpoints")
         
         # Test 8: Error Handling - Invalid Content ID
-        print("\n7️⃣ Testing Error Handling")
+        logger.info("\n7️⃣ Testing Error Handling")
         invalid_tool_id = "invalid-tool-id-12345"
         
         success, response = self.run_test(
@@ -3394,13 +3437,13 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             404,  # Should return not found
             description="Test error handling for invalid tool ID"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success:
-            print(f"   ✅ Proper error handling for invalid content IDs")
+            logger.info(f"   ✅ Proper error handling for invalid content IDs")
         
         # Test 9: Parameter Validation
-        print("\n8️⃣ Testing Parameter Validation")
+        logger.info("\n8️⃣ Testing Parameter Validation")
         invalid_content = {
             "content": "",  # Empty content
             "title": "",    # Empty title
@@ -3415,16 +3458,16 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             data=invalid_content,
             description="Test parameter validation with invalid/empty content"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success and isinstance(response, list):
             if len(response) == 0:
-                print(f"   ✅ Properly handles empty content (returns empty suggestions)")
+                logger.info(f"   ✅ Properly handles empty content (returns empty suggestions)")
             else:
-                print(f"   ⚠️ Unexpected suggestions for empty content: {len(response)}")
+                logger.info(f"   ⚠️ Unexpected suggestions for empty content: {len(response)}")
         
         # Test 10: Different Content Types
-        print("\n9️⃣ Testing Different Content Types")
+        logger.info("\n9️⃣ Testing Different Content Types")
         tool_content = {
             "content": "This is a project management tool that helps teams collaborate effectively. It includes features for task tracking, team communication, and workflow automation.",
             "title": "Advanced Project Management Tool",
@@ -3440,212 +3483,174 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             data=tool_content,
             description="Test internal link suggestions for tool content type"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success and isinstance(response, list):
-            print(f"   ✅ Tool content type processed: {len(response)} suggestions")
+            logger.info(f"   ✅ Tool content type processed: {len(response)} suggestions")
         
         return all(results)
 
+    @buffered_output
     def test_seo_endpoints_comprehensive(self):
         """Test SEO-related backend endpoints as requested in review"""
-        print("\n🔍 COMPREHENSIVE SEO ENDPOINTS TESTING")
-        print("=" * 60)
+        logger.info("\n🔍 COMPREHENSIVE SEO ENDPOINTS TESTING")
+        logger.info("=" * 60)
         
         results = []
         
+        # Tests 1-5 start from independent public reads, so fetch them in one concurrent batch
+        sitemap, robots, notion, blog, tools_list, blogs_list = self.run_tests_parallel([
+            ("SEO Sitemap XML", "GET", "sitemap.xml", 200,
+             {'description': "Test sitemap.xml generation for SEO"}),
+            ("SEO Robots.txt", "GET", "robots.txt", 200,
+             {'description': "Test robots.txt generation for SEO"}),
+            ("Tool 'notion' with SEO fields", "GET", "tools/by-slug/notion", 200,
+             {'description': "Test specific tool 'notion' for SEO metadata"}),
+            ("Specific blog with SEO metadata", "GET",
+             "blogs/by-slug/top-10-productivity-tools-for-remote-teams-in-2024", 200,
+             {'description': "Test specific blog for SEO metadata"}),
+            ("Get tools for SEO testing", "GET", "tools?limit=3", 200,
+             {'description': "Get sample tools to test SEO data"}),
+            ("Get blogs for SEO testing", "GET", "blogs?limit=3", 200,
+             {'description': "Get sample blogs to test SEO data"}),
+        ])
+        
         # Test 1: GET /api/sitemap.xml - should return proper XML sitemap
-        print("\n1️⃣ Testing GET /api/sitemap.xml")
-        success, response = self.run_test(
-            "SEO Sitemap XML",
-            "GET",
-            "sitemap.xml",
-            200,
-            description="Test sitemap.xml generation for SEO"
-        )
+        logger.info("\n1️⃣ Testing GET /api/sitemap.xml")
+        success, response = sitemap
         results.append(success)
         
         if success and isinstance(response, str):
-            # Validate XML structure
-            if response.startswith('<?xml') and '<urlset' in response:
-                print("   ✅ Valid XML sitemap format")
-                url_count = response.count('<url>')
-                print(f"   ✅ Contains {url_count} URLs")
+            # Validate XML structure with one streaming parse instead of substring scans
+            try:
+                root_tag, url_count, _, token_counts = walk_sitemap(response)
+            except ElementTree.ParseError:
+                root_tag, url_count, token_counts = None, 0, Counter()
+            if response.startswith('<?xml') and root_tag == 'urlset':
+                logger.info("   ✅ Valid XML sitemap format")
+                logger.info(f"   ✅ Contains {url_count} URLs")
                 
-                # Check for tools and blogs in sitemap
-                if '/tools/' in response:
-                    tool_urls = response.count('/tools/')
-                    print(f"   ✅ Tool URLs found: {tool_urls}")
-                if '/blogs/' in response:
-                    blog_urls = response.count('/blogs/')
-                    print(f"   ✅ Blog URLs found: {blog_urls}")
+                # Check for tools and blogs in sitemap, counted from the <loc> entries
+                if token_counts['/tools/']:
+                    logger.info(f"   ✅ Tool URLs found: {token_counts['/tools/']}")
+                if token_counts['/blogs/']:
+                    logger.info(f"   ✅ Blog URLs found: {token_counts['/blogs/']}")
             else:
-                print("   ❌ Invalid XML format")
+                logger.info("   ❌ Invalid XML format")
                 results.append(False)
         
         # Test 2: GET /api/robots.txt - should return robots.txt file
-        print("\n2️⃣ Testing GET /api/robots.txt")
-        success, response = self.run_test(
-            "SEO Robots.txt",
-            "GET",
-            "robots.txt",
-            200,
-            description="Test robots.txt generation for SEO"
-        )
+        logger.info("\n2️⃣ Testing GET /api/robots.txt")
+        success, response = robots
         results.append(success)
         
         if success and isinstance(response, str):
             required_directives = ['User-agent:', 'Disallow:', 'Sitemap:']
             missing = [d for d in required_directives if d not in response]
             if not missing:
-                print("   ✅ All required robots.txt directives present")
+                logger.info("   ✅ All required robots.txt directives present")
             else:
-                print(f"   ❌ Missing directives: {missing}")
+                logger.info(f"   ❌ Missing directives: {missing}")
                 results.append(False)
         
         # Test 3: GET /api/tools/notion - should return tool data with SEO fields
-        print("\n3️⃣ Testing GET /api/tools/notion (specific tool with SEO fields)")
-        success, response = self.run_test(
-            "Tool 'notion' with SEO fields",
-            "GET",
-            "tools/by-slug/notion",
-            200,
-            description="Test specific tool 'notion' for SEO metadata"
-        )
+        logger.info("\n3️⃣ Testing GET /api/tools/notion (specific tool with SEO fields)")
+        success, response = notion
         results.append(success)
         
         if success and isinstance(response, dict):
-            seo_fields = ['seo_title', 'seo_description', 'seo_keywords']
             present_fields = []
             missing_fields = []
             
-            for field in seo_fields:
+            for field in _SEO_META_FIELDS:
                 if response.get(field):
                     present_fields.append(field)
-                    print(f"   ✅ {field}: {response[field][:50]}...")
+                    logger.info(f"   ✅ {field}: {response[field][:50]}...")
                 else:
                     missing_fields.append(field)
-                    print(f"   ❌ {field}: Missing or empty")
+                    logger.info(f"   ❌ {field}: Missing or empty")
             
             if len(present_fields) >= 2:  # At least 2 out of 3 SEO fields
-                print(f"   ✅ Tool has adequate SEO data ({len(present_fields)}/3 fields)")
+                logger.info(f"   ✅ Tool has adequate SEO data ({len(present_fields)}/3 fields)")
             else:
-                print(f"   ❌ Tool lacks adequate SEO data ({len(present_fields)}/3 fields)")
+                logger.info(f"   ❌ Tool lacks adequate SEO data ({len(present_fields)}/3 fields)")
                 results.append(False)
         
         # Test 4: GET /api/blogs/top-10-productivity-tools-for-remote-teams-in-2024
-        print("\n4️⃣ Testing GET /api/blogs/top-10-productivity-tools-for-remote-teams-in-2024")
-        success, response = self.run_test(
-            "Specific blog with SEO metadata",
-            "GET",
-            "blogs/by-slug/top-10-productivity-tools-for-remote-teams-in-2024",
-            200,
-            description="Test specific blog for SEO metadata"
-        )
+        logger.info("\n4️⃣ Testing GET /api/blogs/top-10-productivity-tools-for-remote-teams-in-2024")
+        success, response = blog
         results.append(success)
         
         if success and isinstance(response, dict):
-            seo_fields = ['seo_title', 'seo_description', 'seo_keywords', 'json_ld']
             present_fields = []
             missing_fields = []
             
-            for field in seo_fields:
+            for field in _SEO_FIELDS_WITH_JSON_LD:
                 if response.get(field):
                     present_fields.append(field)
                     if field == 'json_ld':
-                        print(f"   ✅ {field}: JSON-LD structured data present")
+                        logger.info(f"   ✅ {field}: JSON-LD structured data present")
                     else:
-                        print(f"   ✅ {field}: {str(response[field])[:50]}...")
+                        logger.info(f"   ✅ {field}: {str(response[field])[:50]}...")
                 else:
                     missing_fields.append(field)
-                    print(f"   ❌ {field}: Missing or empty")
+                    logger.info(f"   ❌ {field}: Missing or empty")
             
             if len(present_fields) >= 3:  # At least 3 out of 4 SEO fields for blogs
-                print(f"   ✅ Blog has excellent SEO data ({len(present_fields)}/4 fields)")
+                logger.info(f"   ✅ Blog has excellent SEO data ({len(present_fields)}/4 fields)")
             else:
-                print(f"   ⚠️ Blog has partial SEO data ({len(present_fields)}/4 fields)")
+                logger.info(f"   ⚠️ Blog has partial SEO data ({len(present_fields)}/4 fields)")
         
         # Test 5: Test a few other tools and blogs to ensure SEO data is present
-        print("\n5️⃣ Testing other tools and blogs for SEO data presence")
+        logger.info("\n5️⃣ Testing other tools and blogs for SEO data presence")
+        
+        # The list endpoints return the same ToolResponse/BlogResponse models as the detail
+        # routes, SEO fields included, so each item is checked without a per-item GET
         
         # Get some tools
-        success, tools_response = self.run_test(
-            "Get tools for SEO testing",
-            "GET",
-            "tools?limit=3",
-            200,
-            description="Get sample tools to test SEO data"
-        )
+        success, tools_response = tools_list
         
         if success and isinstance(tools_response, list):
             tools_with_seo = 0
-            for i, tool in enumerate(tools_response[:3]):
-                tool_id = tool.get('id')
+            for tool in tools_response[:3]:
                 tool_name = tool.get('name', 'Unknown')
                 
-                success_tool, tool_detail = self.run_test(
-                    f"Tool {i+1} SEO check",
-                    "GET",
-                    f"tools/{tool_id}",
-                    200,
-                    description=f"Check SEO data for tool: {tool_name}"
-                )
-                
-                if success_tool and isinstance(tool_detail, dict):
-                    seo_count = sum(1 for field in ['seo_title', 'seo_description', 'seo_keywords'] 
-                                  if tool_detail.get(field))
-                    if seo_count >= 1:
-                        tools_with_seo += 1
-                        print(f"   ✅ Tool '{tool_name}': {seo_count}/3 SEO fields")
-                    else:
-                        print(f"   ❌ Tool '{tool_name}': No SEO fields")
+                seo_count = sum(map(bool, map(tool.get, _SEO_META_FIELDS)))
+                if seo_count >= 1:
+                    tools_with_seo += 1
+                    logger.info(f"   ✅ Tool '{tool_name}': {seo_count}/3 SEO fields")
+                else:
+                    logger.info(f"   ❌ Tool '{tool_name}': No SEO fields")
             
-            print(f"   📊 Tools with SEO data: {tools_with_seo}/{len(tools_response[:3])}")
+            logger.info(f"   📊 Tools with SEO data: {tools_with_seo}/{len(tools_response[:3])}")
             if tools_with_seo >= 2:
                 results.append(True)
             else:
                 results.append(False)
         
         # Get some blogs
-        success, blogs_response = self.run_test(
-            "Get blogs for SEO testing",
-            "GET",
-            "blogs?limit=3",
-            200,
-            description="Get sample blogs to test SEO data"
-        )
+        success, blogs_response = blogs_list
         
         if success and isinstance(blogs_response, list):
             blogs_with_seo = 0
-            for i, blog in enumerate(blogs_response[:3]):
-                blog_id = blog.get('id')
+            for blog in blogs_response[:3]:
                 blog_title = blog.get('title', 'Unknown')
                 
-                success_blog, blog_detail = self.run_test(
-                    f"Blog {i+1} SEO check",
-                    "GET",
-                    f"blogs/{blog_id}",
-                    200,
-                    description=f"Check SEO data for blog: {blog_title}"
-                )
-                
-                if success_blog and isinstance(blog_detail, dict):
-                    seo_count = sum(1 for field in ['seo_title', 'seo_description', 'seo_keywords', 'json_ld'] 
-                                  if blog_detail.get(field))
-                    if seo_count >= 2:
-                        blogs_with_seo += 1
-                        print(f"   ✅ Blog '{blog_title[:30]}...': {seo_count}/4 SEO fields")
-                    else:
-                        print(f"   ❌ Blog '{blog_title[:30]}...': {seo_count}/4 SEO fields")
+                seo_count = sum(map(bool, map(blog.get, _SEO_FIELDS_WITH_JSON_LD)))
+                if seo_count >= 2:
+                    blogs_with_seo += 1
+                    logger.info(f"   ✅ Blog '{blog_title[:30]}...': {seo_count}/4 SEO fields")
+                else:
+                    logger.info(f"   ❌ Blog '{blog_title[:30]}...': {seo_count}/4 SEO fields")
             
-            print(f"   📊 Blogs with SEO data: {blogs_with_seo}/{len(blogs_response[:3])}")
+            logger.info(f"   📊 Blogs with SEO data: {blogs_with_seo}/{len(blogs_response[:3])}")
             if blogs_with_seo >= 2:
                 results.append(True)
             else:
                 results.append(False)
         
         # Test 6: Quick test of superadmin SEO overview endpoint
-        print("\n6️⃣ Testing superadmin SEO overview endpoint")
+        logger.info("\n6️⃣ Testing superadmin SEO overview endpoint")
         
         # First login as superadmin
         login_success, user_role = self.test_login("superadmin@marketmind.com", "admin123")
@@ -3666,46 +3671,46 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
                 seo_optimized = response.get('seo_optimized', 0)
                 critical_issues = response.get('critical_issues', 0)
                 
-                print(f"   ✅ SEO Health Score: {health_score}%")
-                print(f"   ✅ Total Pages: {total_pages}")
-                print(f"   ✅ SEO Optimized: {seo_optimized}")
-                print(f"   ✅ Critical Issues: {critical_issues}")
+                logger.info(f"   ✅ SEO Health Score: {health_score}%")
+                logger.info(f"   ✅ Total Pages: {total_pages}")
+                logger.info(f"   ✅ SEO Optimized: {seo_optimized}")
+                logger.info(f"   ✅ Critical Issues: {critical_issues}")
                 
                 if health_score >= 80:
-                    print(f"   ✅ Excellent SEO health score")
+                    logger.info(f"   ✅ Excellent SEO health score")
                 elif health_score >= 60:
-                    print(f"   ⚠️ Good SEO health score")
+                    logger.info(f"   ⚠️ Good SEO health score")
                 else:
-                    print(f"   ❌ Poor SEO health score")
+                    logger.info(f"   ❌ Poor SEO health score")
                     results.append(False)
         else:
-            print("   ❌ Failed to login as superadmin for SEO overview test")
+            logger.info("   ❌ Failed to login as superadmin for SEO overview test")
             results.append(False)
         
         # Summary
-        print(f"\n📋 SEO ENDPOINTS TEST SUMMARY")
-        print(f"   Tests run: {len(results)}")
-        print(f"   Tests passed: {sum(results)}")
-        print(f"   Success rate: {(sum(results)/len(results)*100):.1f}%")
+        logger.info(f"\n📋 SEO ENDPOINTS TEST SUMMARY")
+        logger.info(f"   Tests run: {len(results)}")
+        logger.info(f"   Tests passed: {sum(results)}")
+        logger.info(f"   Success rate: {(sum(results)/len(results)*100):.1f}%")
         
         return all(results)
 
+    @buffered_output
     def test_comprehensive_seo_production_build(self):
         """Comprehensive SEO testing for production build as requested in review"""
-        print("\n🔍 COMPREHENSIVE SEO PRODUCTION BUILD TESTING")
-        print("=" * 70)
+        logger.info("\n🔍 COMPREHENSIVE SEO PRODUCTION BUILD TESTING")
+        logger.info("=" * 70)
         
         results = []
         
         # 1. SITEMAP GENERATION TEST
-        print("\n1️⃣ SITEMAP GENERATION TEST")
-        print("-" * 40)
+        logger.info("\n1️⃣ SITEMAP GENERATION TEST")
+        logger.info("-" * 40)
         
-        success, sitemap_response = self.run_test(
+        # Shared with the other SEO file tests until published content changes
+        success, sitemap_response, _ = self.cached_get(
             "GET /api/sitemap.xml",
-            "GET",
             "sitemap.xml",
-            200,
             description="Test sitemap generation with all active tools, published blogs, and main pages"
         )
         results.append(success)
@@ -3713,116 +3718,110 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         if success and isinstance(sitemap_response, str):
             # Verify XML structure
             if sitemap_response.startswith('<?xml'):
-                print("   ✅ Valid XML format")
-                
-                # Count URLs
-                url_count = sitemap_response.count('<url>')
-                print(f"   Total URLs in sitemap: {url_count}")
+                logger.info("   ✅ Valid XML format")
                 
-                # Check for required elements
-                required_elements = ['<changefreq>', '<priority>', '<lastmod>']
-                for element in required_elements:
-                    if element in sitemap_response:
-                        print(f"   ✅ {element} present")
-                    else:
-                        print(f"   ❌ {element} missing")
-                        results.append(False)
-                
-                # Check for main pages
-                main_pages = ['/tools', '/blogs', '/compare']
-                for page in main_pages:
-                    if page in sitemap_response:
-                        print(f"   ✅ Main page {page} included")
-                    else:
-                        print(f"   ❌ Main page {page} missing")
-                
-                # Count specific content types
-                tool_urls = sitemap_response.count('/tools/')
-                blog_urls = sitemap_response.count('/blogs/')
-                print(f"   Tool URLs: {tool_urls}")
-                print(f"   Blog URLs: {blog_urls}")
+                # Count URLs and collect the first entry's child elements in one streaming parse
+                try:
+                    _, url_count, first_url_children, token_counts = walk_sitemap(sitemap_response)
+                except ElementTree.ParseError as e:
+                    # None of the checks below mean anything for a body that does not parse
+                    logger.info(f"   ❌ Sitemap is not well-formed XML: {e}")
+                    results.append(False)
+                else:
+                    logger.info(f"   Total URLs in sitemap: {url_count}")
+                    
+                    # Check for required elements
+                    for element in _SITEMAP_URL_METADATA:
+                        if element in first_url_children:
+                            logger.info(f"   ✅ <{element}> present")
+                        else:
+                            logger.info(f"   ❌ <{element}> missing")
+                            results.append(False)
+                    
+                    # Check for main pages
+                    for page in _SITEMAP_MAIN_PAGES:
+                        if token_counts[page] or token_counts[page + '/']:
+                            logger.info(f"   ✅ Main page {page} included")
+                        else:
+                            logger.info(f"   ❌ Main page {page} missing")
+                    
+                    # Count specific content types
+                    tool_urls = token_counts['/tools/']
+                    blog_urls = token_counts['/blogs/']
+                    logger.info(f"   Tool URLs: {tool_urls}")
+                    logger.info(f"   Blog URLs: {blog_urls}")
                 
             else:
-                print("   ❌ Invalid XML format")
+                logger.info("   ❌ Invalid XML format")
                 results.append(False)
         
         # 2. ROBOTS.TXT TEST
-        print("\n2️⃣ ROBOTS.TXT TEST")
-        print("-" * 40)
+        logger.info("\n2️⃣ ROBOTS.TXT TEST")
+        logger.info("-" * 40)
         
-        success, robots_response = self.run_test(
+        success, robots_response, _ = self.cached_get(
             "GET /api/robots.txt",
-            "GET",
             "robots.txt",
-            200,
             description="Test robots.txt generation with proper disallow rules and sitemap reference"
         )
         results.append(success)
         
         if success and isinstance(robots_response, str):
-            # Check required directives
-            required_directives = [
-                'User-agent: *',
-                'Disallow: /admin/',
-                'Disallow: /superadmin/',
-                'Sitemap:'
-            ]
+            # Find every directive and the sitemap reference in one pass, without lowercasing the body
+            found = {match.group() for match in _ROBOTS_PRODUCTION_TOKENS.finditer(robots_response)}
             
-            for directive in required_directives:
-                if directive in robots_response:
-                    print(f"   ✅ {directive} present")
+            # Check required directives
+            for directive in _ROBOTS_PRODUCTION_DIRECTIVES:
+                if directive in found:
+                    logger.info(f"   ✅ {directive} present")
                 else:
-                    print(f"   ❌ {directive} missing")
+                    logger.info(f"   ❌ {directive} missing")
                     results.append(False)
             
             # Check sitemap reference
-            if 'sitemap.xml' in robots_response.lower():
-                print("   ✅ Sitemap reference correct")
+            if any(token.lower() == 'sitemap.xml' for token in found):
+                logger.info("   ✅ Sitemap reference correct")
             else:
-                print("   ❌ Sitemap reference missing or incorrect")
+                logger.info("   ❌ Sitemap reference missing or incorrect")
                 results.append(False)
         
         # 3. SEO DATA BACKEND VERIFICATION - POPULAR TOOLS
-        print("\n3️⃣ SEO DATA BACKEND VERIFICATION - POPULAR TOOLS")
-        print("-" * 40)
-        
-        popular_tools = ['notion', 'figma', 'slack']
-        
-        for tool_slug in popular_tools:
-            print(f"\n   Testing tool: {tool_slug}")
-            success, tool_response = self.run_test(
-                f"GET /api/tools/{tool_slug}",
-                "GET",
-                f"tools/by-slug/{tool_slug}",
-                200,
-                description=f"Test SEO data for {tool_slug}"
-            )
+        logger.info("\n3️⃣ SEO DATA BACKEND VERIFICATION - POPULAR TOOLS")
+        logger.info("-" * 40)
+        
+        # The by-slug reads are independent, so fetch them in one concurrent batch and check them in order
+        tool_responses = self.run_tests_parallel([
+            (f"GET /api/tools/{tool_slug}", "GET", f"tools/by-slug/{tool_slug}", 200,
+             {'description': f"Test SEO data for {tool_slug}"})
+            for tool_slug in _POPULAR_TOOL_SLUGS
+        ])
+        for tool_slug, (success, tool_response) in zip(_POPULAR_TOOL_SLUGS, tool_responses):
+            logger.info(f"\n   Testing tool: {tool_slug}")
             
             if success and isinstance(tool_response, dict):
                 # Check SEO fields
-                seo_fields = ['seo_title', 'seo_description', 'seo_keywords']
                 seo_complete = True
                 
-                for field in seo_fields:
+                for field in _SEO_META_FIELDS:
                     if tool_response.get(field):
-                        print(f"     ✅ {field}: Present")
+                        logger.info(f"     ✅ {field}: Present")
                     else:
-                        print(f"     ❌ {field}: Missing")
+                        logger.info(f"     ❌ {field}: Missing")
                         seo_complete = False
                 
                 if seo_complete:
-                    print(f"     ✅ {tool_slug} has complete SEO data")
+                    logger.info(f"     ✅ {tool_slug} has complete SEO data")
                     results.append(True)
                 else:
-                    print(f"     ❌ {tool_slug} missing SEO fields")
+                    logger.info(f"     ❌ {tool_slug} missing SEO fields")
                     results.append(False)
             else:
-                print(f"     ❌ Failed to retrieve {tool_slug}")
+                logger.info(f"     ❌ Failed to retrieve {tool_slug}")
                 results.append(False)
         
         # 4. SEO DATA BACKEND VERIFICATION - PUBLISHED BLOGS
-        print("\n4️⃣ SEO DATA BACKEND VERIFICATION - PUBLISHED BLOGS")
-        print("-" * 40)
+        logger.info("\n4️⃣ SEO DATA BACKEND VERIFICATION - PUBLISHED BLOGS")
+        logger.info("-" * 40)
         
         # Get published blogs
         success, blogs_response = self.run_test(
@@ -3834,138 +3833,110 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         )
         
         if success and isinstance(blogs_response, list) and len(blogs_response) > 0:
-            for blog in blogs_response[:3]:
-                blog_slug = blog.get('slug')
-                if blog_slug:
-                    print(f"\n   Testing blog: {blog_slug}")
-                    success, blog_response = self.run_test(
-                        f"GET /api/blogs/{blog_slug}",
-                        "GET",
-                        f"blogs/by-slug/{blog_slug}",
-                        200,
-                        description=f"Test SEO data for blog {blog_slug}"
-                    )
+            blog_slugs = [blog['slug'] for blog in blogs_response[:3] if blog.get('slug')]
+            blog_responses = self.run_tests_parallel([
+                (f"GET /api/blogs/{blog_slug}", "GET", f"blogs/by-slug/{blog_slug}", 200,
+                 {'description': f"Test SEO data for blog {blog_slug}"})
+                for blog_slug in blog_slugs
+            ])
+            for blog_slug, (success, blog_response) in zip(blog_slugs, blog_responses):
+                logger.info(f"\n   Testing blog: {blog_slug}")
+                
+                if success and isinstance(blog_response, dict):
+                    # Check SEO fields
+                    seo_complete = True
                     
-                    if success and isinstance(blog_response, dict):
-                        # Check SEO fields
-                        seo_fields = ['seo_title', 'seo_description', 'seo_keywords']
-                        seo_complete = True
-                        
-                        for field in seo_fields:
-                            if blog_response.get(field):
-                                print(f"     ✅ {field}: Present")
-                            else:
-                                print(f"     ❌ {field}: Missing")
-                                seo_complete = False
-                        
-                        if seo_complete:
-                            print(f"     ✅ {blog_slug} has complete SEO data")
-                            results.append(True)
+                    for field in _SEO_META_FIELDS:
+                        if blog_response.get(field):
+                            logger.info(f"     ✅ {field}: Present")
                         else:
-                            print(f"     ❌ {blog_slug} missing SEO fields")
-                            results.append(False)
+                            logger.info(f"     ❌ {field}: Missing")
+                            seo_complete = False
+                    
+                    if seo_complete:
+                        logger.info(f"     ✅ {blog_slug} has complete SEO data")
+                        results.append(True)
                     else:
-                        print(f"     ❌ Failed to retrieve blog {blog_slug}")
+                        logger.info(f"     ❌ {blog_slug} missing SEO fields")
                         results.append(False)
+                else:
+                    logger.info(f"     ❌ Failed to retrieve blog {blog_slug}")
+                    results.append(False)
         else:
-            print("   ❌ No published blogs found for testing")
+            logger.info("   ❌ No published blogs found for testing")
             results.append(False)
         
         # 5. SUPER ADMIN SEO ROUTES TEST
-        print("\n5️⃣ SUPER ADMIN SEO ROUTES TEST")
-        print("-" * 40)
+        logger.info("\n5️⃣ SUPER ADMIN SEO ROUTES TEST")
+        logger.info("-" * 40)
         
         # First authenticate as superadmin
         if not self.token or self.current_user_role != 'superadmin':
-            print("   Authenticating as superadmin...")
+            logger.info("   Authenticating as superadmin...")
             login_success, role = self.test_login("superadmin@marketmind.com", "admin123")
             if not login_success or role != 'superadmin':
-                print("   ❌ Failed to authenticate as superadmin")
+                logger.info("   ❌ Failed to authenticate as superadmin")
                 results.append(False)
                 return all(results)
         
+        # The overview, issues and the two list lookups are independent reads, so run them concurrently
+        overview_result, issues_result, tools_result, blogs_result = self.run_tests_parallel([
+            ("GET /api/superadmin/seo/overview", "GET", "superadmin/seo/overview", 200,
+             {'description': "Test superadmin SEO overview with authentication"}),
+            ("GET /api/superadmin/seo/issues", "GET", "superadmin/seo/issues", 200,
+             {'description': "Test superadmin SEO issues analysis"}),
+            ("GET Tools for SEO Testing", "GET", "tools?limit=1", 200,
+             {'description': "Get a tool for SEO details testing"}),
+            ("GET Blogs for SEO Testing", "GET", "blogs?limit=1", 200,
+             {'description': "Get a blog for SEO details testing"}),
+        ])
+        
         # Test SEO overview
-        success, overview_response = self.run_test(
-            "GET /api/superadmin/seo/overview",
-            "GET",
-            "superadmin/seo/overview",
-            200,
-            description="Test superadmin SEO overview with authentication"
-        )
+        success, overview_response = overview_result
         results.append(success)
         
         if success and isinstance(overview_response, dict):
-            print(f"   ✅ SEO Health Score: {overview_response.get('overview', {}).get('seo_health_score', 'N/A')}%")
-            print(f"   Total Pages: {overview_response.get('overview', {}).get('total_pages', 'N/A')}")
-            print(f"   SEO Optimized: {overview_response.get('overview', {}).get('seo_optimized', 'N/A')}")
+            overview = overview_response.get('overview') or {}
+            logger.info(f"   ✅ SEO Health Score: {overview.get('seo_health_score', 'N/A')}%")
+            logger.info(f"   Total Pages: {overview.get('total_pages', 'N/A')}")
+            logger.info(f"   SEO Optimized: {overview.get('seo_optimized', 'N/A')}")
         
         # Test SEO issues
-        success, issues_response = self.run_test(
-            "GET /api/superadmin/seo/issues",
-            "GET",
-            "superadmin/seo/issues",
-            200,
-            description="Test superadmin SEO issues analysis"
-        )
+        success, issues_response = issues_result
         results.append(success)
         
         if success and isinstance(issues_response, dict):
             total_issues = issues_response.get('total_issues', 0)
-            print(f"   Total SEO Issues: {total_issues}")
+            logger.info(f"   Total SEO Issues: {total_issues}")
             summary = issues_response.get('summary', {})
-            print(f"   Critical: {summary.get('critical', 0)}, High: {summary.get('high', 0)}, Medium: {summary.get('medium', 0)}, Low: {summary.get('low', 0)}")
-        
-        # Test specific tool SEO details
-        success, tools_response = self.run_test(
-            "GET Tools for SEO Testing",
-            "GET",
-            "tools?limit=1",
-            200,
-            description="Get a tool for SEO details testing"
-        )
+            logger.info(f"   Critical: {summary.get('critical', 0)}, High: {summary.get('high', 0)}, Medium: {summary.get('medium', 0)}, Low: {summary.get('low', 0)}")
         
+        # Test specific tool and blog SEO details, fetched together once their ids are known
+        detail_specs = []
+        success, tools_response = tools_result
         if success and isinstance(tools_response, list) and len(tools_response) > 0:
             tool_id = tools_response[0]['id']
-            success, tool_seo_response = self.run_test(
-                f"GET /api/superadmin/seo/tools/{tool_id}",
-                "GET",
-                f"superadmin/seo/tools/{tool_id}",
-                200,
-                description="Test superadmin tool SEO details"
-            )
-            results.append(success)
-            
-            if success and isinstance(tool_seo_response, dict):
-                seo_score = tool_seo_response.get('seo_analysis', {}).get('score', 0)
-                print(f"   Tool SEO Score: {seo_score}%")
-        
-        # Test specific blog SEO details
-        success, blogs_response = self.run_test(
-            "GET Blogs for SEO Testing",
-            "GET",
-            "blogs?limit=1",
-            200,
-            description="Get a blog for SEO details testing"
-        )
-        
+            detail_specs.append(('Tool', (f"GET /api/superadmin/seo/tools/{tool_id}", "GET",
+                                          f"superadmin/seo/tools/{tool_id}", 200,
+                                          {'description': "Test superadmin tool SEO details"})))
+        success, blogs_response = blogs_result
         if success and isinstance(blogs_response, list) and len(blogs_response) > 0:
             blog_id = blogs_response[0]['id']
-            success, blog_seo_response = self.run_test(
-                f"GET /api/superadmin/seo/blogs/{blog_id}",
-                "GET",
-                f"superadmin/seo/blogs/{blog_id}",
-                200,
-                description="Test superadmin blog SEO details"
-            )
+            detail_specs.append(('Blog', (f"GET /api/superadmin/seo/blogs/{blog_id}", "GET",
+                                          f"superadmin/seo/blogs/{blog_id}", 200,
+                                          {'description': "Test superadmin blog SEO details"})))
+        
+        detail_results = self.run_tests_parallel([spec for _, spec in detail_specs]) if detail_specs else []
+        for (kind, _), (success, seo_response) in zip(detail_specs, detail_results):
             results.append(success)
             
-            if success and isinstance(blog_seo_response, dict):
-                seo_score = blog_seo_response.get('seo_analysis', {}).get('score', 0)
-                print(f"   Blog SEO Score: {seo_score}%")
+            if success and isinstance(seo_response, dict):
+                seo_score = seo_response.get('seo_analysis', {}).get('score', 0)
+                logger.info(f"   {kind} SEO Score: {seo_score}%")
         
         # 6. SEO TEMPLATE GENERATION TEST
-        print("\n6️⃣ SEO TEMPLATE GENERATION TEST")
-        print("-" * 40)
+        logger.info("\n6️⃣ SEO TEMPLATE GENERATION TEST")
+        logger.info("-" * 40)
         
         # Test tools template generation
         success, tools_template_response = self.run_test(
@@ -3979,7 +3950,7 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         
         if success and isinstance(tools_template_response, dict):
             updated_count = tools_template_response.get('updated_count', 0)
-            print(f"   ✅ Generated SEO templates for {updated_count} tools")
+            logger.info(f"   ✅ Generated SEO templates for {updated_count} tools")
         
         # Test blogs template generation
         success, blogs_template_response = self.run_test(
@@ -3993,112 +3964,106 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         
         if success and isinstance(blogs_template_response, dict):
             updated_count = blogs_template_response.get('updated_count', 0)
-            print(f"   ✅ Generated SEO templates for {updated_count} blogs")
+            logger.info(f"   ✅ Generated SEO templates for {updated_count} blogs")
         
         return all(results)
 
+    @buffered_output
     def test_enhanced_email_verification_system(self):
         """Test the enhanced email verification system with OTP functionality"""
-        print("\n🔐 ENHANCED EMAIL VERIFICATION SYSTEM WITH OTP TESTING")
-        print("=" * 70)
+        logger.info("\n🔐 ENHANCED EMAIL VERIFICATION SYSTEM WITH OTP TESTING")
+        logger.info("=" * 70)
         
         results = []
-        timestamp = datetime.now().strftime('%H%M%S')
+        timestamp = self._unique_suffix()
         
         # Test 1: Enhanced Registration Flow with different verification methods
-        print("\n📝 TESTING ENHANCED REGISTRATION FLOW")
-        print("-" * 50)
+        logger.info("\n📝 TESTING ENHANCED REGISTRATION FLOW")
+        logger.info("-" * 50)
         
-        # Test 1a: Registration with verification_method: "link"
         test_email_link = f"otp_link_test_{timestamp}@example.com"
         test_username_link = f"otplinkuser_{timestamp}"
+        test_email_otp = f"otp_only_test_{timestamp}@example.com"
+        test_username_otp = f"otponlyuser_{timestamp}"
+        test_email_both = f"otp_both_test_{timestamp}@example.com"
+        test_username_both = f"otpbothuser_{timestamp}"
         
-        success, response = self.run_test(
-            "Registration with Link Method",
-            "POST",
-            "auth/register",
-            200,
-            data={
-                "email": test_email_link,
-                "username": test_username_link,
-                "password": "OTPTest123!",
-                "full_name": "OTP Link Test User",
-                "verification_method": "link"
-            },
-            description="Test registration with verification_method: 'link'"
-        )
+        # The three accounts are independent, so register them in one concurrent batch
+        register_link, register_otp, register_both = self.run_tests_parallel([
+            ("Registration with Link Method", "POST", "auth/register", 200, {
+                'data': {
+                    "email": test_email_link,
+                    "username": test_username_link,
+                    "password": "OTPTest123!",
+                    "full_name": "OTP Link Test User",
+                    "verification_method": "link"
+                },
+                'description': "Test registration with verification_method: 'link'"
+            }),
+            ("Registration with OTP Method", "POST", "auth/register", 200, {
+                'data': {
+                    "email": test_email_otp,
+                    "username": test_username_otp,
+                    "password": "OTPTest123!",
+                    "full_name": "OTP Only Test User",
+                    "verification_method": "otp"
+                },
+                'description': "Test registration with verification_method: 'otp'"
+            }),
+            ("Registration with Both Methods", "POST", "auth/register", 200, {
+                'data': {
+                    "email": test_email_both,
+                    "username": test_username_both,
+                    "password": "OTPTest123!",
+                    "full_name": "OTP Both Test User",
+                    "verification_method": "both"
+                },
+                'description': "Test registration with verification_method: 'both'"
+            }),
+        ])
+        
+        # Test 1a: Registration with verification_method: "link"
+        success, response = register_link
         results.append(success)
         
         if success and isinstance(response, dict):
             if response.get('verification_required') and response.get('verification_method') == 'link':
-                print(f"   ✅ Link-only registration successful")
-                print(f"   Email: {response.get('email')}")
-                print(f"   Method: {response.get('verification_method')}")
+                logger.info(f"   ✅ Link-only registration successful")
+                logger.info(f"   Email: {response.get('email')}")
+                logger.info(f"   Method: {response.get('verification_method')}")
             else:
-                print(f"   ❌ Link registration response incorrect: {response}")
+                logger.info(f"   ❌ Link registration response incorrect: {response}")
                 results.append(False)
         
         # Test 1b: Registration with verification_method: "otp"
-        test_email_otp = f"otp_only_test_{timestamp}@example.com"
-        test_username_otp = f"otponlyuser_{timestamp}"
-        
-        success, response = self.run_test(
-            "Registration with OTP Method",
-            "POST",
-            "auth/register",
-            200,
-            data={
-                "email": test_email_otp,
-                "username": test_username_otp,
-                "password": "OTPTest123!",
-                "full_name": "OTP Only Test User",
-                "verification_method": "otp"
-            },
-            description="Test registration with verification_method: 'otp'"
-        )
+        success, response = register_otp
         results.append(success)
         
         if success and isinstance(response, dict):
             if response.get('verification_required') and response.get('verification_method') == 'otp':
-                print(f"   ✅ OTP-only registration successful")
-                print(f"   Email: {response.get('email')}")
-                print(f"   Method: {response.get('verification_method')}")
+                logger.info(f"   ✅ OTP-only registration successful")
+                logger.info(f"   Email: {response.get('email')}")
+                logger.info(f"   Method: {response.get('verification_method')}")
             else:
-                print(f"   ❌ OTP registration response incorrect: {response}")
+                logger.info(f"   ❌ OTP registration response incorrect: {response}")
                 results.append(False)
         
         # Test 1c: Registration with verification_method: "both"
-        test_email_both = f"otp_both_test_{timestamp}@example.com"
-        test_username_both = f"otpbothuser_{timestamp}"
-        
-        success, response = self.run_test(
-            "Registration with Both Methods",
-            "POST",
-            "auth/register",
-            200,
-            data={
-                "email": test_email_both,
-                "username": test_username_both,
-                "password": "OTPTest123!",
-                "full_name": "OTP Both Test User",
-                "verification_method": "both"
-            },
-            description="Test registration with verification_method: 'both'"
-        )
+        success, response = register_both
         results.append(success)
         
         if success and isinstance(response, dict):
             if response.get('verification_required') and response.get('verification_method') == 'both':
-                print(f"   ✅ Both methods registration successful")
-                print(f"   Email: {response.get('email')}")
-                print(f"   Method: {response.get('verification_method')}")
+                logger.info(f"   ✅ Both methods registration successful")
+                logger.info(f"   Email: {response.get('email')}")
+                logger.info(f"   Method: {response.get('verification_method')}")
             else:
-                print(f"   ❌ Both methods registration response incorrect: {response}")
+                logger.info(f"   ❌ Both methods registration response incorrect: {response}")
                 results.append(False)
         
         # Test 2: OTP Verification Endpoint
-        print("\n🔢 TESTING OTP VERIFICATION ENDPOINT")
-        print("-" * 50)
+        logger.info("\n🔢 TESTING OTP VERIFICATION ENDPOINT")
+        logger.info("-" * 50)
         
         # Test 2a: Valid OTP verification (simulate with known pattern)
         success, response = self.run_test(
@@ -4143,102 +4108,88 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         results.append(success)
         
         # Test 3: Enhanced Resend Verification
-        print("\n📧 TESTING ENHANCED RESEND VERIFICATION")
-        print("-" * 50)
+        logger.info("\n📧 TESTING ENHANCED RESEND VERIFICATION")
+        logger.info("-" * 50)
+        
+        # Each resend targets a different account, so send all three together
+        resend_link, resend_otp, resend_both = self.run_tests_parallel([
+            ("Resend Verification - Link Method", "POST", "auth/resend-verification", 200,
+             {'data': {"email": test_email_link, "method": "link"},
+              'description': "Test resending verification with link method"}),
+            ("Resend Verification - OTP Method", "POST", "auth/resend-verification", 200,
+             {'data': {"email": test_email_otp, "method": "otp"},
+              'description': "Test resending verification with OTP method"}),
+            ("Resend Verification - Both Methods", "POST", "auth/resend-verification", 200,
+             {'data': {"email": test_email_both, "method": "both"},
+              'description': "Test resending verification with both methods"}),
+        ])
         
         # Test 3a: Resend with method: "link"
-        success, response = self.run_test(
-            "Resend Verification - Link Method",
-            "POST",
-            "auth/resend-verification",
-            200,
-            data={
-                "email": test_email_link,
-                "method": "link"
-            },
-            description="Test resending verification with link method"
-        )
+        success, response = resend_link
         results.append(success)
         
         if success and isinstance(response, dict):
-            if 'link' in response.get('message', '').lower():
-                print(f"   ✅ Link resend successful")
-                print(f"   Message: {response.get('message')}")
+            message = (response.get('message') or '').lower()
+            if 'link' in message:
+                logger.info(f"   ✅ Link resend successful")
+                logger.info(f"   Message: {response.get('message')}")
             else:
-                print(f"   ⚠️ Link resend response: {response}")
+                logger.info(f"   ⚠️ Link resend response: {response}")
         
         # Test 3b: Resend with method: "otp"
-        success, response = self.run_test(
-            "Resend Verification - OTP Method",
-            "POST",
-            "auth/resend-verification",
-            200,
-            data={
-                "email": test_email_otp,
-                "method": "otp"
-            },
-            description="Test resending verification with OTP method"
-        )
+        success, response = resend_otp
         results.append(success)
         
         if success and isinstance(response, dict):
-            if 'code' in response.get('message', '').lower():
-                print(f"   ✅ OTP resend successful")
-                print(f"   Message: {response.get('message')}")
+            message = (response.get('message') or '').lower()
+            if 'code' in message:
+                logger.info(f"   ✅ OTP resend successful")
+                logger.info(f"   Message: {response.get('message')}")
             else:
-                print(f"   ⚠️ OTP resend response: {response}")
+                logger.info(f"   ⚠️ OTP resend response: {response}")
         
         # Test 3c: Resend with method: "both"
-        success, response = self.run_test(
-            "Resend Verification - Both Methods",
-            "POST",
-            "auth/resend-verification",
-            200,
-            data={
-                "email": test_email_both,
-                "method": "both"
-            },
-            description="Test resending verification with both methods"
-        )
+        success, response = resend_both
         results.append(success)
         
         if success and isinstance(response, dict):
-            if 'both' in response.get('message', '').lower() or ('link' in response.get('message', '').lower() and 'code' in response.get('message', '').lower()):
-                print(f"   ✅ Both methods resend successful")
-                print(f"   Message: {response.get('message')}")
+            message = (response.get('message') or '').lower()
+            if 'both' in message or ('link' in message and 'code' in message):
+                logger.info(f"   ✅ Both methods resend successful")
+                logger.info(f"   Message: {response.get('message')}")
             else:
-                print(f"   ⚠️ Both methods resend response: {response}")
+                logger.info(f"   ⚠️ Both methods resend response: {response}")
         
         # Test 4: Verification Status Check
-        print("\n📊 TESTING VERIFICATION STATUS")
-        print("-" * 50)
-        
-        for test_email, method in [(test_email_link, "link"), (test_email_otp, "otp"), (test_email_both, "both")]:
-            success, response = self.run_test(
-                f"Verification Status - {method.title()} User",
-                "GET",
-                f"auth/verification-status/{test_email}",
-                200,
-                description=f"Check verification status for {method} method user"
-            )
+        logger.info("\n📊 TESTING VERIFICATION STATUS")
+        logger.info("-" * 50)
+        
+        test_accounts = [(test_email_link, "link"), (test_email_otp, "otp"), (test_email_both, "both")]
+        # There is no bulk status route, so the three per-email lookups go out as one concurrent batch
+        status_results = self.run_tests_parallel([
+            (f"Verification Status - {method.title()} User", "GET", f"auth/verification-status/{test_email}", 200,
+             {'description': f"Check verification status for {method} method user"})
+            for test_email, method in test_accounts
+        ])
+        for (test_email, method), (success, response) in zip(test_accounts, status_results):
             results.append(success)
             
             if success and isinstance(response, dict):
                 is_verified = response.get('is_verified', True)  # Should be False for new users
                 if not is_verified:
-                    print(f"   ✅ {method.title()} user correctly unverified")
-                    print(f"   Email: {response.get('email')}")
-                    print(f"   Verified: {is_verified}")
+                    logger.info(f"   ✅ {method.title()} user correctly unverified")
+                    logger.info(f"   Email: {response.get('email')}")
+                    logger.info(f"   Verified: {is_verified}")
                     if response.get('verification_expires'):
-                        print(f"   Expires: {response.get('verification_expires')}")
+                        logger.info(f"   Expires: {response.get('verification_expires')}")
                 else:
-                    print(f"   ⚠️ {method.title()} user verification status: {response}")
+                    logger.info(f"   ⚠️ {method.title()} user verification status: {response}")
         
         # Test 5: Login Blocking for Unverified Users
-        print("\n🚫 TESTING LOGIN BLOCKING FOR UNVERIFIED USERS")
-        print("-" * 50)
+        logger.info("\n🚫 TESTING LOGIN BLOCKING FOR UNVERIFIED USERS")
+        logger.info("-" * 50)
         
-        for test_email, method in [(test_email_link, "link"), (test_email_otp, "otp"), (test_email_both, "both")]:
+        for test_email, method in test_accounts:
             success, response = self.run_test(
                 f"Login Block - Unverified {method.title()} User",
                 "POST",
@@ -4253,50 +4204,52 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             results.append(success)
             
             if success and isinstance(response, dict):
-                if 'verify' in response.get('detail', '').lower():
-                    print(f"   ✅ {method.title()} user correctly blocked from login")
-                    print(f"   Error: {response.get('detail')}")
+                # detail can be a validation-error list; only a plain string is inspected
+                detail = response.get('detail')
+                if isinstance(detail, str) and 'verify' in detail.lower():
+                    logger.info(f"   ✅ {method.title()} user correctly blocked from login")
+                    logger.info(f"   Error: {response.get('detail')}")
                 else:
-                    print(f"   ⚠️ {method.title()} user login response: {response}")
+                    logger.info(f"   ⚠️ {method.title()} user login response: {response}")
         
         # Test 6: Database Schema Verification
-        print("\n🗄️ TESTING DATABASE SCHEMA FOR OTP FIELDS")
-        print("-" * 50)
+        logger.info("\n🗄️ TESTING DATABASE SCHEMA FOR OTP FIELDS")
+        logger.info("-" * 50)
         
         # We can't directly test database schema, but we can test that the API accepts OTP-related data
         # This is implicitly tested through the registration and verification tests above
         
-        print("   ✅ Database schema verification completed through API testing")
-        print("   - email_otp_code field: Tested via registration and verification")
-        print("   - email_otp_expires field: Tested via registration and verification")
-        print("   - OTP codes are 6 digits: Tested via OTP generation")
-        print("   - OTP expiry time is 10 minutes: Tested via email service")
+        logger.info("   ✅ Database schema verification completed through API testing")
+        logger.info("   - email_otp_code field: Tested via registration and verification")
+        logger.info("   - email_otp_expires field: Tested via registration and verification")
+        logger.info("   - OTP codes are 6 digits: Tested via OTP generation")
+        logger.info("   - OTP expiry time is 10 minutes: Tested via email service")
         
         # Test 7: Cross-Method Verification Simulation
-        print("\n🔄 TESTING CROSS-METHOD VERIFICATION CONCEPTS")
-        print("-" * 50)
+        logger.info("\n🔄 TESTING CROSS-METHOD VERIFICATION CONCEPTS")
+        logger.info("-" * 50)
         
-        print("   📝 Cross-method verification testing:")
-        print("   - Users registered with 'both' method can verify using either link OR OTP")
-        print("   - Verification via one method should clear both link and OTP data")
-        print("   - Once verified via one method, the other method should be disabled")
-        print("   ✅ Cross-method verification logic implemented in backend")
+        logger.info("   📝 Cross-method verification testing:")
+        logger.info("   - Users registered with 'both' method can verify using either link OR OTP")
+        logger.info("   - Verification via one method should clear both link and OTP data")
+        logger.info("   - Once verified via one method, the other method should be disabled")
+        logger.info("   ✅ Cross-method verification logic implemented in backend")
         
         # Summary
         passed_tests = sum(results)
         total_tests = len(results)
         
-        print(f"\n📊 ENHANCED EMAIL VERIFICATION SYSTEM TEST SUMMARY")
-        print("=" * 70)
-        print(f"Total Tests: {total_tests}")
-        print(f"Passed: {passed_tests}")
-        print(f"Failed: {total_tests - passed_tests}")
-        print(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
+        logger.info(f"\n📊 ENHANCED EMAIL VERIFICATION SYSTEM TEST SUMMARY")
+        logger.info("=" * 70)
+        logger.info(f"Total Tests: {total_tests}")
+        logger.info(f"Passed: {passed_tests}")
+        logger.info(f"Failed: {total_tests - passed_tests}")
+        logger.info(f"Success Rate: {(passed_tests/total_tests)*100:.1f}%")
         
         if passed_tests == total_tests:
-            print("🎉 ALL ENHANCED EMAIL VERIFICATION TESTS PASSED!")
+            logger.info("🎉 ALL ENHANCED EMAIL VERIFICATION TESTS PASSED!")
         else:
-            print("⚠️ Some enhanced email verification tests failed")
+            logger.info("⚠️ Some enhanced email verification tests failed")
         
         return passed_tests == total_tests
 
@@ -4306,7 +4259,7 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         print("=" * 60)
         
         results = []
-        timestamp = datetime.now().strftime('%H%M%S')
+        timestamp = self._unique_suffix()
         test_email = f"verify_test_{timestamp}@example.com"
         test_username = f"verifyuser_{timestamp}"
         test_password = "VerifyPass123!"
@@ -4342,42 +4295,47 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
                 print(f"   ❌ Registration incorrectly returns access_token")
                 results.append(False)
             
-            if response.get('message') and 'verify' in response.get('message', '').lower():
+            message = (response.get('message') or '').lower()
+            if 'verify' in message:
                 print(f"   ✅ Registration message mentions verification")
             else:
                 print(f"   ❌ Registration message doesn't mention verification")
         
+        # Tests 2-6 only need the registration above and don't read each other's responses,
+        # so send them as one concurrent batch and check the results in order
+        (unverified_login_result, status_result, resend_result, resend_missing_result,
+         invalid_token_result) = self.run_tests_parallel([
+            ("Login - Unverified Email (Should Fail)", "POST", "auth/login", 400,
+             {'data': {"email": test_email, "password": test_password},
+              'description': "Test that unverified users cannot login"}),
+            ("Get Verification Status", "GET", f"auth/verification-status/{test_email}", 200,
+             {'description': "Test getting verification status for user"}),
+            ("Resend Verification Email", "POST", "auth/resend-verification", 200,
+             {'data': {"email": test_email},
+              'description': "Test resending verification email for unverified user"}),
+            ("Resend Verification - Non-existent User", "POST", "auth/resend-verification", 404,
+             {'data': {"email": f"nonexistent_{timestamp}@example.com"},
+              'description': "Test resend verification with non-existent user"}),
+            ("Email Verification - Invalid Token", "POST", "auth/verify-email/invalid_token_12345", 400,
+             {'description': "Test email verification with invalid token"}),
+        ])
+        
         # Test 2: Login with Unverified Email - should fail
         print("\n2. TESTING LOGIN WITH UNVERIFIED EMAIL")
-        success, response = self.run_test(
-            "Login - Unverified Email (Should Fail)",
-            "POST",
-            "auth/login",
-            400,  # Should fail with 400
-            data={
-                "email": test_email,
-                "password": test_password
-            },
-            description="Test that unverified users cannot login"
-        )
+        success, response = unverified_login_result
         results.append(success)
         
         if success and isinstance(response, dict):
-            error_detail = response.get('detail', '')
-            if 'verify' in error_detail.lower() or 'verification' in error_detail.lower():
+            error_detail = response.get('detail') or ''
+            detail = error_detail.lower() if isinstance(error_detail, str) else ''
+            if any(marker in detail for marker in _VERIFY_MARKERS):
                 print(f"   ✅ Login correctly blocks unverified user with verification message")
             else:
                 print(f"   ❌ Login error message doesn't mention verification: {error_detail}")
         
         # Test 3: Get Verification Status
         print("\n3. TESTING VERIFICATION STATUS ENDPOINT")
-        success, response = self.run_test(
-            "Get Verification Status",
-            "GET",
-            f"auth/verification-status/{test_email}",
-            200,
-            description="Test getting verification status for user"
-        )
+        success, response = status_result
         results.append(success)
         
         if success and isinstance(response, dict):
@@ -4393,49 +4351,30 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         
         # Test 4: Resend Verification Email
         print("\n4. TESTING RESEND VERIFICATION EMAIL")
-        success, response = self.run_test(
-            "Resend Verification Email",
-            "POST",
-            "auth/resend-verification",
-            200,
-            data={"email": test_email},
-            description="Test resending verification email for unverified user"
-        )
+        success, response = resend_result
         results.append(success)
         
         if success and isinstance(response, dict):
-            if 'sent' in response.get('message', '').lower():
+            message = (response.get('message') or '').lower()
+            if 'sent' in message:
                 print(f"   ✅ Resend verification returns success message")
             else:
                 print(f"   ❌ Resend verification message unclear: {response.get('message')}")
         
         # Test 5: Resend Verification for Non-existent User
         print("\n5. TESTING RESEND VERIFICATION FOR NON-EXISTENT USER")
-        success, response = self.run_test(
-            "Resend Verification - Non-existent User",
-            "POST",
-            "auth/resend-verification",
-            404,  # Should fail with 404
-            data={"email": f"nonexistent_{timestamp}@example.com"},
-            description="Test resend verification with non-existent user"
-        )
+        success, response = resend_missing_result
         results.append(success)
         
         # Test 6: Email Verification with Invalid Token
         print("\n6. TESTING EMAIL VERIFICATION WITH INVALID TOKEN")
-        invalid_token = "invalid_token_12345"
-        success, response = self.run_test(
-            "Email Verification - Invalid Token",
-            "POST",
-            f"auth/verify-email/{invalid_token}",
-            400,  # Should fail with 400
-            description="Test email verification with invalid token"
-        )
+        success, response = invalid_token_result
         results.append(success)
         
         if success and isinstance(response, dict):
-            error_detail = response.get('detail', '')
-            if 'invalid' in error_detail.lower() or 'expired' in error_detail.lower():
+            error_detail = response.get('detail') or ''
+            detail = error_detail.lower() if isinstance(error_detail, str) else ''
+            if any(marker in detail for marker in _INVALID_TOKEN_MARKERS):
                 print(f"   ✅ Invalid token correctly rejected with appropriate message")
             else:
                 print(f"   ❌ Invalid token error message unclear: {error_detail}")
@@ -4443,10 +4382,10 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         # Test 6.5: Email Verification with Valid Token (using real token from database)
         print("\n6.5. TESTING EMAIL VERIFICATION WITH VALID TOKEN")
         # Get a real verification token from the database
+        pending_email = None  # a registered, still unverified user Test 7 can reuse
         try:
-            import requests
             # First, let's get a verification token by registering a new user
-            timestamp_token = datetime.now().strftime('%H%M%S') + "token"
+            timestamp_token = self._unique_suffix() + "token"
             token_test_email = f"token_test_{timestamp_token}@example.com"
             token_test_username = f"tokenuser_{timestamp_token}"
             
@@ -4466,6 +4405,7 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             )
             
             if reg_success:
+                pending_email = token_test_email
                 # Now we need to get the token from database (simulated)
                 # In a real test, we would extract the token from the verification email
                 # For now, let's test with a known token from the database
@@ -4481,7 +4421,8 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
                 results.append(success)
                 
                 if success and isinstance(response, dict):
-                    if 'verified successfully' in response.get('message', '').lower():
+                    message = (response.get('message') or '').lower()
+                    if 'verified successfully' in message:
                         print(f"   ✅ Valid token correctly verified user")
                         
                         # Now test that the user can login
@@ -4514,25 +4455,30 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         
         # Test 7: Create another user to test with valid token (simulate verification)
         print("\n7. TESTING COMPLETE VERIFICATION FLOW")
-        timestamp2 = datetime.now().strftime('%H%M%S') + "2"
-        test_email2 = f"verify_complete_{timestamp2}@example.com"
-        test_username2 = f"verifycomplete_{timestamp2}"
-        
-        # Register second user
-        success, reg_response = self.run_test(
-            "Registration - For Complete Flow Test",
-            "POST",
-            "auth/register",
-            200,
-            data={
-                "email": test_email2,
-                "username": test_username2,
-                "password": test_password,
-                "full_name": "Complete Verify Test User"
-            },
-            description="Register user for complete verification flow test"
-        )
-        results.append(success)
+        if pending_email:
+            # The token-test user is registered and still unverified, which is all this flow needs
+            test_email2 = pending_email
+            print(f"   ♻️ Reusing unverified user {test_email2} from the token test")
+        else:
+            timestamp2 = self._unique_suffix()
+            test_email2 = f"verify_complete_{timestamp2}@example.com"
+            test_username2 = f"verifycomplete_{timestamp2}"
+            
+            # Register second user
+            success, reg_response = self.run_test(
+                "Registration - For Complete Flow Test",
+                "POST",
+                "auth/register",
+                200,
+                data={
+                    "email": test_email2,
+                    "username": test_username2,
+                    "password": test_password,
+                    "full_name": "Complete Verify Test User"
+                },
+                description="Register user for complete verification flow test"
+            )
+            results.append(success)
         
         # Note: In a real scenario, we would need to extract the verification token from the database
         # or email to test the actual verification endpoint. For this test, we'll simulate the process.
@@ -4540,35 +4486,33 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         print(f"   📧 User would click verification link with token")
         print(f"   📧 After verification, user should be able to login")
         
+        # Tests 8 and 9 expect superadmin to be verified, which Test 6.5 may have just done with
+        # its known token, so they run only now; they are independent of each other
+        resend_verified_result, verified_status_result = self.run_tests_parallel([
+            ("Resend Verification - Already Verified User", "POST", "auth/resend-verification", 400,
+             {'data': {"email": "superadmin@marketmind.com"},
+              'description': "Test resend verification for already verified user"}),
+            ("Verification Status - Verified User", "GET", "auth/verification-status/superadmin@marketmind.com", 200,
+             {'description': "Test verification status for already verified user"}),
+        ])
+        
         # Test 8: Test Already Verified User Resend (should fail)
         print("\n8. TESTING RESEND FOR ALREADY VERIFIED USER")
-        # First, let's try with a user that might already be verified (superadmin)
-        success, response = self.run_test(
-            "Resend Verification - Already Verified User",
-            "POST",
-            "auth/resend-verification",
-            400,  # Should fail with 400
-            data={"email": "superadmin@marketmind.com"},
-            description="Test resend verification for already verified user"
-        )
+        # Uses a user that is already verified (superadmin)
+        success, response = resend_verified_result
         results.append(success)
         
         if success and isinstance(response, dict):
-            error_detail = response.get('detail', '')
-            if 'already verified' in error_detail.lower():
+            error_detail = response.get('detail') or ''
+            detail = error_detail.lower() if isinstance(error_detail, str) else ''
+            if 'already verified' in detail:
                 print(f"   ✅ Already verified user correctly rejected")
             else:
                 print(f"   ❌ Already verified error message unclear: {error_detail}")
         
         # Test 9: Test verification status for verified user
         print("\n9. TESTING VERIFICATION STATUS FOR VERIFIED USER")
-        success, response = self.run_test(
-            "Verification Status - Verified User",
-            "GET",
-            "auth/verification-status/superadmin@marketmind.com",
-            200,
-            description="Test verification status for already verified user"
-        )
+        success, response = verified_status_result
         results.append(success)
         
         if success and isinstance(response, dict):
@@ -4612,10 +4556,9 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             print(f"   Tool found: {response.get('name', 'Unknown')}")
             
             # Check SEO fields
-            seo_fields = ['seo_title', 'seo_description', 'seo_keywords']
             seo_present = {}
             
-            for field in seo_fields:
+            for field in _SEO_META_FIELDS:
                 value = response.get(field)
                 if value:
                     seo_present[field] = True
@@ -4688,10 +4631,9 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             print(f"   Blog found: {response.get('title', 'Unknown')}")
             
             # Check SEO fields including JSON-LD
-            seo_fields = ['seo_title', 'seo_description', 'seo_keywords', 'json_ld']
             seo_present = {}
             
-            for field in seo_fields:
+            for field in _SEO_FIELDS_WITH_JSON_LD:
                 value = response.get(field)
                 if value:
                     seo_present[field] = True
@@ -4765,14 +4707,16 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         # Test 3: Test other tool and blog endpoints for SEO data
         print("\n3. TESTING OTHER TOOL AND BLOG ENDPOINTS")
         
+        # The two list reads are independent, so fetch them concurrently and check them in order
+        tools_result, blogs_result = self.run_tests_parallel([
+            ("Get Multiple Tools for SEO Validation", "GET", "tools?limit=3", 200,
+             {'description': "Get multiple tools to validate SEO data consistency"}),
+            ("Get Multiple Blogs for SEO Validation", "GET", "blogs?limit=3", 200,
+             {'description': "Get multiple blogs to validate SEO data consistency"}),
+        ])
+        
         # Test multiple tools
-        success, tools_response = self.run_test(
-            "Get Multiple Tools for SEO Validation",
-            "GET",
-            "tools?limit=3",
-            200,
-            description="Get multiple tools to validate SEO data consistency"
-        )
+        success, tools_response = tools_result
         
         if success and isinstance(tools_response, list):
             print(f"   Found {len(tools_response)} tools to test")
@@ -4796,13 +4740,7 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
                 results.append(False)
         
         # Test multiple blogs
-        success, blogs_response = self.run_test(
-            "Get Multiple Blogs for SEO Validation",
-            "GET",
-            "blogs?limit=3",
-            200,
-            description="Get multiple blogs to validate SEO data consistency"
-        )
+        success, blogs_response = blogs_result
         
         if success and isinstance(blogs_response, list):
             print(f"   Found {len(blogs_response)} blogs to test")
@@ -4931,18 +4869,20 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         )
         
         if success and isinstance(sitemap_response, str):
-            # Count URLs in sitemap
-            url_count = sitemap_response.count('<url>')
-            tool_urls = sitemap_response.count('/tools/')
-            blog_urls = sitemap_response.count('/blogs/')
+            # Count URLs and their tool/blog paths in one streaming parse
+            try:
+                _, url_count, first_url_children, token_counts = walk_sitemap(sitemap_response)
+            except ElementTree.ParseError:
+                url_count, first_url_children, token_counts = 0, set(), Counter()
+            tool_urls = token_counts['/tools/']
+            blog_urls = token_counts['/blogs/']
             
             print(f"   Total URLs in sitemap: {url_count}")
             print(f"   Tool URLs: {tool_urls}")
             print(f"   Blog URLs: {blog_urls}")
             
             # Check for proper XML structure
-            required_elements = ['<loc>', '<lastmod>', '<changefreq>', '<priority>']
-            missing_elements = [elem for elem in required_elements if elem not in sitemap_response]
+            missing_elements = [f"<{child}>" for child in _SITEMAP_URL_CHILDREN if child not in first_url_children]
             
             if not missing_elements and tool_urls > 0 and blog_urls > 0:
                 print(f"   ✅ Sitemap properly includes tools and blogs with SEO structure")
@@ -5595,8 +5535,6 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             return False
         
         # Create a simple test image file in memory
-        import io
-        
         if Image is None:
             # Create a simple text file as fallback
             img_bytes = io.BytesIO(b"fake image content for testing")
@@ -5614,13 +5552,14 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         # Test image upload
         try:
             url = f"{self.base_url}/blogs/upload-image"
-            headers = {'Authorization': f'Bearer {self.token}'}
+            # Drop the session's JSON content type so requests sets the multipart boundary
+            headers = {**self._auth_headers, 'Content-Type': None}
             files = {'file': (filename, img_bytes, content_type)}
             
             print(f"\n🔍 Testing Image Upload...")
             print(f"   URL: {url}")
             
-            response = requests.post(url, files=files, headers=headers, timeout=30)
+            response = self.session.post(url, files=files, headers=headers, timeout=30)
             
             success = response.status_code == 200
             if success:
@@ -5913,74 +5852,74 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         
         return all(results)
 
+    @buffered_output
     def test_seo_sitemap_generation(self):
         """Test SEO sitemap.xml generation endpoint"""
-        print("\n🗺️ SEO SITEMAP TESTING")
-        print("-" * 50)
+        logger.info("\n🗺️ SEO SITEMAP TESTING")
+        logger.info("-" * 50)
         
         results = []
         
         # Test sitemap.xml endpoint
-        success, response = self.run_test(
+        success, response, response_time = self.cached_get(
             "Sitemap XML Generation",
-            "GET",
             "sitemap.xml",
-            200,
             description="Test GET /api/sitemap.xml endpoint for SEO sitemap generation"
         )
-        results.append(success)
+        self.add_result(results, success)
         
         if success and isinstance(response, str):
-            print(f"   Sitemap content length: {len(response)} characters")
+            logger.info(f"   Sitemap content length: {len(response)} characters")
+            logger.info(f"   Sitemap generation time: {response_time:.3f} seconds")
             
             # Verify XML structure
             if response.startswith('<?xml version="1.0" encoding="UTF-8"?>'):
-                print("   ✅ Valid XML header found")
+                logger.info("   ✅ Valid XML header found")
             else:
-                print("   ❌ Invalid XML header")
-                results.append(False)
+                logger.info("   ❌ Invalid XML header")
+                self.add_result(results, False)
+            
+            # Validate the structure with one streaming parse instead of substring checks
+            try:
+                root_tag, url_count, first_url_children, token_counts = walk_sitemap(response)
+            except ElementTree.ParseError as e:
+                logger.info(f"   ❌ Sitemap is not well-formed XML: {e}")
+                self.add_result(results, False)
+                return all(results)
             
             # Check for required sitemap elements
-            required_elements = [
-                '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-                '<url>',
-                '<loc>',
-                '<lastmod>',
-                '<changefreq>',
-                '<priority>'
-            ]
-            
-            for element in required_elements:
-                if element in response:
-                    print(f"   ✅ Found required element: {element}")
+            required_elements = [('<urlset>', root_tag == 'urlset'), ('<url>', url_count > 0)]
+            required_elements += [(f"<{child}>", child in first_url_children) for child in _SITEMAP_URL_CHILDREN]
+            for element, present in required_elements:
+                if present:
+                    logger.info(f"   ✅ Found required element: {element}")
                 else:
-                    print(f"   ❌ Missing required element: {element}")
-                    results.append(False)
+                    logger.info(f"   ❌ Missing required element: {element}")
+                    self.add_result(results, False)
             
             # Check for main pages
-            main_pages = ['/tools', '/blogs', '/compare']
-            for page in main_pages:
-                if page in response:
-                    print(f"   ✅ Found main page: {page}")
+            for page in _SITEMAP_MAIN_PAGES:
+                if token_counts[page] or token_counts[page + '/']:
+                    logger.info(f"   ✅ Found main page: {page}")
                 else:
-                    print(f"   ⚠️ Main page not found: {page}")
+                    logger.info(f"   ⚠️ Main page not found: {page}")
             
             # Count URLs in sitemap
-            url_count = response.count('<url>')
-            print(f"   Total URLs in sitemap: {url_count}")
+            logger.info(f"   Total URLs in sitemap: {url_count}")
             
             if url_count > 0:
-                print("   ✅ Sitemap contains URLs")
+                logger.info("   ✅ Sitemap contains URLs")
             else:
-                print("   ❌ Sitemap contains no URLs")
-                results.append(False)
+                logger.info("   ❌ Sitemap contains no URLs")
+                self.add_result(results, False)
         
         return all(results)
 
+    @buffered_output
     def test_seo_robots_txt(self):
         """Test SEO robots.txt generation endpoint"""
-        print("\n🤖 SEO ROBOTS.TXT TESTING")
-        print("-" * 50)
+        logger.info("\n🤖 SEO ROBOTS.TXT TESTING")
+        logger.info("-" * 50)
         
         results = []
         
@@ -5995,41 +5934,29 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         results.append(success)
         
         if success and isinstance(response, str):
-            print(f"   Robots.txt content length: {len(response)} characters")
+            logger.info(f"   Robots.txt content length: {len(response)} characters")
             
             # Check for required robots.txt directives
-            required_directives = [
-                'User-agent: *',
-                'Allow: /',
-                'Disallow: /admin/',
-                'Disallow: /dashboard/',
-                'Disallow: /api/',
-                'Allow: /api/blogs/',
-                'Allow: /api/tools/',
-                'Sitemap:',
-                'Crawl-delay:'
-            ]
-            
-            for directive in required_directives:
+            for directive in _ROBOTS_REQUIRED_DIRECTIVES:
                 if directive in response:
-                    print(f"   ✅ Found required directive: {directive}")
+                    logger.info(f"   ✅ Found required directive: {directive}")
                 else:
-                    print(f"   ❌ Missing required directive: {directive}")
+                    logger.info(f"   ❌ Missing required directive: {directive}")
                     results.append(False)
             
             # Check sitemap reference
             if 'sitemap.xml' in response.lower():
-                print("   ✅ Sitemap reference found in robots.txt")
+                logger.info("   ✅ Sitemap reference found in robots.txt")
             else:
-                print("   ❌ Sitemap reference missing from robots.txt")
+                logger.info("   ❌ Sitemap reference missing from robots.txt")
                 results.append(False)
             
             # Check admin area protection
-            admin_protected = all(area in response for area in ['/admin/', '/dashboard/', '/superadmin/'])
+            admin_protected = all(area in response for area in _ROBOTS_PROTECTED_AREAS)
             if admin_protected:
-                print("   ✅ Admin areas properly protected")
+                logger.info("   ✅ Admin areas properly protected")
             else:
-                print("   ❌ Admin areas not properly protected")
+                logger.info("   ❌ Admin areas not properly protected")
                 results.append(False)
         
         return all(results)
@@ -6053,10 +5980,9 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         
         if success and isinstance(blogs_response, list) and len(blogs_response) > 0:
             blog = blogs_response[0]
-            seo_fields = ['seo_title', 'seo_description', 'seo_keywords', 'json_ld']
             
             print(f"   Testing SEO fields in blog: {blog.get('title', 'Unknown')}")
-            for field in seo_fields:
+            for field in _SEO_FIELDS_WITH_JSON_LD:
                 if field in blog and blog[field] is not None:
                     print(f"   ✅ Blog has {field}: {str(blog[field])[:50]}...")
                 else:
@@ -6098,10 +6024,9 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         
         if success and isinstance(tools_response, list) and len(tools_response) > 0:
             tool = tools_response[0]
-            seo_fields = ['seo_title', 'seo_description', 'seo_keywords']
             
             print(f"   Testing SEO fields in tool: {tool.get('name', 'Unknown')}")
-            for field in seo_fields:
+            for field in _SEO_META_FIELDS:
                 if field in tool and tool[field] is not None:
                     print(f"   ✅ Tool has {field}: {str(tool[field])[:50]}...")
                 else:
@@ -6120,7 +6045,7 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
                 results.append(success)
                 
                 if success and isinstance(tool_detail, dict):
-                    for field in seo_fields:
+                    for field in _SEO_META_FIELDS:
                         if field in tool_detail and tool_detail[field] is not None:
                             print(f"   ✅ Tool detail has {field}")
                         else:
@@ -6128,72 +6053,51 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         
         return all(results)
 
+    @buffered_output
     def test_seo_performance_impact(self):
         """Test performance impact of SEO endpoints"""
-        print("\n⚡ SEO PERFORMANCE IMPACT TESTING")
-        print("-" * 50)
+        logger.info("\n⚡ SEO PERFORMANCE IMPACT TESTING")
+        logger.info("-" * 50)
         
         results = []
-        import time
         
-        # Test sitemap generation performance
-        start_time = time.time()
-        success, response = self.run_test(
-            "Sitemap Performance Test",
-            "GET",
-            "sitemap.xml",
-            200,
-            description="Measure sitemap generation response time"
-        )
-        sitemap_time = time.time() - start_time
-        results.append(success)
+        # The three probes are independent, so time each one to its first byte within one
+        # concurrent batch; leaving the bodies unread keeps transfer time out of the figures
+        probes = [
+            ("Sitemap Performance Test", "sitemap.xml", "Measure sitemap generation response time"),
+            ("Robots.txt Performance Test", "robots.txt", "Measure robots.txt generation response time"),
+            ("Baseline API Performance", "blogs?limit=10", "Measure baseline API performance for comparison"),
+        ]
+        (sitemap_ok, sitemap_time), (robots_ok, robots_time), (baseline_ok, baseline_time) = \
+            thread_map(lambda probe: self.time_to_first_byte(*probe), probes, len(probes))
+        results.extend([sitemap_ok, robots_ok, baseline_ok])
         
-        print(f"   Sitemap generation time: {sitemap_time:.3f} seconds")
+        logger.info(f"   Sitemap generation time: {sitemap_time:.3f} seconds")
         if sitemap_time < 2.0:
-            print("   ✅ Sitemap generation is fast (< 2 seconds)")
+            logger.info("   ✅ Sitemap generation is fast (< 2 seconds)")
         elif sitemap_time < 5.0:
-            print("   ⚠️ Sitemap generation is acceptable (< 5 seconds)")
+            logger.info("   ⚠️ Sitemap generation is acceptable (< 5 seconds)")
         else:
-            print("   ❌ Sitemap generation is slow (> 5 seconds)")
+            logger.info("   ❌ Sitemap generation is slow (> 5 seconds)")
             results.append(False)
         
-        # Test robots.txt performance
-        start_time = time.time()
-        success, response = self.run_test(
-            "Robots.txt Performance Test",
-            "GET",
-            "robots.txt",
-            200,
-            description="Measure robots.txt generation response time"
-        )
-        robots_time = time.time() - start_time
-        results.append(success)
-        
-        print(f"   Robots.txt generation time: {robots_time:.3f} seconds")
+        logger.info(f"   Robots.txt generation time: {robots_time:.3f} seconds")
         if robots_time < 1.0:
-            print("   ✅ Robots.txt generation is fast (< 1 second)")
+            logger.info("   ✅ Robots.txt generation is fast (< 1 second)")
         else:
-            print("   ⚠️ Robots.txt generation could be faster")
-        
-        # Test existing API performance (baseline)
-        start_time = time.time()
-        success, response = self.run_test(
-            "Baseline API Performance",
-            "GET",
-            "blogs?limit=10",
-            200,
-            description="Measure baseline API performance for comparison"
-        )
-        baseline_time = time.time() - start_time
-        results.append(success)
+            logger.info("   ⚠️ Robots.txt generation could be faster")
         
-        print(f"   Baseline API response time: {baseline_time:.3f} seconds")
+        logger.info(f"   Baseline API response time: {baseline_time:.3f} seconds")
         
         # Compare performance
         if sitemap_time <= baseline_time * 2:
-            print("   ✅ SEO endpoints don't significantly impact performance")
+            logger.info("   ✅ SEO endpoints don't significantly impact performance")
         else:
-            print("   ⚠️ SEO endpoints may impact performance")
+            logger.info("   ⚠️ SEO endpoints may impact performance")
+        
+        # Informational only: how sitemap throughput scales with concurrent clients
+        if self.load_profile:
+            self.measure_load("Sitemap under concurrent load", "sitemap.xml")
         
         return all(results)
 
@@ -6216,8 +6120,9 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
             success, user_role = self.test_login("user@marketmind.com", "password123")
             if not success:
                 # Create a test user if needed
-                self.test_register()
-                success, user_role = self.test_login("test_user_" + datetime.now().strftime('%H%M%S') + "@test.com", "TestPass123!")
+                registered, test_email = self.test_register()
+                if registered:
+                    success, user_role = self.test_login(test_email, "TestPass123!")
         
         if success:
             print(f"✅ Authenticated as: {user_role}")
@@ -6228,8 +6133,10 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
         seo_success = self.test_seo_json_ld_comprehensive()
         
         # Run additional SEO-related tests
-        sitemap_success = self.test_seo_sitemap_generation()
-        robots_success = self.test_seo_robots_txt_generation()
+        sitemap_success, robots_success = self.run_methods_parallel(
+            self.test_seo_sitemap_generation,
+            self.test_seo_robots_txt_generation,
+        )
         performance_success = self.test_seo_performance_impact()
         
         # Run superadmin SEO tests if authenticated
@@ -6665,25 +6572,33 @@ Test Bulk Tool 2 {timestamp},Another test tool created via bulk upload,Another t
                 print(f"   Template headers: {response['headers']}")
         
         # Test 2: Create sample CSV content
-        import io
-        csv_content = """name,description,short_description,url,logo_url,pricing_type,features,pros,cons,is_active
-Review Test Tool 1,This is a comprehensive test tool for review request testing,Test tool for automation,https://example.com/tool1,,free,Feature 1;Feature 2,Pro 1;Pro 2,Con 1,true
-Review Test Tool 2,Another test tool for bulk upload verification,Second test tool,https://example.com/tool2,,freemium,Feature A;Feature B;Feature C,Pro A;Pro B,Con A;Con B,true"""
+        csv_content = csv_bytes(
+            ('name', 'description', 'short_description', 'url', 'logo_url', 'pricing_type', 'features', 'pros',
+             'cons', 'is_active'),
+            [
+                ("Review Test Tool 1", "This is a comprehensive test tool for review request testing",
+                 "Test tool for automation", "https://example.com/tool1", "", "free",
+                 "Feature 1;Feature 2", "Pro 1;Pro 2", "Con 1", "true"),
+                ("Review Test Tool 2", "Another test tool for bulk upload verification", "Second test tool",
+                 "https://example.com/tool2", "", "freemium",
+                 "Feature A;Feature B;Feature C", "Pro A;Pro B", "Con A;Con B", "true"),
+            ]
+        )
         
         # Create a file-like object
-        csv_file = io.BytesIO(csv_content.encode('utf-8'))
+        csv_file = io.BytesIO(csv_content)
         
         # Test 3: Bulk upload with sample CSV
         try:
-            import requests
             url = f"{self.base_url}/superadmin/tools/bulk-upload"
-            headers = {'Authorization': f'Bearer {self.token}'}
+            # Drop the session's JSON content type so requests sets the multipart boundary
+            headers = {**self._auth_headers, 'Content-Type': None}
             files = {'file': ('test_tools.csv', csv_file, 'text/csv')}
             
             print(f"\n🔍 Testing Bulk Upload...")
             print(f"   URL: {url}")
             
-            response = requests.post(url, files=files, headers=headers, timeout=30)
+            response = self.session.post(url, files=files, headers=headers, timeout=30)
             
             success = response.status_code == 200
             if success:
@@ -6873,7 +6788,17 @@ def main():
     print("📋 Features: Internal Links, SEO Score Calculator, Page Analysis, Authentication")
     print("=" * 80)
     
-    tester = MarketMindAPITester()
+    # BTOOLS_FAIL_FAST=1 turns fail-fast on for CI runs without changing the command line
+    fail_fast = '--fail-fast' in sys.argv or os.getenv('BTOOLS_FAIL_FAST') == '1'
+    tester = MarketMindAPITester(fail_fast=fail_fast, load_profile='--load-profile' in sys.argv)
+    try:
+        return run_new_seo_features(tester)
+    finally:
+        tester.close()
+
+
+def run_new_seo_features(tester):
+    tester.warm_up()
     
     # Test basic connectivity first
     print("\n🔍 BASIC CONNECTIVITY TEST")
@@ -6895,7 +6820,16 @@ def main():
     
     # Run the NEW SEO features comprehensive test
     print("\n🔍 NEW SEO FEATURES COMPREHENSIVE TESTING")
-    new_seo_success = tester.test_new_seo_features_comprehensive()
+    try:
+        new_seo_success = tester.test_new_seo_features_comprehensive()
+    except FailFastStop as e:
+        print(f"\n⏹️ Fail-fast: stopping after the first failure ({e})")
+        new_seo_success = False
+    
+    # Opt-in: SEO file latency plus the concurrency ramp, which puts sustained load on the server
+    if tester.load_profile:
+        print("\n⚡ SEO PERFORMANCE AND LOAD PROFILE")
+        tester.test_seo_performance_impact()
     
     # Print comprehensive results
     print("\n" + "=" * 80)
@@ -8394,11 +8328,10 @@ Review Test Tool 2,Another test tool for bulk upload verification,Second test to
         
         if not success:
             print("❌ Failed to authenticate - creating new user")
-            self.test_register()
-            # Try to login with a test user
-            timestamp = datetime.now().strftime('%H%M%S')
-            test_email = f"test_user_{timestamp}@test.com"
-            success, role = self.test_login(test_email, "TestPass123!")
+            registered, test_email = self.test_register()
+            # Try to login with the test user just registered
+            if registered:
+                success, role = self.test_login(test_email, "TestPass123!")
         
         if success:
             print(f"✅ Authenticated as {role}")
@@ -8476,6 +8409,4 @@ Review Test Tool 2,Another test tool for bulk upload verification,Second test to
         return self.run_comprehensive_seo_blog_testing()
 
 if __name__ == "__main__":
-    tester = MarketMindAPITester()
-    tester.run_comprehensive_tests()
-    tester.print_test_summary()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file